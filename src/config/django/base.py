@@ -105,6 +105,14 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 AUTH_USER_MODEL = 'users.BaseUser'
+
+# `ProfileModelBackend` loads the user and its profile in one query per request.
+# `ModelBackend` stays listed so sessions created before it keep working.
+AUTHENTICATION_BACKENDS = [
+    'ticketing_system.authentication.backends.ProfileModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
 # Internationalization
 # https://docs.djangoproject.com/en/3.0/topics/i18n/
 
@@ -135,6 +143,10 @@ MEDIA_URL = '/media/'
 
 APP_DOMAIN = env("APP_DOMAIN", default="http://localhost:8000")
 
+# Identifies the deployed release. Part of the ETags of conditional GETs,
+# so cached pages are re-rendered after templates change.
+APP_RELEASE = env("APP_RELEASE", default="")
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 from config.settings.rest_framework import *  # noqa
 from config.settings.cors import *  # noqa
@@ -142,3 +154,5 @@ from config.settings.jwt import *  # noqa
 from config.settings.swagger import *  # noqa
 from config.settings.logger import *  # noqa
 from config.settings.email_sending import *  # noqa
+from config.settings.cache import *  # noqa
+from config.settings.tickets import *  # noqa
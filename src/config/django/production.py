@@ -0,0 +1,25 @@
+from .base import *  # noqa
+
+
+DEBUG = False
+
+# Shared cache for all web and worker processes. Besides sessions it backs
+# the ticket count and staff roster caches, which must be shared to be
+# invalidated consistently across processes.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": env("REDIS_URL", default="redis://localhost:6379/0"),
+        "KEY_PREFIX": env("CACHE_KEY_PREFIX", default="ticketing_system"),
+    }
+}
+
+# Sessions are read from the cache and only written through to the database,
+# so an authenticated request no longer reads the session table.
+# `django.contrib.sessions.backends.signed_cookies` removes the writes as
+# well, at the price of sessions that cannot be revoked server-side.
+SESSION_ENGINE = env("SESSION_ENGINE", default="django.contrib.sessions.backends.cached_db")
+SESSION_CACHE_ALIAS = "default"
+
+# Flash messages travel in a signed cookie and never touch the session.
+MESSAGE_STORAGE = "django.contrib.messages.storage.cookie.CookieStorage"
@@ -0,0 +1,21 @@
+from config.env import env
+
+
+# Cached global ticket status counts (admin dashboard header), in seconds.
+# Entries are also invalidated by the ticket services on every status change.
+TICKET_COUNTS_CACHE_TIMEOUT = env.int("TICKET_COUNTS_CACHE_TIMEOUT", default=300)
+
+# Single-flight recomputation of missing cache entries:
+# how long the recomputation lock is held at most, and how long
+# concurrent readers wait for the value before computing it themselves.
+CACHE_SINGLE_FLIGHT_LOCK_TIMEOUT = env.int("CACHE_SINGLE_FLIGHT_LOCK_TIMEOUT", default=10)
+CACHE_SINGLE_FLIGHT_WAIT = env.float("CACHE_SINGLE_FLIGHT_WAIT", default=2.0)
+
+# Cached staff roster used by the ticket assignment form, in seconds.
+# Entries are also invalidated whenever a profile changes.
+STAFF_ROSTER_CACHE_TIMEOUT = env.int("STAFF_ROSTER_CACHE_TIMEOUT", default=3600)
+
+# Cached HTML fragments of ticket rows and detail bodies, in seconds.
+# Keys include the ticket's `updated_at`, so ticket changes never serve stale
+# fragments; the timeout only bounds staleness of related data (e.g. emails).
+TICKET_FRAGMENT_CACHE_TIMEOUT = env.int("TICKET_FRAGMENT_CACHE_TIMEOUT", default=3600)
@@ -13,3 +13,25 @@ DEFAULT_REGISTRATION_EMAIL_JWT_MAX_AGE = timedelta(minutes=30)
 
 
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
+
+# Outbox worker (`manage.py send_queued_emails`): how many `READY` emails
+# a worker claims per batch, and how long it sleeps when the queue is empty.
+EMAIL_OUTBOX_BATCH_SIZE = env.int("EMAIL_OUTBOX_BATCH_SIZE", default=100)
+EMAIL_OUTBOX_POLL_INTERVAL = env.float("EMAIL_OUTBOX_POLL_INTERVAL", default=5.0)
+
+# Claimed emails stay `SENDING` for at most this many seconds; after that a
+# worker died mid-send and the emails are claimed again.
+EMAIL_SENDING_LEASE = env.int("EMAIL_SENDING_LEASE", default=600)
+
+# Failed emails are retried with exponential backoff and jitter:
+# the n-th retry waits between half and all of
+# min(EMAIL_RETRY_BASE_DELAY * 2 ** (n - 1), EMAIL_RETRY_MAX_DELAY) seconds.
+# After EMAIL_RETRY_MAX_ATTEMPTS failed attempts an email is dead-lettered.
+EMAIL_RETRY_MAX_ATTEMPTS = env.int("EMAIL_RETRY_MAX_ATTEMPTS", default=6)
+EMAIL_RETRY_BASE_DELAY = env.int("EMAIL_RETRY_BASE_DELAY", default=60)
+EMAIL_RETRY_MAX_DELAY = env.int("EMAIL_RETRY_MAX_DELAY", default=3600)
+
+# Registration emails carry a signed, timestamped token (django.core.signing)
+# scoped to this purpose. Issuing one writes nothing to the database.
+DEFAULT_REGISTRATION_EMAIL_TOKEN_PURPOSE = "email-verification"
+DEFAULT_REGISTRATION_EMAIL_TOKEN_MAX_AGE = timedelta(minutes=30)
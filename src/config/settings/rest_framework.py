@@ -6,6 +6,6 @@ REST_FRAMEWORK = {
         'django_filters.rest_framework.DjangoFilterBackend',
     ),
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "ticketing_system.authentication.backends.ProfileJWTAuthentication",
     ),
 }
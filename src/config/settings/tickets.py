@@ -0,0 +1,39 @@
+import enum
+
+from config.env import env, env_to_enum
+
+
+class AutoAssignmentStrategy(enum.Enum):
+    DISABLED = ""
+    LEAST_LOADED = "least_loaded"
+    ROUND_ROBIN = "round_robin"
+    PRIORITY_AWARE = "priority_aware"
+
+
+# Strategy `create_ticket` uses to assign new tickets to a staff member:
+# "least_loaded", "round_robin" or "priority_aware". Empty disables
+# auto-assignment, new tickets then stay PENDING until an admin assigns them.
+# An unknown name fails at startup instead of in every ticket creation.
+TICKET_AUTO_ASSIGNMENT_STRATEGY = env_to_enum(
+    AutoAssignmentStrategy, env.str("TICKET_AUTO_ASSIGNMENT_STRATEGY", default="")
+).value
+
+# How long the cached staff workload heap is used before it is reseeded
+# from the ticket counters, in seconds. Bounds the drift caused by tickets
+# being closed or reassigned outside the auto-assignment engine.
+TICKET_AUTO_ASSIGNMENT_CACHE_TIMEOUT = env.int("TICKET_AUTO_ASSIGNMENT_CACHE_TIMEOUT", default=300)
+
+# How long a staff member may hold a ticket claimed from the work queue
+# without accepting it, in seconds. Afterwards the ticket returns to the
+# queue and the next claim may hand it to someone else.
+TICKET_CLAIM_LEASE_SECONDS = env.int("TICKET_CLAIM_LEASE_SECONDS", default=900)
+
+# How old a change must be before the change feed returns it, in seconds.
+# `updated_at` is set before the writing transaction commits, so a change
+# committed late can carry a timestamp older than a cursor already handed
+# out; holding back the most recent changes keeps the feed from skipping it.
+TICKET_CHANGES_SETTLE_SECONDS = env.int("TICKET_CHANGES_SETTLE_SECONDS", default=5)
+
+# Rows fetched from the database per round trip by the streaming ticket
+# export (`ticket.exports`). Bounds the export's memory use.
+TICKET_EXPORT_CHUNK_SIZE = env.int("TICKET_EXPORT_CHUNK_SIZE", default=2000)
@@ -8,6 +8,7 @@ urlpatterns = [
     path(route='admin/', view=admin.site.urls),
     path(route='', view=include(('ticketing_system.authentication.urls', 'auth'))),
     path(route='tickets/', view=include(('ticketing_system.ticket.urls', 'tickets'))),
+    path(route='api/', view=include(('ticketing_system.api.urls', 'api'))),
 ]
 
 
@@ -5,6 +5,7 @@ from datetime import datetime
 from typing import Generator
 
 import pytest
+from django.core.cache import cache
 from django.test import Client
 
 
@@ -19,6 +20,21 @@ def client() -> 'Client':
     return Client()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache() -> Generator[None, None, None]:
+
+    """
+    Fixture for isolating tests from each other's cached values.
+
+    The local-memory cache outlives the per-test database transaction,
+    so it is cleared before and after every test.
+    """
+
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture(autouse=True)
 def time_tracker() -> Generator[None, None, None]:
 
@@ -0,0 +1,50 @@
+from django.core.exceptions import PermissionDenied
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.http import Http404
+from rest_framework import exceptions
+from rest_framework.response import Response
+from rest_framework.serializers import as_serializer_error
+from rest_framework.views import exception_handler
+
+from ticketing_system.core.exceptions import ApplicationError
+
+
+def drf_default_with_modifications_exception_handler(exc, ctx):
+
+    """
+    DRF's default exception handler, extended to the errors raised by the
+    services and selectors.
+
+    - Django's `ValidationError` becomes a 400 with the usual field errors.
+    - `Http404` and `PermissionDenied` become DRF's 404 and 403 responses.
+    - `ApplicationError` becomes a 400 with its message and `extra` data.
+
+    Error details that are lists or dicts are nested under `detail`, so
+    every error response has the same top-level shape.
+    """
+
+    if isinstance(exc, DjangoValidationError):
+        exc = exceptions.ValidationError(as_serializer_error(exc))
+
+    if isinstance(exc, Http404):
+        exc = exceptions.NotFound()
+
+    if isinstance(exc, PermissionDenied):
+        exc = exceptions.PermissionDenied(*exc.args)
+
+    if isinstance(exc, ApplicationError):
+        return Response(
+            {"detail": exc.message, "extra": exc.extra},
+            status=exceptions.ValidationError.status_code,
+        )
+
+    response = exception_handler(exc, ctx)
+
+    # If unexpected error occurs (server error, etc.)
+    if response is None:
+        return response
+
+    if isinstance(exc.detail, (list, dict)):
+        response.data = {"detail": response.data}
+
+    return response
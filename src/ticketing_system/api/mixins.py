@@ -0,0 +1,15 @@
+from rest_framework.authentication import SessionAuthentication
+from rest_framework.permissions import IsAuthenticated
+
+from ticketing_system.authentication.backends import ProfileJWTAuthentication
+
+
+class ApiAuthMixin:
+
+    """
+    Authenticates API views with a JWT bearer token, or with the browser
+    session of a logged-in user, and rejects anonymous requests.
+    """
+
+    authentication_classes = [ProfileJWTAuthentication, SessionAuthentication]
+    permission_classes = [IsAuthenticated]
@@ -0,0 +1,99 @@
+from typing import Any, Callable, Dict, Sequence
+
+from django.core.paginator import InvalidPage
+from django.db.models import QuerySet
+from rest_framework import exceptions
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from ticketing_system.core.pagination import KeysetPaginator
+
+
+class CursorPagination:
+
+    """
+    Query parameters and page size limits of the API cursor pagination.
+    """
+
+    cursor_query_param = "cursor"
+    limit_query_param = "limit"
+    default_limit = 25
+    max_limit = 100
+
+
+def get_limit(*, request, pagination_class=CursorPagination) -> int:
+
+    """
+    Returns the page size requested with `?limit=`, clamped to `max_limit`.
+
+    Raises:
+        ValidationError: If the limit is not a positive integer.
+    """
+
+    raw_limit = request.query_params.get(pagination_class.limit_query_param)
+    if raw_limit is None:
+        return pagination_class.default_limit
+
+    try:
+        limit = int(raw_limit)
+        if limit < 1:
+            raise ValueError
+    except ValueError:
+        raise exceptions.ValidationError(
+            {pagination_class.limit_query_param: ["A positive integer is required."]}
+        )
+
+    return min(limit, pagination_class.max_limit)
+
+
+def get_cursor_paginated_response(
+        *, queryset: QuerySet, request, to_representation: Callable[[Any], Dict[str, Any]],
+        ordering: Sequence[str] = ('-updated_at', '-id'), pagination_class=CursorPagination
+) -> Response:
+
+    """
+    Paginates the queryset by keyset and returns the page as a response.
+
+    Uses `KeysetPaginator`, so no page costs more than the first one and no
+    `COUNT(*)` is issued. The response carries the links of the next and the
+    previous page, which keep all other query parameters.
+
+    Args:
+        queryset (QuerySet): The queryset to paginate; its rows must include
+            the `ordering` fields.
+        request (Request): The API request.
+        to_representation (Callable): Turns a row into its JSON representation.
+        ordering (Sequence[str], optional): The keyset ordering.
+        pagination_class (optional): Query parameters and limits of the pagination.
+
+    Raises:
+        ValidationError: If the cursor or the limit is malformed.
+
+    Returns:
+        Response: `{"next": ..., "previous": ..., "results": [...]}`.
+    """
+
+    paginator = KeysetPaginator(
+        queryset, per_page=get_limit(request=request, pagination_class=pagination_class),
+        ordering=ordering
+    )
+
+    try:
+        page = paginator.page(request.query_params.get(pagination_class.cursor_query_param))
+    except InvalidPage:
+        raise exceptions.ValidationError(
+            {pagination_class.cursor_query_param: ["Invalid cursor."]}
+        )
+
+    url = request.build_absolute_uri()
+
+    def _page_link(cursor):
+        if cursor is None:
+            return None
+        return replace_query_param(url, pagination_class.cursor_query_param, cursor)
+
+    return Response({
+        "next": _page_link(page.next_cursor),
+        "previous": _page_link(page.previous_cursor),
+        "results": [to_representation(row) for row in page],
+    })
@@ -0,0 +1,32 @@
+from django.urls import include, path
+from rest_framework_simplejwt.views import TokenRefreshView
+
+from ticketing_system.authentication.apis import TokenObtainApi
+from ticketing_system.ticket.apis import (
+    TicketAssignApi, TicketChangeFeedApi, TicketClaimNextApi, TicketCloseApi, TicketDetailApi,
+    TicketListApi
+)
+
+
+auth_patterns = [
+    path(route="token/", view=TokenObtainApi.as_view(), name="token-obtain"),
+    path(route="token/refresh/", view=TokenRefreshView.as_view(), name="token-refresh"),
+]
+
+ticket_patterns = [
+    path(route="", view=TicketListApi.as_view(), name="list"),
+    path(route="changes/", view=TicketChangeFeedApi.as_view(), name="changes"),
+    path(route="queue/claim/", view=TicketClaimNextApi.as_view(), name="claim-next"),
+    path(route="<uuid:ticket_id>/", view=TicketDetailApi.as_view(), name="detail"),
+    path(route="<uuid:ticket_id>/assign/", view=TicketAssignApi.as_view(), name="assign"),
+    path(route="<uuid:ticket_id>/close/", view=TicketCloseApi.as_view(), name="close"),
+]
+
+v1_patterns = [
+    path(route="auth/", view=include((auth_patterns, "auth"))),
+    path(route="tickets/", view=include((ticket_patterns, "tickets"))),
+]
+
+urlpatterns = [
+    path(route="v1/", view=include((v1_patterns, "v1"))),
+]
@@ -0,0 +1,38 @@
+from typing import List, Sequence
+
+from rest_framework import exceptions
+
+
+def get_sparse_fields(
+        *, request, available: Sequence[str], default: Sequence[str],
+        query_param: str = "fields"
+) -> List[str]:
+
+    """
+    Returns the fields requested with `?fields=a,b`, or the default fields.
+
+    Args:
+        request (Request): The API request.
+        available (Sequence[str]): All fields the endpoint can return.
+        default (Sequence[str]): The fields returned without `?fields=`.
+        query_param (str, optional): Name of the query parameter.
+
+    Raises:
+        ValidationError: If an unknown field is requested.
+
+    Returns:
+        List[str]: The requested field names, in request order.
+    """
+
+    raw_fields = request.query_params.get(query_param, "")
+    if not raw_fields.strip():
+        return list(default)
+
+    fields = list(dict.fromkeys(field.strip() for field in raw_fields.split(",") if field.strip()))
+    unknown = [field for field in fields if field not in available]
+    if unknown:
+        raise exceptions.ValidationError(
+            {query_param: [f"Unknown field(s): {', '.join(unknown)}."]}
+        )
+
+    return fields
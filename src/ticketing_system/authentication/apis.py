@@ -0,0 +1,28 @@
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.views import TokenObtainPairView
+
+from ticketing_system.core.exceptions import UserNotVerifiedError
+
+
+class VerifiedTokenObtainPairSerializer(TokenObtainPairSerializer):
+
+    """
+    Issues JWT pairs to verified users only, like the login view.
+    """
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+
+        if not self.user.is_verified:
+            raise UserNotVerifiedError()
+
+        return data
+
+
+class TokenObtainApi(TokenObtainPairView):
+
+    """
+    Exchanges the email and password of a verified user for a JWT pair.
+    """
+
+    serializer_class = VerifiedTokenObtainPairSerializer
@@ -0,0 +1,94 @@
+from typing import Optional
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+
+User = get_user_model()
+
+
+class ProfileModelBackend(ModelBackend):
+
+    """
+    Model backend that loads the user together with its profile.
+
+    `AuthenticationMiddleware` resolves `request.user` through the backend's
+    `get_user()`. Joining the profile there means every authenticated request
+    gets `request.user` and `request.user.profile` from a single query,
+    instead of one query for the user and another one on first access of
+    `.profile`.
+    """
+
+    def get_user(self, user_id: int) -> Optional['User']:
+
+        """
+        Retrieve an active user by primary key with its profile joined.
+
+        Args:
+            user_id (int): The primary key stored in the session.
+
+        Returns:
+            Optional[User]: The user, or `None` if it does not exist or
+            may not authenticate.
+        """
+
+        try:
+            user = User._default_manager.select_related('profile').get(pk=user_id)
+        except User.DoesNotExist:
+            return None
+
+        return user if self.user_can_authenticate(user) else None
+
+
+class ProfileJWTAuthentication(JWTAuthentication):
+
+    """
+    JWT authentication that loads the user together with its profile.
+
+    The API counterpart of `ProfileModelBackend`: every API request gets
+    `request.user` and `request.user.profile` from a single query.
+    """
+
+    def get_user(self, validated_token: Token) -> 'User':
+
+        """
+        Retrieve the active user of the token with its profile joined.
+
+        Raises:
+            InvalidToken: If the token carries no user id.
+            AuthenticationFailed: If the user does not exist, is inactive or
+                changed the password the token was issued for.
+
+        Returns:
+            User: The authenticated user.
+        """
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+
+        try:
+            user = User._default_manager.select_related('profile').get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except User.DoesNotExist:
+            raise AuthenticationFailed("User not found", code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+        ) != get_md5_hash_password(user.password):
+            raise AuthenticationFailed(
+                "The user's password has been changed.", code="password_changed"
+            )
+
+        return user
@@ -3,10 +3,12 @@ from datetime import datetime, timedelta
 from typing import Dict, Optional, Union
 
 from django.contrib.auth import get_user_model
+from django.core import signing
 from django.core.exceptions import ObjectDoesNotExist
 from django.urls import reverse
-from jwt import ExpiredSignatureError, decode
+from jwt import ExpiredSignatureError, PyJWTError, decode
 from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken, Token
 
 from config.env import env
@@ -21,6 +23,10 @@ APP_DOMAIN = env("APP_DOMAIN", default="http://localhost:8000")
 
 User = get_user_model()
 
+# Namespaces the salt of signed tokens, so a token issued for one purpose
+# can never be replayed for another one.
+SIGNED_TOKEN_SALT = "ticketing_system.authentication.token_service"
+
 
 class TokenService:
 
@@ -29,6 +35,14 @@ class TokenService:
 
     Provides methods to generate JWT tokens and construct URLs
     containing tokens for specific user actions.
+
+    Two kinds of tokens are supported:
+
+    - JWT tokens (SimpleJWT), meant for API authentication. Issuing them
+      registers an `OutstandingToken` row for the blacklist.
+    - Signed tokens (`django.core.signing`), meant for links in emails.
+      They are scoped to a purpose, carry their own timestamp, write
+      nothing to the database and are verified without any query.
     """
 
     @staticmethod
@@ -118,12 +132,12 @@ class TokenService:
         try:
             # Decode and verify token
             decoded_token = decode(
-                jwt=token, key=env('SECRET_KEY'), algorithms=['HS256']
+                jwt=token, key=api_settings.SIGNING_KEY, algorithms=[api_settings.ALGORITHM]
             )
 
             # Verify expiration (automatically checked by SimpleJWT)
             current_time = datetime.now().timestamp()
-            if (current_time - decoded_token['iat']) > max_age.total_seconds():
+            if max_age and (current_time - decoded_token['iat']) > max_age.total_seconds():
                 raise ExpiredSignatureError()
 
             # Get user
@@ -132,9 +146,110 @@ class TokenService:
 
             return user
 
-        except (ExpiredSignatureError, TokenError, InvalidToken) as e:
+        except (PyJWTError, TokenError, InvalidToken) as e:
             logger.error(f"Token validation failed: {str(e)}")
             raise ApplicationError("Invalid or expired token")
         except ObjectDoesNotExist:
             logger.error("User not found for valid token")
             raise User.DoesNotExist
+
+    @staticmethod
+    def generate_signed_token(user: 'User', purpose: str) -> str:
+
+        """
+        Generate a signed, timestamped token for a user.
+
+        Args:
+            user (User): The user for whom the token is generated.
+            purpose (str): What the token may be used for, e.g. ``"email-verification"``.
+                Tokens are only accepted for the purpose they were issued for.
+
+        Returns:
+            str: A URL-safe signed token.
+        """
+
+        return signing.dumps(
+            {'user_id': user.pk}, salt=f'{SIGNED_TOKEN_SALT}:{purpose}', compress=True
+        )
+
+    @staticmethod
+    def generate_url_with_signed_token(
+            user: 'User', purpose: str, view_name: str
+    ) -> str:
+
+        """
+        Generate a URL containing an embedded signed token.
+
+        Args:
+            user (User): The user for whom the token is generated.
+            purpose (str): What the token may be used for.
+            view_name (str): The name of the view that the URL points to.
+
+        Returns:
+            str: A complete URL with the signed token embedded as an argument.
+        """
+
+        token = TokenService.generate_signed_token(user, purpose)
+
+        url = reverse(view_name, args=[token])
+        return f'{APP_DOMAIN}{url}'
+
+    @staticmethod
+    def unsign_token(token: str, purpose: str, max_age: timedelta) -> int:
+
+        """
+        Verify a signed token and return the id of the user it was issued for.
+
+        Only checks the signature, the purpose and the age of the token,
+        so it runs without touching the database.
+
+        Args:
+            token (str): The signed token to verify.
+            purpose (str): The purpose the token must have been issued for.
+            max_age (timedelta): Maximum allowed token age.
+
+        Returns:
+            int: The primary key of the user.
+
+        Raises:
+            ApplicationError: Raised if the token is invalid, expired, or malformed.
+        """
+
+        try:
+            payload = signing.loads(
+                token, salt=f'{SIGNED_TOKEN_SALT}:{purpose}', max_age=max_age
+            )
+            return payload['user_id']
+
+        except (signing.BadSignature, KeyError, TypeError) as e:
+            logger.error(f"Signed token validation failed: {str(e)}")
+            raise ApplicationError("Invalid or expired token")
+
+    @staticmethod
+    def validate_signed_token(
+            token: str, purpose: str, max_age: timedelta
+    ) -> 'User':
+
+        """
+        Validate a signed token and return the associated user.
+
+        Args:
+            token (str): The signed token to validate.
+            purpose (str): The purpose the token must have been issued for.
+            max_age (timedelta): Maximum allowed token age.
+
+        Returns:
+            User: The user the token was issued for.
+
+        Raises:
+            ApplicationError: Raised if the token is invalid, expired, or malformed.
+            User.DoesNotExist: Raised if the user associated with the token does not exist.
+        """
+
+        user_id = TokenService.unsign_token(token, purpose, max_age)
+
+        try:
+            return User.objects.get(pk=user_id)
+        except ObjectDoesNotExist:
+            logger.error("User not found for valid token")
+            raise User.DoesNotExist
@@ -47,7 +47,8 @@ class RegistrationView(CreateView):
         Handle valid form submissions.
 
         - Save the user with default 'is_verified=False' status.
-        - Send a registration email to the newly created user.
+        - Queue a registration email for the newly created user;
+          it is delivered by the `send_queued_emails` worker.
 
         Args:
             form (CustomUserCreationForm): The validated form instance.
@@ -63,7 +64,7 @@ class RegistrationView(CreateView):
             # Create associated profile
             Profile.objects.create(user=user)
 
-            # Send verification email
+            # Queue verification email
             send_registration_email(user=user)
         except IntegrityError:
             # Handle potential duplicate profile creation
@@ -111,7 +112,7 @@ class VerificationEmailView(TemplateView):
         Args:
             request (HttpRequest): The HTTP request object.
             *args: Additional positional arguments.
-            **kwargs: Additional keyword arguments, including the JWT token.
+            **kwargs: Additional keyword arguments, including the signed token.
 
         Returns:
             HttpResponse: Renders a template with verification status and messages.
@@ -125,9 +126,10 @@ class VerificationEmailView(TemplateView):
         token = kwargs.get('token')
 
         try:
-            user = TokenService.validate_token(
+            user = TokenService.validate_signed_token(
                 token=token,
-                max_age=settings.DEFAULT_REGISTRATION_EMAIL_JWT_MAX_AGE
+                purpose=settings.DEFAULT_REGISTRATION_EMAIL_TOKEN_PURPOSE,
+                max_age=settings.DEFAULT_REGISTRATION_EMAIL_TOKEN_MAX_AGE
             )
 
             if user.is_verified:
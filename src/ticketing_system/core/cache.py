@@ -0,0 +1,122 @@
+import time
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+
+_MISSING = object()
+
+
+def get_cache_version(*, namespace: str) -> int:
+
+    """
+    Returns the current version of a cache namespace.
+
+    Versions are seeded from the clock, so a namespace whose version key
+    was evicted never falls back to a number used before.
+
+    Args:
+        namespace (str): The cache namespace, e.g. ``"tickets:counts"``.
+
+    Returns:
+        int: The current version.
+    """
+
+    version_key = f"{namespace}:version"
+    version = cache.get(version_key)
+
+    if version is None:
+        cache.add(version_key, time.time_ns(), timeout=None)
+        version = cache.get(version_key, time.time_ns())
+
+    return version
+
+
+def bump_cache_version(*, namespace: str) -> None:
+
+    """
+    Invalidates every entry of a cache namespace by moving to a new version.
+
+    Bumps right away and once more after the surrounding transaction commits,
+    so a reader that recomputed from not yet committed data in between
+    cannot leave a stale value behind.
+
+    Args:
+        namespace (str): The cache namespace to invalidate.
+    """
+
+    def _bump() -> None:
+        version_key = f"{namespace}:version"
+        try:
+            cache.incr(version_key)
+        except ValueError:
+            cache.add(version_key, time.time_ns(), timeout=None)
+
+    _bump()
+    transaction.on_commit(_bump)
+
+
+def versioned_cache_key(*, namespace: str, key: str) -> str:
+
+    """
+    Builds a cache key bound to the current version of its namespace.
+    """
+
+    return f"{namespace}:v{get_cache_version(namespace=namespace)}:{key}"
+
+
+def cache_get_or_compute(
+        *, key: str, compute: Callable[[], Any], timeout: Optional[int],
+        lock_timeout: Optional[int] = None, wait: Optional[float] = None,
+        poll_interval: float = 0.05
+) -> Any:
+
+    """
+    Returns a cached value, recomputing it at most once on a miss.
+
+    On a miss only the caller that acquires the lock (an atomic
+    `cache.add`) runs `compute`; concurrent callers poll the cache until the
+    value appears instead of stampeding the database. If it does not appear
+    within `wait` seconds they compute it themselves.
+
+    Args:
+        key (str): The cache key.
+        compute (Callable[[], Any]): Produces the value on a miss.
+        timeout (Optional[int]): Cache timeout of the value in seconds.
+        lock_timeout (Optional[int]): Maximum time the recomputation lock is held.
+        wait (Optional[float]): How long waiting callers poll for the value.
+        poll_interval (float): Delay between two polls in seconds.
+
+    Returns:
+        Any: The cached or freshly computed value.
+    """
+
+    value = cache.get(key, _MISSING)
+    if value is not _MISSING:
+        return value
+
+    if lock_timeout is None:
+        lock_timeout = settings.CACHE_SINGLE_FLIGHT_LOCK_TIMEOUT
+    if wait is None:
+        wait = settings.CACHE_SINGLE_FLIGHT_WAIT
+
+    lock_key = f"{key}:lock"
+
+    if cache.add(lock_key, 1, timeout=lock_timeout):
+        try:
+            value = compute()
+            cache.set(key, value, timeout=timeout)
+            return value
+        finally:
+            cache.delete(lock_key)
+
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        time.sleep(poll_interval)
+        value = cache.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+    return compute()
@@ -0,0 +1,268 @@
+import base64
+import binascii
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import InvalidPage, Paginator
+from django.db import connections
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+
+
+class CursorPage:
+
+    """
+    A single page of results produced by `KeysetPaginator`.
+
+    Mirrors the parts of Django's `Page` API used by templates
+    (`object_list`, `has_next`, `has_previous`, `has_other_pages`, iteration)
+    and exposes opaque cursors instead of page numbers.
+    """
+
+    def __init__(
+            self, object_list: List[Any], next_cursor: Optional[str],
+            previous_cursor: Optional[str]
+    ) -> None:
+
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self) -> int:
+        return len(self.object_list)
+
+    def __getitem__(self, index: int) -> Any:
+        return self.object_list[index]
+
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+    def has_previous(self) -> bool:
+        return self.previous_cursor is not None
+
+    def has_other_pages(self) -> bool:
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+
+    """
+    Paginates a queryset by seeking past the last row seen instead of
+    using `OFFSET`.
+
+    Every page is fetched with a `WHERE (k1, k2) < (v1, v2) ORDER BY k1, k2
+    LIMIT n + 1` query, so its cost does not depend on how deep the client
+    has paged and no `COUNT(*)` is ever issued. The ordering must be total,
+    which is why the last key should always be the primary key.
+
+    Attributes:
+        queryset (QuerySet): The queryset to paginate.
+        per_page (int): Number of rows per page.
+        ordering (Sequence[str]): Keyset ordering, e.g. ``('-updated_at', '-id')``.
+    """
+
+    def __init__(
+            self, queryset: QuerySet, per_page: int,
+            ordering: Sequence[str] = ('-updated_at', '-id')
+    ) -> None:
+
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return tuple(field.lstrip('-') for field in self.ordering)
+
+    def encode_cursor(self, instance: Any, reverse: bool = False) -> str:
+
+        """
+        Build an opaque cursor pointing at the given row.
+
+        Args:
+            instance (Any): A model instance or a ``values()`` dict.
+            reverse (bool): Whether the cursor walks backwards.
+
+        Returns:
+            str: A URL-safe base64 encoded cursor.
+        """
+
+        position = []
+        for field in self.fields:
+            value = instance[field] if isinstance(instance, dict) else getattr(instance, field)
+            position.append(value.isoformat() if hasattr(value, 'isoformat') else value)
+
+        payload = json.dumps({'p': position, 'r': reverse}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor: str) -> Tuple[List[Any], bool]:
+
+        """
+        Decode a cursor produced by `encode_cursor`.
+
+        Raises:
+            InvalidPage: If the cursor is malformed.
+        """
+
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload: Dict[str, Any] = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            raw_position = payload['p']
+            reverse = bool(payload.get('r', False))
+
+            if len(raw_position) != len(self.fields):
+                raise ValueError("Cursor does not match the paginator ordering.")
+
+            position = [
+                self._to_python(field, value)
+                for field, value in zip(self.fields, raw_position)
+            ]
+        except (
+            binascii.Error, KeyError, TypeError, ValueError, ValidationError
+        ) as e:
+            raise InvalidPage("Invalid cursor.") from e
+
+        return position, reverse
+
+    def _to_python(self, field: str, value: Any) -> Any:
+
+        """
+        Convert a decoded cursor value back to the field's Python type.
+
+        Annotations (e.g. a search rank) are not model fields and are
+        compared with their JSON value as is.
+        """
+
+        try:
+            model_field = self.queryset.model._meta.get_field(field)
+        except FieldDoesNotExist:
+            return value
+
+        return model_field.to_python(value)
+
+    def _seek_filter(self, position: List[Any], reverse: bool) -> Q:
+
+        """
+        Build the row-value comparison ``(k1, k2, ...) <> (v1, v2, ...)``
+        as a disjunction that the database can answer from a composite index.
+        """
+
+        seek = Q()
+        for index, ordering_field in enumerate(self.ordering):
+            field = ordering_field.lstrip('-')
+            descending = ordering_field.startswith('-')
+            lookup = 'gt' if descending == reverse else 'lt'
+
+            condition = Q(**{f'{field}__{lookup}': position[index]})
+            for previous_index in range(index):
+                condition &= Q(**{self.fields[previous_index]: position[previous_index]})
+            seek |= condition
+
+        return seek
+
+    def page(self, cursor: Optional[str] = None) -> 'CursorPage':
+
+        """
+        Return the page starting right after (or before) the given cursor.
+
+        Args:
+            cursor (Optional[str]): The cursor of the requested page, or
+                `None` for the first page.
+
+        Returns:
+            CursorPage: The requested page.
+
+        Raises:
+            InvalidPage: If the cursor is malformed.
+        """
+
+        reverse = False
+        queryset = self.queryset
+
+        if cursor:
+            position, reverse = self.decode_cursor(cursor)
+            queryset = queryset.filter(self._seek_filter(position, reverse))
+
+        if reverse:
+            ordering = [
+                field[1:] if field.startswith('-') else f'-{field}'
+                for field in self.ordering
+            ]
+        else:
+            ordering = list(self.ordering)
+
+        rows = list(queryset.order_by(*ordering)[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if reverse:
+            rows.reverse()
+
+        next_cursor = previous_cursor = None
+        if rows:
+            if has_more or reverse:
+                next_cursor = self.encode_cursor(rows[-1])
+            if cursor and (has_more or not reverse):
+                previous_cursor = self.encode_cursor(rows[0], reverse=True)
+
+        return CursorPage(
+            object_list=rows, next_cursor=next_cursor, previous_cursor=previous_cursor
+        )
+
+
+class ApproximateCountPaginator(Paginator):
+
+    """
+    Page-number paginator that avoids an exact `COUNT(*)` on huge tables.
+
+    For an unfiltered queryset on PostgreSQL the row count is read from the
+    planner statistics (`pg_class.reltuples`), which is instant at any table
+    size. Small tables, filtered querysets and other backends keep the exact
+    count.
+
+    Attributes:
+        exact_count_threshold (int): Estimates below this are replaced by an
+            exact count.
+    """
+
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self) -> int:
+
+        """
+        Return the estimated or exact number of objects.
+        """
+
+        estimate = self._estimate_count()
+        if estimate is not None and estimate >= self.exact_count_threshold:
+            return estimate
+
+        return super().count
+
+    def _estimate_count(self) -> Optional[int]:
+
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where:
+            return None
+
+        connection = connections[self.object_list.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [self.object_list.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+
+        # `reltuples` is -1 (or 0 on older servers) until the table was analyzed.
+        if not row or row[0] <= 0:
+            return None
+
+        return int(row[0])
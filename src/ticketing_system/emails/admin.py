@@ -1,24 +1,57 @@
-# from django.contrib import admin
-#
-# from styleguide_example.emails.models import Email
-# from styleguide_example.emails.services import email_send_all
-#
-#
-# @admin.register(Email)
-# class EmailAdmin(admin.ModelAdmin):
-#     list_display = ["id", "subject", "to", "status", "sent_at"]
-#     actions = ["send_email"]
-#
-#     def get_queryset(self, request):
-#         """
-#         We want to defer the `html` and `plain_text` fields,
-#         since we are not showing them in the list & we don't need to fetch them.
-#
-#         Potentially, those fields can be quite heavy.
-#         """
-#         queryset = super().get_queryset(request)
-#         return queryset.defer("html", "plain_text")
-#
-#     @admin.action(description="Send selected emails.")
-#     def send_email(self, request, queryset):
-#         email_send_all(queryset)
+from django.contrib import admin, messages
+
+from ticketing_system.emails.models import Email
+from ticketing_system.emails.services import email_claim, email_requeue, email_send_all
+
+
+@admin.register(Email)
+class EmailAdmin(admin.ModelAdmin):
+    list_display = [
+        "id", "subject", "to_email", "status", "attempts", "next_attempt_at", "sent_at"
+    ]
+    list_filter = ["status"]
+    actions = ["send_email", "requeue_email"]
+
+    def get_queryset(self, request):
+        """
+        We want to defer the `html` and `message` fields,
+        since we are not showing them in the list & we don't need to fetch them.
+
+        Potentially, those fields can be quite heavy.
+        """
+        queryset = super().get_queryset(request)
+        return queryset.defer("html", "message")
+
+    @admin.action(description="Send selected emails.")
+    def send_email(self, request, queryset):
+        """
+        Send the selected emails right away, also failed ones whose retry
+        is scheduled for later. Sent, dead and currently sending emails are
+        skipped.
+        """
+        selected = queryset.count()
+        emails = email_claim(queryset=queryset, batch_size=selected, due_only=False)
+        sent = [
+            email for email in email_send_all(emails=emails)
+            if email.status == Email.Status.SENT
+        ]
+
+        self.message_user(
+            request, f"Sent {len(sent)} of the selected emails.", messages.SUCCESS
+        )
+        skipped = selected - len(emails)
+        if skipped:
+            self.message_user(
+                request,
+                f"Skipped {skipped} of the selected emails, they are already sent, "
+                f"dead or being sent.",
+                messages.WARNING
+            )
+
+    @admin.action(description="Requeue selected failed or dead emails.")
+    def requeue_email(self, request, queryset):
+        requeued = email_requeue(queryset=queryset)
+
+        self.message_user(
+            request, f"Requeued {requeued} of the selected emails.", messages.SUCCESS
+        )
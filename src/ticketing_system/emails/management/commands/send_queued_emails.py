@@ -0,0 +1,56 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ticketing_system.emails.services import email_claim, email_send_all
+
+
+class Command(BaseCommand):
+
+    """
+    Outbox worker that delivers queued (`READY`) emails.
+
+    Claims batches with `SELECT ... FOR UPDATE SKIP LOCKED`, so any number
+    of workers can run side by side, and sends every batch over a single
+    backend connection. Runs until interrupted unless `--once` is given.
+    """
+
+    help = "Send queued emails from the outbox."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.EMAIL_OUTBOX_BATCH_SIZE,
+            help="Number of emails claimed and sent per batch.",
+        )
+        parser.add_argument(
+            "--poll-interval", type=float, default=settings.EMAIL_OUTBOX_POLL_INTERVAL,
+            help="Seconds to sleep when the outbox is empty.",
+        )
+        parser.add_argument(
+            "--once", action="store_true",
+            help="Exit as soon as the outbox is empty.",
+        )
+
+    def handle(self, *args, **options):
+        sent = failed = 0
+
+        try:
+            while True:
+                emails = email_claim(batch_size=options["batch_size"])
+
+                if not emails:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+                    continue
+
+                for email in email_send_all(emails=emails):
+                    if email.status == email.Status.SENT:
+                        sent += 1
+                    else:
+                        failed += 1
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS(f"Sent {sent} emails, {failed} failed."))
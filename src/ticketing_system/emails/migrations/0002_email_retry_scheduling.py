@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:36
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('emails', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='email',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0, help_text='The number of finished delivery attempts.'),
+        ),
+        migrations.AddField(
+            model_name='email',
+            name='last_error',
+            field=models.TextField(blank=True, help_text='The error of the last failed delivery attempt.'),
+        ),
+        migrations.AddField(
+            model_name='email',
+            name='next_attempt_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, help_text='The earliest time the email may be (re)sent.'),
+        ),
+        migrations.AlterField(
+            model_name='email',
+            name='status',
+            field=models.CharField(choices=[('READY', 'Ready'), ('SENDING', 'Sending'), ('SENT', 'Sent'), ('FAILED', 'Failed'), ('DEAD', 'Dead')], db_index=True, default='READY', help_text='The current status of the email.', max_length=255),
+        ),
+        migrations.AddIndex(
+            model_name='email',
+            index=models.Index(condition=models.Q(('status__in', ['READY', 'FAILED'])), fields=['next_attempt_at'], name='email_due_next_attempt_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-17 08:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('emails', '0002_email_retry_scheduling'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='email',
+            name='email_due_next_attempt_idx',
+        ),
+        migrations.AddIndex(
+            model_name='email',
+            index=models.Index(condition=models.Q(('status__in', ['READY', 'FAILED', 'SENDING'])), fields=['next_attempt_at'], name='email_due_next_attempt_idx'),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.utils import timezone
 
 from ticketing_system.core.models import BaseModel
 
@@ -16,13 +17,29 @@ class Email(BaseModel):
         - message (str): The plain-text body of the email.
         - html (str): The HTML body of the email (optional).
         - sent_at (datetime): The timestamp when the email was successfully sent.
+        - attempts (int): The number of finished delivery attempts.
+        - next_attempt_at (datetime): The earliest time the outbox worker may
+          (re)try to send the email.
+        - last_error (str): The error of the last failed attempt.
+
+    A failed email is retried with exponential backoff until it either gets
+    sent or runs out of attempts and is dead-lettered (`DEAD`).
+
+    While an email is `SENDING`, `next_attempt_at` is the end of the
+    worker's claim. A worker that dies mid-send leaves the email `SENDING`;
+    once the claim expires, another worker picks it up again.
     """
 
     class Status(models.TextChoices):
         READY = ("READY", "Ready") # Email is ready to be sent.
         SENDING = ("SENDING", "Sending") # Email is in the process of being sent.
         SENT = ("SENT", "Sent") # Email has been successfully sent.
-        FAILED = ("FAILED", "Failed") # Email failed to send.
+        FAILED = ("FAILED", "Failed") # Email failed to send, a retry is scheduled.
+        DEAD = ("DEAD", "Dead") # Email ran out of attempts and is no longer retried.
+
+    # Statuses the outbox worker picks up once `next_attempt_at` is due;
+    # for `SENDING` emails that is when their claim expired.
+    DUE_STATUSES = [Status.READY, Status.FAILED, Status.SENDING]
 
     status = models.CharField(
         max_length=255, db_index=True, choices=Status.choices, default=Status.READY,
@@ -51,6 +68,30 @@ class Email(BaseModel):
         help_text="The timestamp when the email was sent (if applicable)."
     )
 
+    attempts = models.PositiveIntegerField(
+        default=0,
+        help_text="The number of finished delivery attempts."
+    )
+    next_attempt_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="The earliest time the email may be (re)sent."
+    )
+    last_error = models.TextField(
+        blank=True,
+        help_text="The error of the last failed delivery attempt."
+    )
+
+    class Meta:
+        indexes = [
+            # The outbox worker claims due emails with a single range scan
+            # over this index, ordered by `next_attempt_at`.
+            models.Index(
+                fields=['next_attempt_at'],
+                condition=models.Q(status__in=['READY', 'FAILED', 'SENDING']),
+                name='email_due_next_attempt_idx',
+            ),
+        ]
+
     def __str__(self) -> str:
 
         """
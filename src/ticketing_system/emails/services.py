@@ -1,10 +1,14 @@
 import logging
-from typing import TypeVar
+import random
+from datetime import timedelta
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, TypeVar
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.mail import EmailMultiAlternatives
-from django.db import transaction
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import connection, transaction
+from django.db.models import F, Q, QuerySet
 from django.template.loader import render_to_string
 from django.utils import timezone
 
@@ -33,11 +37,14 @@ def create_email(
         message (str): Plain-text content of the email.
         html (str, optional): HTML content of the email. Defaults to an empty string.
 
+    Raises:
+        ValidationError: If any of the fields is invalid.
+
     Returns:
         Email: The created email instance.
     """
 
-    return Email.objects.create(
+    email = Email(
         from_email=from_email,
         to_email=to_email,
         subject=subject,
@@ -45,15 +52,73 @@ def create_email(
         html=html
     )
 
+    # Validate before queuing, the outbox worker must never pick up
+    # an email that cannot be delivered.
+    email.full_clean()
+    email.save()
+
+    return email
+
+
+def create_emails(*, emails: List['Email']) -> List['Email']:
+
+    """
+    Validate and queue several emails in the 'READY' state with one INSERT.
+
+    Args:
+        emails (List[Email]): Unsaved email instances.
+
+    Raises:
+        ValidationError: If any of the emails is invalid; none is queued then.
+
+    Returns:
+        List[Email]: The created email instances.
+    """
+
+    for email in emails:
+        email.status = Email.Status.READY
+        email.full_clean()
+
+    return Email.objects.bulk_create(emails)
+
+
+def email_retry_delay(*, attempts: int) -> timedelta:
+
+    """
+    Compute how long to wait before retrying an email.
+
+    The delay doubles with every failed attempt up to
+    `settings.EMAIL_RETRY_MAX_DELAY`, and is jittered down to a random value
+    between half and all of it, so emails that failed together during an
+    outage do not all retry at the same moment once the provider recovers.
+
+    Args:
+        attempts (int): The number of failed attempts so far (at least 1).
+
+    Returns:
+        timedelta: The delay until the next attempt.
+    """
+
+    delay = min(
+        settings.EMAIL_RETRY_BASE_DELAY * 2 ** (max(attempts, 1) - 1),
+        settings.EMAIL_RETRY_MAX_DELAY
+    )
+    return timedelta(seconds=random.uniform(delay / 2, delay))
+
 
 @transaction.atomic
-def email_failed(email: Email) -> Email:
+def email_failed(email: Email, error: str = "") -> Email:
 
     """
-    Mark an email as failed if it's in the 'SENDING' state.
+    Record a failed attempt of an email in the 'SENDING' state.
+
+    The email is scheduled for a retry ('FAILED' with a future
+    `next_attempt_at`), or dead-lettered ('DEAD') once it used up
+    `settings.EMAIL_RETRY_MAX_ATTEMPTS` attempts.
 
     Args:
         email (Email): The email instance to update.
+        error (str, optional): Description of the failure. Defaults to an empty string.
 
     Raises:
         ApplicationError: If the email is not in the 'SENDING' state.
@@ -69,11 +134,52 @@ def email_failed(email: Email) -> Email:
         )
 
     email, _ = model_update(
-        instance=email, fields=["status"], data={"status": Email.Status.FAILED}
+        instance=email,
+        fields=["status", "attempts", "next_attempt_at", "last_error"],
+        data=_email_failure_data(email=email, error=error)
     )
     return email
 
 
+def _email_failure_data(*, email: 'Email', error: str) -> Dict[str, Any]:
+
+    # The fields written for a failed attempt: a retry or the dead letter.
+    attempts = email.attempts + 1
+    data = {"attempts": attempts, "last_error": error}
+
+    if attempts >= settings.EMAIL_RETRY_MAX_ATTEMPTS:
+        data["status"] = Email.Status.DEAD
+        logger.warning(f"Giving up on {email} after {attempts} attempts.")
+    else:
+        data["status"] = Email.Status.FAILED
+        data["next_attempt_at"] = timezone.now() + email_retry_delay(attempts=attempts)
+
+    return data
+
+
+def email_requeue(*, queryset: QuerySet['Email']) -> int:
+
+    """
+    Put failed and dead-lettered emails back into the outbox right away.
+
+    Resets their attempt counter, so a requeued email gets the full
+    number of retries again.
+
+    Args:
+        queryset (QuerySet[Email]): The emails to requeue; emails in
+            other states are left untouched.
+
+    Returns:
+        int: The number of requeued emails.
+    """
+
+    return queryset.filter(
+        status__in=[Email.Status.FAILED, Email.Status.DEAD]
+    ).update(
+        status=Email.Status.READY, attempts=0, next_attempt_at=timezone.now()
+    )
+
+
 @transaction.atomic
 def email_send(email: 'Email') -> 'Email':
 
@@ -96,7 +202,28 @@ def email_send(email: 'Email') -> 'Email':
         )
 
     # Prepare and send email
-    msg = EmailMultiAlternatives(
+    msg = _build_message(email=email)
+
+    try:
+        msg.send()
+    except Exception as exc:
+        # Update status to FAILED (or DEAD) on exception
+        email_failed(email=email, error=str(exc))
+        raise ApplicationError("Failed to send email.")
+
+    email, _ = model_update(
+        instance=email, fields=["status", "sent_at", "attempts"],
+        data={
+            "status": Email.Status.SENT, "sent_at": timezone.now(),
+            "attempts": email.attempts + 1
+        }
+    )
+    return email
+
+
+def _build_message(*, email: 'Email') -> EmailMultiAlternatives:
+
+    message = EmailMultiAlternatives(
         subject=email.subject,
         body=email.message,
         from_email=email.from_email,
@@ -104,29 +231,188 @@ def email_send(email: 'Email') -> 'Email':
     )
 
     if email.html:
-        msg.attach_alternative(email.html, "text/html")
+        message.attach_alternative(email.html, "text/html")
 
-    try:
-        msg.send()
-    except Exception:
-        email_failed(email=email)  # Update status to FAILED on exception
-        raise ApplicationError("Failed to send email.")
+    return message
 
-    email, _ = model_update(
-        instance=email, fields=["status", "sent_at"],
-        data={"status": Email.Status.SENT, "sent_at": timezone.now()}
+
+def email_claim(
+        *, batch_size: Optional[int] = None, queryset: Optional[QuerySet['Email']] = None,
+        due_only: bool = True
+) -> List['Email']:
+
+    """
+    Claim a batch of due emails for sending by moving them to `SENDING`.
+
+    Due are new (`READY`) emails, scheduled retries (`FAILED`) and stale
+    claims (`SENDING`) whose `next_attempt_at` has passed; they are found
+    with a single range scan over the partial `email_due_next_attempt_idx`
+    index, oldest first. Claimed emails get `next_attempt_at` set to the
+    end of their claim, `settings.EMAIL_SENDING_LEASE` seconds from now, so
+    emails of a worker that died mid-send are claimed again later.
+
+    On backends that support it the rows are locked with
+    `SELECT ... FOR UPDATE SKIP LOCKED`, so several workers can drain the
+    outbox in parallel without ever claiming the same email twice.
+    Elsewhere every row is claimed with a conditional `UPDATE`, which
+    gives the same guarantee one row at a time.
+
+    Args:
+        batch_size (Optional[int]): Maximum number of emails to claim.
+            Defaults to `settings.EMAIL_OUTBOX_BATCH_SIZE`.
+        queryset (Optional[QuerySet[Email]]): Restricts the emails to claim,
+            e.g. a selection made in the admin. Defaults to all emails.
+        due_only (bool): Whether to skip `READY` and `FAILED` emails whose
+            `next_attempt_at` is still in the future, e.g. not for a manual
+            send. Running claims are never taken over.
+
+    Returns:
+        List[Email]: The claimed emails, now in the 'SENDING' state.
+    """
+
+    if batch_size is None:
+        batch_size = settings.EMAIL_OUTBOX_BATCH_SIZE
+    if queryset is None:
+        queryset = Email.objects.all()
+
+    now = timezone.now()
+    claim = {
+        "status": Email.Status.SENDING,
+        "next_attempt_at": now + timedelta(seconds=settings.EMAIL_SENDING_LEASE),
+    }
+    claimable = Q(status__in=Email.DUE_STATUSES, next_attempt_at__lte=now)
+    if not due_only:
+        claimable |= Q(status__in=[Email.Status.READY, Email.Status.FAILED])
+    due = queryset.filter(claimable).order_by("next_attempt_at", "id")
+
+    with transaction.atomic():
+        if connection.features.has_select_for_update_skip_locked:
+            email_ids = list(
+                due.select_for_update(skip_locked=True).values_list("id", flat=True)[:batch_size]
+            )
+            Email.objects.filter(id__in=email_ids).update(**claim)
+        else:
+            email_ids = [
+                email_id
+                for email_id in due.values_list("id", flat=True)[:batch_size]
+                if Email.objects.filter(claimable, id=email_id).update(**claim)
+            ]
+
+        return list(Email.objects.filter(id__in=email_ids).order_by("id"))
+
+
+def email_send_all(*, emails: Iterable['Email']) -> List['Email']:
+
+    """
+    Send already claimed emails over a single backend connection.
+
+    Each email is handed to `send_messages` separately so one rejected
+    recipient does not fail the whole batch, but the connection (e.g. the
+    SMTP session) is opened once and reused. Sent emails are written back
+    with a single `UPDATE`, failed ones are scheduled for a retry.
+
+    Results are only written back while the worker still holds the claim,
+    i.e. the email is `SENDING` with the lease end it was claimed with.
+    Emails whose claim expired before they were sent are skipped, and
+    results for claims lost in the meantime are logged and dropped; the
+    other worker writes its own.
+
+    Args:
+        emails (Iterable[Email]): Emails in the 'SENDING' state.
+
+    Raises:
+        ApplicationError: If any of the emails is not in the 'SENDING' state.
+
+    Returns:
+        List[Email]: The emails with their updated status.
+    """
+
+    emails = list(emails)
+    if not emails:
+        return emails
+
+    for email in emails:
+        if email.status != Email.Status.SENDING:
+            raise ApplicationError(
+                f"Cannot send non-sending emails. Current status is {email.status}"
+            )
+
+    sent, failed, expired = [], [], 0
+
+    with get_connection() as mail_connection:
+        for email in emails:
+            if timezone.now() >= email.next_attempt_at:
+                # The claim expired, another worker may be sending the email.
+                expired += 1
+                continue
+
+            try:
+                mail_connection.send_messages([_build_message(email=email)])
+            except Exception as exc:
+                logger.exception(f"Failed to send {email}")
+                failed.append((email, str(exc)))
+            else:
+                sent.append(email)
+
+    sent_at = timezone.now()
+    claimed_ids = set()
+    with transaction.atomic():
+        # Emails claimed together share their lease end, so this is
+        # usually a single lookup and a single UPDATE.
+        leases = defaultdict(list)
+        for email in sent:
+            leases[email.next_attempt_at].append(email.id)
+
+        for lease, email_ids in leases.items():
+            claimed_ids.update(
+                Email.objects.select_for_update().filter(
+                    id__in=email_ids, status=Email.Status.SENDING, next_attempt_at=lease
+                ).values_list("id", flat=True)
+            )
+
+        Email.objects.filter(id__in=claimed_ids).update(
+            status=Email.Status.SENT, sent_at=sent_at, attempts=F("attempts") + 1
+        )
+
+    for email in sent:
+        if email.id in claimed_ids:
+            email.status, email.sent_at = Email.Status.SENT, sent_at
+            email.attempts += 1
+        else:
+            logger.warning(f"Sent {email} after its claim was lost, it may be sent twice.")
+
+    # Failures are rare and each one gets its own jittered retry time.
+    for email, error in failed:
+        data = _email_failure_data(email=email, error=error)
+        if not Email.objects.filter(
+            id=email.id, status=Email.Status.SENDING, next_attempt_at=email.next_attempt_at
+        ).update(**data):
+            logger.warning(f"Lost the claim of {email}, dropping its failure.")
+            continue
+
+        for field, value in data.items():
+            setattr(email, field, value)
+
+    logger.info(
+        f"Sent {len(sent)} emails, {len(failed)} failed, "
+        f"{expired} skipped with an expired claim."
     )
-    return email
+    return emails
 
 
 @transaction.atomic
-def send_registration_email(*, user: 'User') -> Email:
+def send_registration_email(*, user: 'User', synchronous: bool = False) -> Email:
 
     """
     Send a registration confirmation email.
 
+    By default the email is only queued in the outbox and delivered by the
+    `send_queued_emails` worker, so the request never waits on the mail
+    server.
+
     Args:
         user (User): The recipient user.
+        synchronous (bool): Send the email right away instead of queuing it.
 
     Returns:
         Email: The created and optionally sent email instance.
@@ -136,11 +422,10 @@ def send_registration_email(*, user: 'User') -> Email:
     from_email = settings.DEFAULT_FROM_EMAIL
     to_email = user.email
 
-    # Generate password reset URL with a token
-    verification_url = TokenService.generate_url_with_token(
+    # Generate the verification URL with a signed token
+    verification_url = TokenService.generate_url_with_signed_token(
         user=user,
-        token_type='access',
-        expiry=settings.DEFAULT_REGISTRATION_EMAIL_JWT_MAX_AGE,
+        purpose=settings.DEFAULT_REGISTRATION_EMAIL_TOKEN_PURPOSE,
         view_name='auth:verify-email'
     )
 
@@ -164,9 +449,16 @@ def send_registration_email(*, user: 'User') -> Email:
         html=html_message
     )
 
+    if not synchronous:
+        logger.info(f"Registration email queued: {email}")
+        return email
 
     email, _ = model_update(
-        instance=email, fields=["status"], data={"status": Email.Status.SENDING}
+        instance=email, fields=["status", "next_attempt_at"],
+        data={
+            "status": Email.Status.SENDING,
+            "next_attempt_at": timezone.now() + timedelta(seconds=settings.EMAIL_SENDING_LEASE),
+        }
     )
     email_send(email)
 
@@ -0,0 +1,41 @@
+from http import HTTPStatus
+from typing import Callable, TYPE_CHECKING
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+if TYPE_CHECKING:
+    from ticketing_system.users.models import User
+
+
+pytestmark = pytest.mark.django_db
+
+TOKEN_OBTAIN_API_URL = reverse("api:v1:auth:token-obtain")
+
+
+def test_post_request_token_obtain_api_return_successful(
+        create_test_user: Callable[..., 'User']
+) -> None:
+
+    """
+    Test that a verified user gets a JWT pair and an unverified one is refused.
+    """
+
+    verified_user = create_test_user(password="secret-pass-123")
+    unverified_user = create_test_user(password="secret-pass-123", is_verified=False)
+    api_client = APIClient()
+
+    response = api_client.post(
+        TOKEN_OBTAIN_API_URL,
+        {'email': verified_user.email, 'password': "secret-pass-123"}, format='json'
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert {'access', 'refresh'} <= set(response.json())
+
+    response = api_client.post(
+        TOKEN_OBTAIN_API_URL,
+        {'email': unverified_user.email, 'password': "secret-pass-123"}, format='json'
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {'detail': "The user has not been verified."}
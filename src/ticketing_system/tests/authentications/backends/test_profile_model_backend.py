@@ -0,0 +1,67 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ticketing_system.authentication.backends import ProfileModelBackend
+
+if TYPE_CHECKING:
+    from django.test import Client
+    from pytest_django import DjangoAssertNumQueries
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_profile_model_backend_get_user_return_successful(
+        first_test_user_profile: 'Profile', django_assert_num_queries: 'DjangoAssertNumQueries'
+) -> None:
+
+    """
+    Test that the backend loads the user and its profile with a single query.
+    """
+
+    with django_assert_num_queries(1):
+        user = ProfileModelBackend().get_user(first_test_user_profile.user.pk)
+        assert user.profile == first_test_user_profile
+        assert user.profile.role == first_test_user_profile.role
+
+
+def test_profile_model_backend_get_user_inactive_user_return_none(
+        first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that inactive users are not authenticated.
+    """
+
+    user = first_test_user_profile.user
+    user.is_active = False
+    user.save()
+
+    assert ProfileModelBackend().get_user(user.pk) is None
+    assert ProfileModelBackend().get_user(0) is None
+
+
+def test_get_request_ticket_list_view_load_profile_with_user(
+        client: 'Client', first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that an authenticated page never queries the profile on its own,
+    it arrives joined with the session user.
+    """
+
+    client.force_login(first_test_user_profile.user)
+
+    with CaptureQueriesContext(connection) as context:
+        client.get(path=reverse('tickets:list'))
+
+    profile_queries = [
+        query['sql'] for query in context.captured_queries
+        if query['sql'].startswith('SELECT') and 'FROM "users_profile"' in query['sql']
+    ]
+    assert profile_queries == []
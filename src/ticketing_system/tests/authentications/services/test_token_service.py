@@ -0,0 +1,72 @@
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from ticketing_system.authentication.token_service import TokenService
+from ticketing_system.core.exceptions import ApplicationError
+
+if TYPE_CHECKING:
+    from pytest_django import DjangoAssertNumQueries
+
+
+pytestmark = pytest.mark.django_db
+
+User = get_user_model()
+
+PURPOSE = "email-verification"
+MAX_AGE = timedelta(minutes=30)
+
+
+def test_signed_token_round_trip_return_successful(
+        first_test_user: 'User', django_assert_num_queries: 'DjangoAssertNumQueries'
+) -> None:
+
+    """
+    Test that a signed token is issued without writing to the database,
+    verified without any query and resolves to its user.
+    """
+
+    with django_assert_num_queries(0):
+        token = TokenService.generate_signed_token(first_test_user, PURPOSE)
+        user_id = TokenService.unsign_token(token, PURPOSE, MAX_AGE)
+
+    assert user_id == first_test_user.pk
+    assert not OutstandingToken.objects.exists()
+    assert TokenService.validate_signed_token(token, PURPOSE, MAX_AGE) == first_test_user
+
+
+@pytest.mark.parametrize("mutation", ["purpose", "expired", "tampered"])
+def test_signed_token_invalid_return_error(first_test_user: 'User', mutation: str) -> None:
+
+    """
+    Test that signed tokens are rejected when used for another purpose,
+    after their maximum age, or when they were tampered with.
+    """
+
+    token = TokenService.generate_signed_token(first_test_user, PURPOSE)
+    purpose, max_age = PURPOSE, MAX_AGE
+
+    if mutation == "purpose":
+        purpose = "password-reset"
+    elif mutation == "expired":
+        max_age = timedelta(seconds=-1)
+    else:
+        token = token[:-1] + ("A" if token[-1] != "A" else "B")
+
+    with pytest.raises(ApplicationError, match="Invalid or expired token"):
+        TokenService.validate_signed_token(token, purpose, max_age)
+
+
+def test_jwt_token_round_trip_return_successful(first_test_user: 'User') -> None:
+
+    """
+    Test that the JWT path used for API authentication keeps working.
+    """
+
+    token = TokenService.generate_jwt_token(first_test_user, token_type='access')
+
+    assert TokenService.validate_token(token=token, max_age=MAX_AGE) == first_test_user
+    assert OutstandingToken.objects.filter(user=first_test_user).exists()
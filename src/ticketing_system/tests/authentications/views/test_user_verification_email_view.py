@@ -17,6 +17,7 @@ pytestmark = pytest.mark.django_db
 
 User = get_user_model()
 
+
 def user_verification_email_url(user: 'User') -> str:
 
     """
@@ -26,13 +27,12 @@ def user_verification_email_url(user: 'User') -> str:
         user (User): The user for whom the verification URL is generated.
 
     Returns:
-        str: The generated URL containing a JWT token.
+        str: The generated URL containing a signed token.
     """
 
-    return TokenService.generate_url_with_token(
+    return TokenService.generate_url_with_signed_token(
         user=user,
-        token_type='access',
-        expiry=settings.DEFAULT_REGISTRATION_EMAIL_JWT_MAX_AGE,
+        purpose=settings.DEFAULT_REGISTRATION_EMAIL_TOKEN_PURPOSE,
         view_name='auth:verify-email'
     )
 
@@ -92,7 +92,7 @@ def test_get_request_user_verification_email_with_expired_token_return_error(
     Test that an expired or invalid token results in an error message.
 
     Steps:
-    - Mock `TokenService.validate_token` to raise an `ApplicationError`
+    - Mock `TokenService.validate_signed_token` to raise an `ApplicationError`
     indicating an expired token.
     - Generate a verification URL.
     - Send a GET request to the URL.
@@ -101,7 +101,7 @@ def test_get_request_user_verification_email_with_expired_token_return_error(
 
     # Mock token age validation
     mocker.patch(
-        'ticketing_system.authentication.views.TokenService.validate_token',
+        'ticketing_system.authentication.views.TokenService.validate_signed_token',
         side_effect=ApplicationError("Invalid or expired token")
     )
 
@@ -122,14 +122,14 @@ def test_get_request_user_verification_email_missing_user_return_error(
     Test that a request with a token for a non-existent user results in an error message.
 
     Steps:
-    - Mock `TokenService.validate_token` to raise a `User.DoesNotExist` exception.
+    - Mock `TokenService.validate_signed_token` to raise a `User.DoesNotExist` exception.
     - Generate a verification URL.
     - Send a GET request to the URL.
     - Check if the response contains an error message indicating the user was not found.
     """
 
     mocker.patch(
-        "ticketing_system.authentication.token_service.TokenService.validate_token",
+        "ticketing_system.authentication.token_service.TokenService.validate_signed_token",
         side_effect=User.DoesNotExist
     )
 
@@ -0,0 +1,68 @@
+import threading
+from unittest.mock import Mock
+
+import pytest
+from django.core.cache import cache
+
+from ticketing_system.core.cache import (
+    bump_cache_version, cache_get_or_compute, versioned_cache_key
+)
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_cache_get_or_compute_compute_once_return_successful() -> None:
+
+    """
+    Test that a cached value is computed on the first call only.
+    """
+
+    compute = Mock(return_value=42)
+
+    assert cache_get_or_compute(key="answer", compute=compute, timeout=60) == 42
+    assert cache_get_or_compute(key="answer", compute=compute, timeout=60) == 42
+    compute.assert_called_once()
+
+
+def test_cache_get_or_compute_wait_for_lock_holder_return_successful() -> None:
+
+    """
+    Test that a caller missing the cache while another caller holds the
+    recomputation lock waits for that value instead of computing it again.
+    """
+
+    cache.add("answer:lock", 1, timeout=10)
+    threading.Timer(0.1, lambda: cache.set("answer", 42)).start()
+
+    compute = Mock(return_value=0)
+
+    assert cache_get_or_compute(key="answer", compute=compute, timeout=60, wait=2) == 42
+    compute.assert_not_called()
+
+
+def test_cache_get_or_compute_lock_holder_timeout_return_successful() -> None:
+
+    """
+    Test that a waiting caller computes the value itself when the lock
+    holder does not deliver in time.
+    """
+
+    cache.add("answer:lock", 1, timeout=10)
+    compute = Mock(return_value=42)
+
+    assert cache_get_or_compute(key="answer", compute=compute, timeout=60, wait=0.1) == 42
+    compute.assert_called_once()
+
+
+def test_bump_cache_version_change_versioned_key_return_successful() -> None:
+
+    """
+    Test that bumping a namespace version moves its keys to new ones.
+    """
+
+    key_before = versioned_cache_key(namespace="tests", key="value")
+    bump_cache_version(namespace="tests")
+    key_after = versioned_cache_key(namespace="tests", key="value")
+
+    assert key_before != key_after
@@ -0,0 +1,56 @@
+from datetime import timedelta
+from http import HTTPStatus
+from typing import TYPE_CHECKING, List
+
+import pytest
+from django.contrib.messages import get_messages
+from django.urls import reverse
+from django.utils import timezone
+
+from ticketing_system.emails.models import Email
+from ticketing_system.tests.factories.email_factories import EmailFactory
+
+if TYPE_CHECKING:
+    from django.core.mail import EmailMessage
+    from django.test import Client
+    from ticketing_system.users.models import User
+
+
+pytestmark = pytest.mark.django_db
+
+
+EMAIL_CHANGELIST_URL = reverse('admin:emails_email_changelist')
+
+
+def test_post_request_email_admin_send_action_return_successful(
+        client: 'Client', first_test_superuser: 'User', mailoutbox: List['EmailMessage']
+) -> None:
+
+    """
+    Test that the send action sends the selected emails right away, also a
+    failed email whose retry is scheduled for later, and reports the
+    emails it skipped.
+    """
+
+    scheduled_retry = EmailFactory(
+        status=Email.Status.FAILED, attempts=1,
+        next_attempt_at=timezone.now() + timedelta(hours=1)
+    )
+    ready_email = EmailFactory(status=Email.Status.READY)
+    sent_email = EmailFactory(status=Email.Status.SENT)
+    client.force_login(first_test_superuser)
+
+    response = client.post(path=EMAIL_CHANGELIST_URL, data={
+        'action': 'send_email',
+        '_selected_action': [scheduled_retry.id, ready_email.id, sent_email.id],
+    })
+    assert response.status_code == HTTPStatus.FOUND
+
+    assert {message.to[0] for message in mailoutbox} == {
+        scheduled_retry.to_email, ready_email.to_email
+    }
+    assert Email.objects.filter(status=Email.Status.SENT).count() == 3
+
+    admin_messages = [m.message for m in get_messages(response.wsgi_request)]
+    assert "Sent 2 of the selected emails." in admin_messages
+    assert any(message.startswith("Skipped 1 ") for message in admin_messages)
@@ -0,0 +1,165 @@
+from datetime import timedelta
+from typing import List, TYPE_CHECKING
+
+import pytest
+from django.core.mail import get_connection
+from django.core.management import call_command
+from django.utils import timezone
+
+from ticketing_system.core.exceptions import ApplicationError
+from ticketing_system.emails.models import Email
+from ticketing_system.emails.services import email_claim, email_send_all
+from ticketing_system.tests.factories.email_factories import EmailFactory
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture  # For typing the `mocker` fixture
+    from django.core.mail import EmailMessage
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_email_claim_service_return_successful() -> None:
+
+    """
+    Verify that only `READY` emails are claimed, at most `batch_size` of them,
+    and that a claimed email is never handed out twice.
+    """
+
+    ready_emails = EmailFactory.create_batch(3, status=Email.Status.READY)
+    EmailFactory(status=Email.Status.SENT)
+
+    first_batch = email_claim(batch_size=2)
+    assert [email.id for email in first_batch] == [email.id for email in ready_emails[:2]]
+    assert all(email.status == Email.Status.SENDING for email in first_batch)
+
+    second_batch = email_claim(batch_size=2)
+    assert [email.id for email in second_batch] == [ready_emails[2].id]
+
+    assert email_claim(batch_size=2) == []
+
+
+def test_email_claim_service_reclaim_stale_sending_emails(settings) -> None:
+
+    """
+    Verify that a claim lasts `EMAIL_SENDING_LEASE` seconds, and that emails
+    left `SENDING` by a worker that died are claimed again once it expired.
+    """
+
+    settings.EMAIL_SENDING_LEASE = 600
+    now = timezone.now()
+    email = EmailFactory(status=Email.Status.READY)
+
+    [claimed_email] = email_claim(batch_size=10)
+    assert claimed_email.status == Email.Status.SENDING
+    assert claimed_email.next_attempt_at >= now + timedelta(seconds=600)
+    assert email_claim(batch_size=10) == []
+
+    # The worker died mid-send and its claim expired.
+    Email.objects.filter(id=email.id).update(next_attempt_at=now - timedelta(seconds=1))
+
+    assert [email.id for email in email_claim(batch_size=10)] == [email.id]
+
+
+def test_email_send_all_service_return_successful(
+        mailoutbox: List['EmailMessage'], mocker: 'MockerFixture'
+) -> None:
+
+    """
+    Verify that a batch is sent over a single backend connection and that
+    the statuses of sent and failed emails are written back.
+    """
+
+    emails = EmailFactory.create_batch(3, status=Email.Status.READY)
+    get_connection_spy = mocker.patch(
+        'ticketing_system.emails.services.get_connection',
+        wraps=get_connection
+    )
+
+    sent_emails = email_send_all(emails=email_claim(batch_size=10))
+
+    assert get_connection_spy.call_count == 1
+    assert len(mailoutbox) == 3
+    assert {message.to[0] for message in mailoutbox} == {email.to_email for email in emails}
+    assert all(email.status == Email.Status.SENT for email in sent_emails)
+    assert Email.objects.filter(status=Email.Status.SENT, sent_at__isnull=False).count() == 3
+
+
+def test_email_send_all_service_with_failure_return_partial(
+        mailoutbox: List['EmailMessage'], mocker: 'MockerFixture'
+) -> None:
+
+    """
+    Verify that a failing email is marked as `FAILED` without
+    preventing the rest of the batch from being sent.
+    """
+
+    failing_email, healthy_email = EmailFactory.create_batch(2, status=Email.Status.READY)
+
+    backend_send = mocker.patch(
+        'django.core.mail.backends.locmem.EmailBackend.send_messages',
+        side_effect=[Exception("SMTP Error"), 1]
+    )
+
+    email_send_all(emails=email_claim(batch_size=10))
+
+    assert backend_send.call_count == 2
+    failing_email.refresh_from_db()
+    healthy_email.refresh_from_db()
+    assert failing_email.status == Email.Status.FAILED
+    assert healthy_email.status == Email.Status.SENT
+
+
+def test_email_send_all_service_with_lost_claim_return_partial(
+        mailoutbox: List['EmailMessage']
+) -> None:
+
+    """
+    Verify that an email whose claim expired is not sent, and that the
+    result of an email reclaimed by another worker meanwhile is not written
+    over that worker's claim.
+    """
+
+    expired_email, reclaimed_email = EmailFactory.create_batch(2, status=Email.Status.READY)
+    expired_claim, reclaimed_claim = email_claim(batch_size=10)
+    expired_claim.next_attempt_at = timezone.now() - timedelta(seconds=1)
+
+    # Another worker took over the second email with a claim of its own.
+    other_lease = timezone.now() + timedelta(hours=1)
+    Email.objects.filter(id=reclaimed_email.id).update(next_attempt_at=other_lease)
+
+    email_send_all(emails=[expired_claim, reclaimed_claim])
+
+    assert [message.to[0] for message in mailoutbox] == [reclaimed_email.to_email]
+    reclaimed_email.refresh_from_db()
+    assert reclaimed_email.status == Email.Status.SENDING
+    assert reclaimed_email.next_attempt_at == other_lease
+    assert reclaimed_email.attempts == 0
+
+
+def test_email_send_all_service_with_invalid_status_return_error(
+        test_email_with_ready_status: 'Email'
+) -> None:
+
+    """
+    Verify that unclaimed emails are rejected.
+    """
+
+    with pytest.raises(ApplicationError):
+        email_send_all(emails=[test_email_with_ready_status])
+
+
+def test_send_queued_emails_command_return_successful(
+        mailoutbox: List['EmailMessage']
+) -> None:
+
+    """
+    Verify that the outbox worker drains the queue in batches and exits with `--once`.
+    """
+
+    EmailFactory.create_batch(5, status=Email.Status.READY)
+
+    call_command("send_queued_emails", "--once", "--batch-size", "2")
+
+    assert len(mailoutbox) == 5
+    assert not Email.objects.exclude(status=Email.Status.SENT).exists()
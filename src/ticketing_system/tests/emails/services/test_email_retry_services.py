@@ -0,0 +1,122 @@
+from datetime import timedelta
+from typing import List, TYPE_CHECKING
+
+import pytest
+from django.utils import timezone
+
+from ticketing_system.emails.models import Email
+from ticketing_system.emails.services import (
+    email_claim, email_failed, email_requeue, email_retry_delay, email_send_all
+)
+from ticketing_system.tests.factories.email_factories import EmailFactory
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture  # For typing the `mocker` fixture
+    from django.core.mail import EmailMessage
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_email_retry_delay_service_return_successful(settings) -> None:
+
+    """
+    Verify that the retry delay doubles per attempt, is capped,
+    and is jittered between half and all of the nominal delay.
+    """
+
+    settings.EMAIL_RETRY_BASE_DELAY = 60
+    settings.EMAIL_RETRY_MAX_DELAY = 600
+
+    for attempts, nominal in [(1, 60), (2, 120), (3, 240), (4, 480), (5, 600), (10, 600)]:
+        for _ in range(20):
+            delay = email_retry_delay(attempts=attempts).total_seconds()
+            assert nominal / 2 <= delay <= nominal
+
+
+def test_email_failed_service_schedule_retry_then_dead_letter(
+        test_email_with_sending_status: 'Email', settings
+) -> None:
+
+    """
+    Verify that failed attempts are scheduled for a retry in the future
+    until the maximum number of attempts is reached.
+    """
+
+    settings.EMAIL_RETRY_MAX_ATTEMPTS = 2
+
+    email = email_failed(email=test_email_with_sending_status, error="SMTP Error")
+    assert email.status == Email.Status.FAILED
+    assert email.attempts == 1
+    assert email.last_error == "SMTP Error"
+    assert email.next_attempt_at > timezone.now()
+
+    email.status = Email.Status.SENDING
+    email = email_failed(email=email, error="SMTP Error")
+    assert email.status == Email.Status.DEAD
+    assert email.attempts == 2
+
+
+def test_email_claim_service_pick_due_retries_only() -> None:
+
+    """
+    Verify that the worker picks up due retries, oldest first,
+    but neither future retries nor dead-lettered emails.
+    """
+
+    now = timezone.now()
+    due_retry = EmailFactory(
+        status=Email.Status.FAILED, attempts=1, next_attempt_at=now - timedelta(minutes=5)
+    )
+    ready_email = EmailFactory(status=Email.Status.READY, next_attempt_at=now - timedelta(minutes=1))
+    EmailFactory(status=Email.Status.FAILED, attempts=1, next_attempt_at=now + timedelta(minutes=5))
+    EmailFactory(status=Email.Status.DEAD, attempts=6, next_attempt_at=now - timedelta(hours=1))
+
+    claimed = email_claim(batch_size=10)
+    assert [email.id for email in claimed] == [due_retry.id, ready_email.id]
+
+
+def test_email_send_all_service_retry_until_sent(
+        mailoutbox: List['EmailMessage'], mocker: 'MockerFixture'
+) -> None:
+
+    """
+    Verify that a failed email is sent by a later batch once its retry is due.
+    """
+
+    email = EmailFactory(status=Email.Status.READY)
+
+    mocker.patch(
+        'django.core.mail.backends.locmem.EmailBackend.send_messages',
+        side_effect=Exception("SMTP Error")
+    )
+    email_send_all(emails=email_claim(batch_size=10))
+    mocker.stopall()
+
+    assert email_claim(batch_size=10) == []
+
+    Email.objects.filter(id=email.id).update(next_attempt_at=timezone.now())
+    email_send_all(emails=email_claim(batch_size=10))
+
+    email.refresh_from_db()
+    assert email.status == Email.Status.SENT
+    assert email.attempts == 2
+    assert len(mailoutbox) == 1
+
+
+def test_email_requeue_service_return_successful() -> None:
+
+    """
+    Verify that failed and dead emails are requeued with a fresh attempt counter.
+    """
+
+    dead_email = EmailFactory(status=Email.Status.DEAD, attempts=6)
+    sent_email = EmailFactory(status=Email.Status.SENT)
+
+    assert email_requeue(queryset=Email.objects.all()) == 1
+
+    dead_email.refresh_from_db()
+    sent_email.refresh_from_db()
+    assert dead_email.status == Email.Status.READY
+    assert dead_email.attempts == 0
+    assert sent_email.status == Email.Status.SENT
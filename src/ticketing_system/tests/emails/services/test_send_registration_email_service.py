@@ -34,12 +34,12 @@ def test_send_registration_email_return_successful(
 
     # Mock the token generation to return a fixed URL
     mocker.patch(
-        "ticketing_system.authentication.token_service.TokenService.generate_url_with_token",
+        "ticketing_system.authentication.token_service.TokenService.generate_url_with_signed_token",
         return_value="https://example.com/reset-password"
     )
 
     # Call the service
-    email = send_registration_email(user=first_test_user)
+    email = send_registration_email(user=first_test_user, synchronous=True)
 
     # Verify the email was sent
     assert len(mailoutbox) == 1
@@ -51,6 +51,28 @@ def test_send_registration_email_return_successful(
     assert "https://example.com/reset-password" in email.message
 
 
+def test_send_registration_email_queue_by_default_return_successful(
+        first_test_user: 'User', mocker: 'MockerFixture',
+        mailoutbox: List['EmailMessage']
+) -> None:
+
+    """
+    Test that by default the registration email is only queued in the
+    outbox and nothing is sent during the request.
+    """
+
+    mocker.patch(
+        "ticketing_system.authentication.token_service.TokenService.generate_url_with_signed_token",
+        return_value="https://example.com/reset-password"
+    )
+
+    email = send_registration_email(user=first_test_user)
+
+    assert len(mailoutbox) == 0
+    assert email.status == Email.Status.READY
+    assert "https://example.com/reset-password" in email.message
+
+
 def test_send_registration_email_with_invalid_email_return_error(
         first_test_user: 'User'
 ) -> None:
@@ -82,7 +104,7 @@ def test_send_registration_email_with_token_generation_failure_return_error(
 
     # Mock the token generation to raise an exception
     mocker.patch(
-        "ticketing_system.authentication.token_service.TokenService.generate_url_with_token",
+        "ticketing_system.authentication.token_service.TokenService.generate_url_with_signed_token",
         side_effect=Exception("Token generation failed")
     )
 
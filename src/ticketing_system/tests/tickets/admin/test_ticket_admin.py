@@ -0,0 +1,216 @@
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Dict
+
+import pytest
+from django.db import connection
+from django.urls import reverse
+
+from ticketing_system.ticket.models import Ticket, TicketCounterScope, TicketPriority, TicketStatus
+from ticketing_system.ticket.search import SQLITE_SEARCH_TABLE, apply_ticket_search
+from ticketing_system.ticket.selectors import get_ticket_counts, get_tickets_count
+from ticketing_system.ticket.services import create_ticket
+
+if TYPE_CHECKING:
+    from django.test import Client
+    from ticketing_system.users.models import Profile, User
+
+
+pytestmark = pytest.mark.django_db
+
+
+TICKET_CHANGELIST_URL = reverse('admin:ticket_ticket_changelist')
+TICKET_CHANGE_URL = lambda ticket_id: reverse('admin:ticket_ticket_change', args=[ticket_id])
+
+
+def _ticket_change_form_data(ticket: 'Ticket', **changes: Any) -> Dict[str, Any]:
+
+    """
+    Returns the POST data of the admin change form of a ticket, with the given changes.
+    """
+
+    data = {
+        'created_at_0': ticket.created_at.strftime('%Y-%m-%d'),
+        'created_at_1': ticket.created_at.strftime('%H:%M:%S'),
+        'created_by': ticket.created_by_id,
+        'assigned_to': ticket.assigned_to_id or '',
+        'subject': ticket.subject,
+        'description': ticket.description,
+        'status': ticket.status,
+        'priority': ticket.priority,
+        'lease_expires_at_0': '',
+        'lease_expires_at_1': '',
+    }
+    data.update(changes)
+    return data
+
+
+def test_get_request_ticket_admin_changelist_search_return_successful(
+        client: 'Client', first_test_superuser: 'User',
+        first_test_user_profile: 'Profile', second_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that the ticket changelist resolves ticket ids, creator emails
+    and full-text terms through their indexed lookups.
+    """
+
+    printer_ticket = create_ticket(
+        created_by=first_test_user_profile,
+        subject="Printer is broken",
+        description="The office printer does not print anymore."
+    )
+    password_ticket = create_ticket(
+        created_by=second_test_user_profile,
+        subject="Password reset",
+        description="I forgot my password."
+    )
+
+    client.force_login(first_test_superuser)
+
+    searches = [
+        (str(printer_ticket.ticket_id), [printer_ticket]),
+        (second_test_user_profile.user.email, [password_ticket]),
+        ("print", [printer_ticket]),
+        ("", [password_ticket, printer_ticket]),
+    ]
+    for search, expected_tickets in searches:
+        response = client.get(path=TICKET_CHANGELIST_URL, data={'q': search})
+        assert response.status_code == HTTPStatus.OK
+
+        result_list = response.context['cl'].result_list
+        assert {ticket.id for ticket in result_list} == {ticket.id for ticket in expected_tickets}
+
+
+def test_post_request_ticket_admin_bulk_actions_return_successful(
+        client: 'Client', first_test_admin_user_profile: 'Profile',
+        first_test_staff_user_profile: 'Profile', first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that the changelist actions assign and close the selected tickets.
+    """
+
+    tickets = [
+        create_ticket(created_by=first_test_user_profile, subject=f"Ticket {i}", description="-")
+        for i in range(3)
+    ]
+    selected = [str(ticket.pk) for ticket in tickets[:2]]
+
+    admin_user = first_test_admin_user_profile.user
+    admin_user.is_staff = admin_user.is_superuser = True
+    admin_user.save()
+    client.force_login(admin_user)
+
+    response = client.post(path=TICKET_CHANGELIST_URL, data={
+        'action': 'assign_tickets',
+        'assigned_to': first_test_staff_user_profile.id,
+        '_selected_action': selected,
+    })
+    assert response.status_code == HTTPStatus.FOUND
+    assert set(
+        Ticket.objects.filter(status=TicketStatus.IN_PROGRESS).values_list('pk', flat=True)
+    ) == {ticket.pk for ticket in tickets[:2]}
+
+    client.post(path=TICKET_CHANGELIST_URL, data={
+        'action': 'close_tickets', '_selected_action': selected,
+    })
+    assert set(
+        Ticket.objects.filter(status=TicketStatus.CLOSED).values_list('pk', flat=True)
+    ) == {ticket.pk for ticket in tickets[:2]}
+
+
+def test_post_request_ticket_admin_change_form_reindex_ticket_return_successful(
+        client: 'Client', first_test_superuser: 'User', first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that editing a ticket in the admin updates its full-text index
+    entry, and that deleting it removes the entry.
+    """
+
+    ticket = create_ticket(
+        created_by=first_test_user_profile, subject="Printer is broken", description="Paper jam"
+    )
+    client.force_login(first_test_superuser)
+
+    response = client.post(
+        path=TICKET_CHANGE_URL(ticket.pk),
+        data=_ticket_change_form_data(ticket, subject="Scanner is broken"),
+    )
+    assert response.status_code == HTTPStatus.FOUND
+
+    def _search(search: str):
+        return list(apply_ticket_search(queryset=Ticket.objects.all(), search=search))
+
+    assert _search("scanner") == [ticket]
+    assert _search("printer") == []
+
+    ticket_pk = ticket.pk
+    ticket.delete()
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT COUNT(*) FROM {SQLITE_SEARCH_TABLE} WHERE rowid = %s", [ticket_pk]
+            )
+            assert cursor.fetchone()[0] == 0
+
+
+def test_post_request_ticket_admin_add_form_count_ticket_return_successful(
+        client: 'Client', first_test_superuser: 'User', first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that a ticket added in the admin is counted in the ticket counters.
+    """
+
+    client.force_login(first_test_superuser)
+    response = client.post(
+        path=reverse('admin:ticket_ticket_add'),
+        data={
+            'created_at_0': '2024-01-01',
+            'created_at_1': '12:00:00',
+            'created_by': first_test_user_profile.pk,
+            'assigned_to': '',
+            'subject': "Added in the admin",
+            'description': "Admin ticket",
+            'status': TicketStatus.PENDING,
+            'priority': TicketPriority.MEDIUM,
+            'lease_expires_at_0': '',
+            'lease_expires_at_1': '',
+        },
+    )
+    assert response.status_code == HTTPStatus.FOUND
+
+    assert get_tickets_count()['pending_tickets_count'] == 1
+    assert get_ticket_counts(
+        scope=TicketCounterScope.CREATED, profile=first_test_user_profile
+    )['pending_tickets_count'] == 1
+
+
+def test_post_request_ticket_admin_change_form_ignore_status_and_assignee(
+        client: 'Client', first_test_superuser: 'User', first_test_user_profile: 'Profile',
+        first_test_staff_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that the change form cannot change the status or assignee of a
+    ticket past the ticket services.
+    """
+
+    ticket = create_ticket(
+        created_by=first_test_user_profile, subject="Printer is broken", description="Paper jam"
+    )
+    client.force_login(first_test_superuser)
+
+    response = client.post(
+        path=TICKET_CHANGE_URL(ticket.pk),
+        data=_ticket_change_form_data(
+            ticket, status=TicketStatus.CLOSED, assigned_to=first_test_staff_user_profile.pk
+        ),
+    )
+    assert response.status_code == HTTPStatus.FOUND
+
+    ticket.refresh_from_db()
+    assert ticket.status == TicketStatus.PENDING
+    assert ticket.assigned_to is None
+    assert get_tickets_count()['pending_tickets_count'] == 1
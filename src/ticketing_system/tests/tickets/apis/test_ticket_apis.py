@@ -0,0 +1,197 @@
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
+from ticketing_system.ticket.models import Ticket, TicketStatus
+from ticketing_system.ticket.services import create_ticket
+
+if TYPE_CHECKING:
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+TICKET_LIST_API_URL = reverse("api:v1:tickets:list")
+TICKET_DETAIL_API_URL = lambda ticket_id: reverse(
+    "api:v1:tickets:detail", kwargs={"ticket_id": ticket_id}
+)
+TICKET_ASSIGN_API_URL = lambda ticket_id: reverse(
+    "api:v1:tickets:assign", kwargs={"ticket_id": ticket_id}
+)
+TICKET_CLOSE_API_URL = lambda ticket_id: reverse(
+    "api:v1:tickets:close", kwargs={"ticket_id": ticket_id}
+)
+
+
+def _api_client(profile: 'Profile') -> APIClient:
+
+    """
+    Returns an API client authenticated with a JWT access token of the profile's user.
+    """
+
+    api_client = APIClient()
+    api_client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(profile.user).access_token}"
+    )
+    return api_client
+
+
+def test_get_request_ticket_list_api_return_successful(
+        first_test_user_profile: 'Profile', second_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that the list returns the user's tickets page by page, with the
+    default fields and without the description.
+    """
+
+    tickets = TicketFactory.create_batch(3, created_by=first_test_user_profile)
+    TicketFactory(created_by=second_test_user_profile)
+    api_client = _api_client(first_test_user_profile)
+
+    response = api_client.get(TICKET_LIST_API_URL, {'limit': 2})
+    assert response.status_code == HTTPStatus.OK
+
+    data = response.json()
+    assert len(data['results']) == 2
+    assert data['previous'] is None
+    assert 'description' not in data['results'][0]
+    assert data['results'][0]['creator_email'] == first_test_user_profile.user.email
+
+    next_page = api_client.get(data['next']).json()
+    assert next_page['next'] is None
+    assert {row['ticket_id'] for row in data['results'] + next_page['results']} == {
+        str(ticket.ticket_id) for ticket in tickets
+    }
+
+
+def test_get_request_ticket_list_api_with_sparse_fields_and_filters_return_successful(
+        first_test_admin_user_profile: 'Profile', django_assert_max_num_queries
+) -> None:
+
+    """
+    Test that only the requested fields are returned, that the filters and
+    the search apply, and that invalid parameters are rejected.
+    """
+
+    create_ticket(
+        created_by=first_test_admin_user_profile, subject="Printer broken", description="Paper jam"
+    )
+    closed = TicketFactory(status=TicketStatus.CLOSED, subject="Printer fixed")
+    api_client = _api_client(first_test_admin_user_profile)
+
+    # Authentication (user and profile) and the page itself.
+    with django_assert_max_num_queries(3):
+        response = api_client.get(
+            TICKET_LIST_API_URL, {'fields': 'ticket_id,status', 'status': TicketStatus.CLOSED}
+        )
+    assert response.json()['results'] == [
+        {'ticket_id': str(closed.ticket_id), 'status': TicketStatus.CLOSED}
+    ]
+
+    response = api_client.get(TICKET_LIST_API_URL, {'search': 'jam', 'fields': 'subject,description'})
+    assert response.json()['results'] == [
+        {'subject': "Printer broken", 'description': "Paper jam"}
+    ]
+
+    for params in [{'fields': 'subject,secret'}, {'status': 'unknown'}, {'cursor': 'broken'}]:
+        response = api_client.get(TICKET_LIST_API_URL, params)
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert 'detail' in response.json()
+
+
+def test_ticket_detail_and_create_apis_return_successful(
+        first_test_user_profile: 'Profile', second_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that a customer creates a ticket and reads it back, but cannot read
+    the tickets of others.
+    """
+
+    api_client = _api_client(first_test_user_profile)
+
+    response = api_client.post(
+        TICKET_LIST_API_URL, {'subject': "VPN down", 'description': "Cannot connect"}, format='json'
+    )
+    assert response.status_code == HTTPStatus.CREATED
+    ticket_id = response.json()['ticket_id']
+    assert response.json()['status'] == TicketStatus.PENDING
+
+    response = api_client.get(TICKET_DETAIL_API_URL(ticket_id), {'fields': 'description'})
+    assert response.json() == {'description': "Cannot connect"}
+
+    other_ticket = TicketFactory(created_by=second_test_user_profile)
+    response = api_client.get(TICKET_DETAIL_API_URL(other_ticket.ticket_id))
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+    response = api_client.post(TICKET_LIST_API_URL, {'subject': ""}, format='json')
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert set(response.json()['detail']) == {'subject', 'description'}
+
+    response = APIClient().get(TICKET_LIST_API_URL)
+    assert response.status_code == HTTPStatus.UNAUTHORIZED
+
+
+def test_ticket_assign_and_close_apis_return_successful(
+        first_test_admin_user_profile: 'Profile', first_test_staff_user_profile: 'Profile',
+        first_test_pending_ticket: 'Ticket'
+) -> None:
+
+    """
+    Test that an admin assigns and closes a ticket, that closing twice and
+    assigning as staff are rejected.
+    """
+
+    ticket_id = first_test_pending_ticket.ticket_id
+    api_client = _api_client(first_test_admin_user_profile)
+
+    response = api_client.post(
+        TICKET_ASSIGN_API_URL(ticket_id),
+        {'assigned_to': first_test_staff_user_profile.id}, format='json'
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['assignee_email'] == first_test_staff_user_profile.user.email
+    assert response.json()['status'] == TicketStatus.IN_PROGRESS
+
+    staff_client = _api_client(first_test_staff_user_profile)
+    response = staff_client.post(
+        TICKET_ASSIGN_API_URL(ticket_id),
+        {'assigned_to': first_test_staff_user_profile.id}, format='json'
+    )
+    assert response.status_code == HTTPStatus.FORBIDDEN
+
+    response = staff_client.post(TICKET_CLOSE_API_URL(ticket_id), format='json')
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()['status'] == TicketStatus.CLOSED
+
+    response = api_client.post(TICKET_CLOSE_API_URL(ticket_id), format='json')
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert response.json() == {'detail': ["Ticket is already closed."]}
+    assert Ticket.objects.get(ticket_id=ticket_id).status == TicketStatus.CLOSED
+
+
+def test_ticket_assign_api_with_inactive_staff_return_error(
+        first_test_admin_user_profile: 'Profile', first_test_staff_user_profile: 'Profile',
+        first_test_pending_ticket: 'Ticket'
+) -> None:
+
+    """
+    Test that a ticket cannot be assigned to a deactivated staff member.
+    """
+
+    staff_user = first_test_staff_user_profile.user
+    staff_user.is_active = False
+    staff_user.save(update_fields=['is_active'])
+
+    response = _api_client(first_test_admin_user_profile).post(
+        TICKET_ASSIGN_API_URL(first_test_pending_ticket.ticket_id),
+        {'assigned_to': first_test_staff_user_profile.id}, format='json'
+    )
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+    assert Ticket.objects.get(pk=first_test_pending_ticket.pk).assigned_to is None
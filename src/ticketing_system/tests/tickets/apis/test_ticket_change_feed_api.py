@@ -0,0 +1,113 @@
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+from django.urls import reverse
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
+from ticketing_system.ticket.models import TicketDeletion, TicketStatus
+from ticketing_system.ticket.services import close_ticket
+
+if TYPE_CHECKING:
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+TICKET_CHANGES_API_URL = reverse("api:v1:tickets:changes")
+
+
+def _api_client(profile: 'Profile') -> APIClient:
+
+    """
+    Returns an API client authenticated with a JWT access token of the profile's user.
+    """
+
+    api_client = APIClient()
+    api_client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {RefreshToken.for_user(profile.user).access_token}"
+    )
+    return api_client
+
+
+def test_get_request_ticket_change_feed_api_return_successful(
+        first_test_admin_user_profile: 'Profile', settings, django_assert_max_num_queries
+) -> None:
+
+    """
+    Test that the feed returns the changed tickets oldest first, page by
+    page, and that resuming from its cursor returns only later changes,
+    closed and deleted tickets included.
+    """
+
+    settings.TICKET_CHANGES_SETTLE_SECONDS = 0
+    first, second, third = TicketFactory.create_batch(3)
+    api_client = _api_client(first_test_admin_user_profile)
+
+    # Authentication (user and profile), the tickets and the tombstones.
+    with django_assert_max_num_queries(3):
+        response = api_client.get(TICKET_CHANGES_API_URL, {'limit': 2, 'fields': 'ticket_id'})
+    assert response.status_code == HTTPStatus.OK
+
+    data = response.json()
+    assert data['has_more'] is True
+    assert [(row['id'], row['ticket_id'], row['deleted']) for row in data['results']] == [
+        (first.id, str(first.ticket_id), False), (second.id, str(second.ticket_id), False),
+    ]
+    # The feed fields are kept even when `?fields=` leaves them out.
+    assert all(
+        set(row) == {'id', 'ticket_id', 'updated_at', 'deleted'} for row in data['results']
+    )
+
+    data = api_client.get(data['next']).json()
+    assert data['has_more'] is False
+    assert [(row['ticket_id'], row['deleted']) for row in data['results']] == [
+        (str(third.ticket_id), False)
+    ]
+
+    # Up to date: polling the same cursor again returns nothing new.
+    cursor = data['cursor']
+    data = api_client.get(TICKET_CHANGES_API_URL, {'cursor': cursor}).json()
+    assert data['results'] == []
+    assert data['cursor'] == cursor
+
+    close_ticket(user_profile=first_test_admin_user_profile, ticket=second)
+    third_pk, third_ticket_id = third.pk, third.ticket_id
+    third.delete()
+    assert TicketDeletion.objects.filter(ticket_id=third_ticket_id).exists()
+
+    results = api_client.get(TICKET_CHANGES_API_URL, {'cursor': cursor}).json()['results']
+    assert [(row['ticket_id'], row['deleted']) for row in results] == [
+        (str(second.ticket_id), False), (str(third_ticket_id), True)
+    ]
+    assert results[0]['status'] == TicketStatus.CLOSED
+    assert set(results[0]) >= {'id', 'ticket_id', 'updated_at', 'subject'}
+    assert set(results[1]) == {'id', 'ticket_id', 'updated_at', 'deleted'}
+    assert results[1]['id'] == third_pk
+
+
+def test_get_request_ticket_change_feed_api_return_error(
+        first_test_admin_user_profile: 'Profile', first_test_staff_user_profile: 'Profile',
+        settings
+) -> None:
+
+    """
+    Test that only admins read the feed, that malformed cursors are rejected
+    and that changes younger than the settle window are held back.
+    """
+
+    TicketFactory()
+
+    response = _api_client(first_test_staff_user_profile).get(TICKET_CHANGES_API_URL)
+    assert response.status_code == HTTPStatus.FORBIDDEN
+
+    api_client = _api_client(first_test_admin_user_profile)
+    response = api_client.get(TICKET_CHANGES_API_URL, {'cursor': 'broken'})
+    assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    settings.TICKET_CHANGES_SETTLE_SECONDS = 60
+    data = api_client.get(TICKET_CHANGES_API_URL).json()
+    assert data['results'] == []
+    assert data['cursor'] is None
@@ -0,0 +1,177 @@
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+
+from config.env import env_to_enum
+from config.settings.tickets import AutoAssignmentStrategy
+from ticketing_system.core.cache import get_cache_version, versioned_cache_key
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
+from ticketing_system.tests.factories.user_factories import UserProfileFactory
+from ticketing_system.ticket.assignment import (
+    AUTO_ASSIGNMENT_CACHE_NAMESPACE, AUTO_ASSIGNMENT_STRATEGIES, StaffWorkload,
+    pick_staff_for_ticket
+)
+from ticketing_system.ticket.models import TicketCounterScope, TicketPriority, TicketStatus
+from ticketing_system.ticket.selectors import get_ticket_counts
+from ticketing_system.ticket.services import create_ticket, rebuild_ticket_counters
+from ticketing_system.users.models import UserRole
+from ticketing_system.users.selectors import STAFF_ROSTER_CACHE_NAMESPACE
+
+if TYPE_CHECKING:
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def two_test_staff_user_profiles() -> list:
+
+    """
+    Fixture creating two staff profiles, the first one already working on
+    two medium priority tickets and the second one on one urgent ticket.
+    """
+
+    busy_staff, urgent_staff = UserProfileFactory.create_batch(2, role=UserRole.STAFF)
+    TicketFactory.create_batch(2, assigned_to=busy_staff, status=TicketStatus.IN_PROGRESS)
+    TicketFactory(
+        assigned_to=urgent_staff, status=TicketStatus.IN_PROGRESS, priority=TicketPriority.URGENT
+    )
+    rebuild_ticket_counters()
+    return [busy_staff, urgent_staff]
+
+
+def test_staff_workload_strategies_return_successful(two_test_staff_user_profiles: list) -> None:
+
+    """
+    Test the order in which every strategy hands out tickets.
+    """
+
+    busy_staff, urgent_staff = (profile.id for profile in two_test_staff_user_profiles)
+    staff_ids = [busy_staff, urgent_staff]
+
+    least_loaded = StaffWorkload(strategy='least_loaded', staff_ids=staff_ids)
+    assert [least_loaded.assign(priority=TicketPriority.MEDIUM) for _ in range(3)] == [
+        urgent_staff, busy_staff, urgent_staff
+    ]
+
+    # Weighted loads: 2 * medium (4) against 1 * urgent (5).
+    priority_aware = StaffWorkload(strategy='priority_aware', staff_ids=staff_ids)
+    assert [priority_aware.assign(priority=TicketPriority.MEDIUM) for _ in range(3)] == [
+        busy_staff, urgent_staff, busy_staff
+    ]
+
+    round_robin = StaffWorkload(strategy='round_robin', staff_ids=staff_ids)
+    assert [round_robin.assign(priority=TicketPriority.LOW) for _ in range(4)] == [
+        min(staff_ids), max(staff_ids), min(staff_ids), max(staff_ids)
+    ]
+
+    assert StaffWorkload(strategy='least_loaded', staff_ids=[]).assign(priority='low') is None
+
+
+@override_settings(TICKET_AUTO_ASSIGNMENT_STRATEGY='least_loaded')
+def test_create_ticket_service_with_auto_assignment_return_successful(
+        first_test_user_profile: 'Profile', two_test_staff_user_profiles: list,
+        django_assert_num_queries
+) -> None:
+
+    """
+    Test that new tickets are assigned to the least loaded staff member,
+    and that only the first assignment seeds the cached workload heap.
+    """
+
+    busy_staff, urgent_staff = two_test_staff_user_profiles
+
+    tickets = [
+        create_ticket(created_by=first_test_user_profile, subject="First", description="-")
+    ]
+    for _ in range(2):
+        # The workload heap is served from the cache, no roster or counter queries.
+        with django_assert_num_queries(0):
+            assert pick_staff_for_ticket(priority=TicketPriority.MEDIUM) is not None
+
+    assert tickets[0].status == TicketStatus.IN_PROGRESS
+    assert tickets[0].assigned_to_id == urgent_staff.id
+    assert get_ticket_counts(
+        scope=TicketCounterScope.ASSIGNED, profile=urgent_staff
+    )['in_progress_tickets_count'] == 2
+
+    # A deactivated staff member drops out of the roster and gets nothing.
+    urgent_staff.user.is_active = False
+    urgent_staff.user.save(update_fields=['is_active'])
+
+    tickets += [
+        create_ticket(created_by=first_test_user_profile, subject="Next", description="-")
+        for _ in range(2)
+    ]
+    assert Counter(ticket.assigned_to_id for ticket in tickets[1:]) == {busy_staff.id: 2}
+
+
+def test_create_ticket_service_without_auto_assignment_return_successful(
+        first_test_user_profile: 'Profile', first_test_staff_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that tickets stay pending while auto-assignment is disabled.
+    """
+
+    ticket = create_ticket(created_by=first_test_user_profile, subject="First", description="-")
+
+    assert ticket.status == TicketStatus.PENDING
+    assert ticket.assigned_to is None
+
+
+def test_pick_staff_for_ticket_wait_for_workload_lock_return_successful(
+        two_test_staff_user_profiles: list, settings
+) -> None:
+
+    """
+    Test that an assignment waits while another process holds the lock of
+    the workload heap and still records the assignment, so round robin keeps
+    rotating under concurrent ticket creation.
+    """
+
+    settings.CACHE_SINGLE_FLIGHT_WAIT = 0.2
+    staff_ids = sorted(profile.id for profile in two_test_staff_user_profiles)
+
+    def _pick() -> int:
+        return pick_staff_for_ticket(priority=TicketPriority.LOW, strategy='round_robin')
+
+    assert _pick() == staff_ids[0]
+
+    key = versioned_cache_key(
+        namespace=AUTO_ASSIGNMENT_CACHE_NAMESPACE,
+        key=f"round_robin:{get_cache_version(namespace=STAFF_ROSTER_CACHE_NAMESPACE)}",
+    )
+    cache.add(f"{key}:update", 1)
+    release = threading.Timer(0.05, cache.delete, args=[f"{key}:update"])
+    release.start()
+    try:
+        assert _pick() == staff_ids[1]
+    finally:
+        release.join()
+
+    # A lock that is never released delays the assignment but does not lose it.
+    cache.add(f"{key}:update", 1)
+    assert _pick() == staff_ids[0]
+    assert _pick() == staff_ids[1]
+
+
+def test_auto_assignment_strategy_setting_validation() -> None:
+
+    """
+    Test that the strategy names accepted by the settings are exactly the
+    implemented ones, and that an unknown name is rejected at settings load.
+    """
+
+    assert {
+        strategy.value for strategy in AutoAssignmentStrategy
+    } - {AutoAssignmentStrategy.DISABLED.value} == set(AUTO_ASSIGNMENT_STRATEGIES)
+
+    with pytest.raises(ImproperlyConfigured):
+        env_to_enum(AutoAssignmentStrategy, "fewest_tickets")
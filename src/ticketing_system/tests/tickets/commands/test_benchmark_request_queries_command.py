@@ -0,0 +1,33 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from ticketing_system.ticket.models import Ticket
+from ticketing_system.users.models import BaseUser
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_benchmark_request_queries_command_return_successful() -> None:
+
+    """
+    Test that the production session and message settings save queries
+    on the list and detail pages, and that the benchmark leaves no data behind.
+    """
+
+    stdout = StringIO()
+    call_command("benchmark_request_queries", "--requests", "2", stdout=stdout)
+
+    rows = {
+        line.split()[0]: [float(value) for value in line.split()[1:]]
+        for line in stdout.getvalue().splitlines()[1:]
+    }
+    for page in ("list", "detail"):
+        base, production, saved = rows[page]
+        assert production < base
+        assert saved == base - production
+
+    assert not Ticket.objects.exists()
+    assert not BaseUser.objects.exists()
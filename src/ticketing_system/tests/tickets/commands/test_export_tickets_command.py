@@ -0,0 +1,48 @@
+import gzip
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
+from ticketing_system.tests.factories.user_factories import UserProfileFactory
+from ticketing_system.users.models import UserRole
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_export_tickets_command_return_successful(tmp_path) -> None:
+
+    """
+    Test that the command writes the tickets visible to the given user into
+    a gzipped JSON Lines file.
+    """
+
+    staff = UserProfileFactory(role=UserRole.STAFF)
+    assigned = TicketFactory.create_batch(2, assigned_to=staff)
+    TicketFactory()
+    output = tmp_path / "tickets.jsonl.gz"
+
+    stdout = StringIO()
+    call_command(
+        "export_tickets", str(output), "--user", staff.user.email, "--format", "jsonl", "--gzip",
+        stdout=stdout,
+    )
+
+    assert f"bytes to {output}." in stdout.getvalue()
+    lines = gzip.decompress(output.read_bytes()).decode().splitlines()
+    assert [json.loads(line)['ticket_id'] for line in lines] == [
+        str(ticket.ticket_id) for ticket in assigned
+    ]
+
+
+def test_export_tickets_command_return_error(tmp_path) -> None:
+
+    """
+    Test that the command fails for an unknown user.
+    """
+
+    with pytest.raises(CommandError):
+        call_command("export_tickets", str(tmp_path / "tickets.csv"), "--user", "nobody@example.com")
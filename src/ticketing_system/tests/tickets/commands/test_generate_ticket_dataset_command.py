@@ -0,0 +1,57 @@
+from io import StringIO
+
+import pytest
+from django.contrib.auth import authenticate
+from django.core.management import CommandError, call_command
+from django.db.models import F
+
+from ticketing_system.ticket.models import Ticket, TicketStatus
+from ticketing_system.ticket.selectors import get_tickets_count
+from ticketing_system.users.models import Profile, UserRole
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_generate_ticket_dataset_command_return_successful() -> None:
+
+    """
+    Test that the command creates users who can log in and tickets with a
+    consistent status, assignee and timestamps, and rebuilds the counters.
+    """
+
+    stdout = StringIO()
+    call_command(
+        "generate_ticket_dataset", "--customers", "20", "--staff", "3", "--admins", "1",
+        "--tickets", "300", "--days", "60", "--batch-size", "100", "--seed", "7",
+        "--password", "Seed_passw0rd", stdout=stdout,
+    )
+
+    assert "Generated 24 users and 300 tickets" in stdout.getvalue()
+    assert Profile.objects.filter(role=UserRole.STAFF).count() == 3
+
+    staff = Profile.objects.filter(role=UserRole.STAFF).select_related('user').first()
+    assert authenticate(email=staff.user.email, password="Seed_passw0rd") == staff.user
+
+    assert Ticket.objects.count() == 300
+    assert not Ticket.objects.exclude(updated_at=F('created_at')).exists()
+    assert not Ticket.objects.filter(
+        status=TicketStatus.PENDING, assigned_to__isnull=False
+    ).exists()
+    assert not Ticket.objects.exclude(status=TicketStatus.PENDING).filter(
+        assigned_to__isnull=True
+    ).exists()
+    assert Ticket.objects.filter(status=TicketStatus.CLOSED).count() > 150
+
+    counts = get_tickets_count()
+    assert sum(counts.values()) == 300
+
+
+def test_generate_ticket_dataset_command_return_error() -> None:
+
+    """
+    Test that parallel generation is refused on SQLite.
+    """
+
+    with pytest.raises(CommandError, match="single writer"):
+        call_command("generate_ticket_dataset", "--workers", "2", stdout=StringIO())
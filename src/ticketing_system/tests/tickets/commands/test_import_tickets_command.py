@@ -0,0 +1,136 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
+from ticketing_system.tests.factories.user_factories import UserProfileFactory
+from ticketing_system.ticket import imports
+from ticketing_system.ticket.models import (
+    Ticket, TicketCounterScope, TicketPriority, TicketStatus
+)
+from ticketing_system.ticket.selectors import get_ticket_counts, search_user_tickets
+from ticketing_system.users.models import UserRole
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_import_tickets_command_return_successful(
+        tmp_path, first_test_admin_user_profile, django_assert_max_num_queries
+) -> None:
+
+    """
+    Test that exported tickets are imported back in batches, with their
+    creators, assignees and ids, and that they are searchable and counted.
+    """
+
+    customer = UserProfileFactory()
+    staff = UserProfileFactory(role=UserRole.STAFF)
+    TicketFactory.create_batch(
+        20, created_by=customer, assigned_to=staff, status=TicketStatus.IN_PROGRESS,
+        priority=TicketPriority.HIGH
+    )
+    TicketFactory(created_by=customer, subject="Mailbox quota exceeded")
+    ticket_ids = set(Ticket.objects.values_list('ticket_id', flat=True))
+
+    output = tmp_path / "tickets.csv.gz"
+    call_command(
+        "export_tickets", str(output), "--user", first_test_admin_user_profile.user.email,
+        "--gzip", stdout=StringIO(),
+    )
+    Ticket.objects.all().delete()
+
+    stdout = StringIO()
+    # Three queries per batch (insert and search index) plus the savepoints,
+    # the profile map and one UPDATE per touched counter and transaction: it
+    # depends on the number of batches and counters, not of tickets.
+    with django_assert_max_num_queries(35):
+        call_command(
+            "import_tickets", str(output), "--batch-size", "5", "--batches-per-transaction", "2",
+            stdout=stdout,
+        )
+
+    assert "Imported 21 tickets, skipped 0" in stdout.getvalue()
+    assert "10 tickets imported" in stdout.getvalue()
+    assert set(Ticket.objects.values_list('ticket_id', flat=True)) == ticket_ids
+    assert Ticket.objects.filter(assigned_to=staff, priority=TicketPriority.HIGH).count() == 20
+
+    assert search_user_tickets(user_profile=customer, search="quota").count() == 1
+    assert get_ticket_counts(scope=TicketCounterScope.ASSIGNED, profile=staff) == {
+        'pending_tickets_count': 0,
+        'in_progress_tickets_count': 20,
+        'closed_tickets_count': 0,
+    }
+
+
+def test_import_tickets_command_return_error(tmp_path) -> None:
+
+    """
+    Test that an invalid row stops the import, unless invalid rows are skipped.
+    """
+
+    customer = UserProfileFactory()
+    rows = [
+        {'subject': "Printer broken", 'creator_email': customer.user.email.upper()},
+        {'subject': "Lost password", 'creator_email': "nobody@example.com"},
+        {'subject': "VPN down", 'creator_email': customer.user.email, 'status': "archived"},
+    ]
+    path = tmp_path / "tickets.jsonl"
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+
+    with pytest.raises(CommandError, match="Row 2: Unknown creator 'nobody@example.com'."):
+        call_command("import_tickets", str(path), stdout=StringIO())
+    assert not Ticket.objects.exists()
+
+    stdout = StringIO()
+    call_command("import_tickets", str(path), "--skip-invalid", stdout=stdout)
+
+    assert "Imported 1 tickets, skipped 2" in stdout.getvalue()
+    assert Ticket.objects.get().created_by == customer
+
+
+def test_import_tickets_command_update_counters_per_transaction(tmp_path, mocker) -> None:
+
+    """
+    Test that imported tickets are added to the existing counters without
+    rebuilding them, and that the counters are only rebuilt when an import
+    fails after some transactions were committed.
+    """
+
+    customer = UserProfileFactory()
+    TicketFactory(created_by=customer, status=TicketStatus.PENDING)
+    rebuild_spy = mocker.spy(imports, 'rebuild_ticket_counters')
+
+    rows = [
+        {'subject': "Printer broken", 'creator_email': customer.user.email},
+        {
+            'subject': "VPN down", 'creator_email': customer.user.email,
+            'status': TicketStatus.CLOSED,
+        },
+        {'subject': "Lost password", 'creator_email': "nobody@example.com"},
+    ]
+    path = tmp_path / "tickets.jsonl"
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows[:2]))
+
+    call_command("import_tickets", str(path), stdout=StringIO())
+
+    assert rebuild_spy.call_count == 0
+    assert get_ticket_counts(scope=TicketCounterScope.CREATED, profile=customer) == {
+        'pending_tickets_count': 2,
+        'in_progress_tickets_count': 0,
+        'closed_tickets_count': 1,
+    }
+
+    path.write_text("".join(json.dumps(row) + "\n" for row in rows))
+    with pytest.raises(CommandError):
+        call_command(
+            "import_tickets", str(path), "--batch-size", "1", "--batches-per-transaction", "1",
+            stdout=StringIO(),
+        )
+
+    assert rebuild_spy.call_count == 1
+    assert get_ticket_counts(
+        scope=TicketCounterScope.CREATED, profile=customer
+    )['pending_tickets_count'] == 3
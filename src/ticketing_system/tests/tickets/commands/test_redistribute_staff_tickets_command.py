@@ -0,0 +1,77 @@
+from collections import Counter
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from ticketing_system.emails.models import Email
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
+from ticketing_system.tests.factories.user_factories import UserProfileFactory
+from ticketing_system.ticket.models import Ticket, TicketCounterScope, TicketPriority, TicketStatus
+from ticketing_system.ticket.selectors import get_ticket_counts
+from ticketing_system.ticket.services import rebuild_ticket_counters
+from ticketing_system.users.models import UserRole
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_redistribute_staff_tickets_command_return_successful() -> None:
+
+    """
+    Test that the tickets of a deactivated staff member are spread over the
+    remaining staff by workload, with their counters moved along.
+    """
+
+    leaving_staff, idle_staff, busy_staff = UserProfileFactory.create_batch(3, role=UserRole.STAFF)
+    TicketFactory.create_batch(
+        4, assigned_to=leaving_staff, status=TicketStatus.IN_PROGRESS,
+        priority=TicketPriority.HIGH
+    )
+    closed_ticket = TicketFactory(assigned_to=leaving_staff, status=TicketStatus.CLOSED)
+    TicketFactory.create_batch(2, assigned_to=busy_staff, status=TicketStatus.IN_PROGRESS)
+    rebuild_ticket_counters()
+
+    leaving_staff.user.is_active = False
+    leaving_staff.user.save(update_fields=['is_active'])
+
+    stdout = StringIO()
+    call_command("redistribute_staff_tickets", "--inactive", stdout=stdout)
+
+    assert "Moved 4 tickets from 1 staff members to 2 staff members." in stdout.getvalue()
+
+    assert Counter(
+        Ticket.objects.filter(status=TicketStatus.IN_PROGRESS).values_list('assigned_to', flat=True)
+    ) == {idle_staff.id: 3, busy_staff.id: 3}
+    assert Ticket.objects.get(id=closed_ticket.id).assigned_to_id == leaving_staff.id
+
+    assert get_ticket_counts(scope=TicketCounterScope.ASSIGNED, profile=leaving_staff) == {
+        'pending_tickets_count': 0,
+        'in_progress_tickets_count': 0,
+        'closed_tickets_count': 1,
+    }
+    assert get_ticket_counts(
+        scope=TicketCounterScope.ASSIGNED, profile=idle_staff
+    )['in_progress_tickets_count'] == 3
+    assert Email.objects.count() == 2
+
+    # Nothing left to move.
+    stdout = StringIO()
+    call_command("redistribute_staff_tickets", "--inactive", stdout=stdout)
+    assert "No matching staff members." in stdout.getvalue()
+
+
+def test_redistribute_staff_tickets_command_without_other_staff_return_error() -> None:
+
+    """
+    Test that the command fails without another active staff member.
+    """
+
+    staff = UserProfileFactory(role=UserRole.STAFF)
+    TicketFactory(assigned_to=staff, status=TicketStatus.IN_PROGRESS)
+
+    with pytest.raises(CommandError, match="no other active staff member"):
+        call_command("redistribute_staff_tickets", staff.user.email)
+
+    with pytest.raises(CommandError):
+        call_command("redistribute_staff_tickets")
@@ -0,0 +1,116 @@
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from django.http import QueryDict
+from django.utils import timezone
+
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
+from ticketing_system.ticket.filters import TicketFilter
+from ticketing_system.ticket.models import TicketPriority, TicketStatus
+from ticketing_system.ticket.selectors import get_user_ticket_rows
+
+if TYPE_CHECKING:
+    from pytest_django import DjangoAssertNumQueries
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+
+def _ticket_filter(*, user_profile: 'Profile', query: str) -> TicketFilter:
+    return TicketFilter(
+        QueryDict(query),
+        queryset=get_user_ticket_rows(user_profile=user_profile),
+        user_profile=user_profile,
+    )
+
+
+@pytest.fixture
+def faceted_tickets(first_test_staff_user_profile: 'Profile') -> None:
+
+    """
+    Create tickets over a mix of statuses, priorities and assignees.
+    """
+
+    TicketFactory.create_batch(
+        3, status=TicketStatus.PENDING, priority=TicketPriority.HIGH
+    )
+    TicketFactory.create_batch(
+        2, status=TicketStatus.IN_PROGRESS, priority=TicketPriority.HIGH,
+        assigned_to=first_test_staff_user_profile
+    )
+    TicketFactory(
+        status=TicketStatus.CLOSED, priority=TicketPriority.LOW,
+        assigned_to=first_test_staff_user_profile
+    )
+
+
+def test_ticket_filter_return_filtered_tickets(
+        first_test_admin_user_profile: 'Profile', first_test_staff_user_profile: 'Profile',
+        faceted_tickets: None
+) -> None:
+
+    """
+    Test that status, priority, assignee and date range filters are applied.
+    """
+
+    staff_id = first_test_staff_user_profile.id
+
+    assert _ticket_filter(
+        user_profile=first_test_admin_user_profile, query="status=pending"
+    ).qs.count() == 3
+    assert _ticket_filter(
+        user_profile=first_test_admin_user_profile, query="priority=high"
+    ).qs.count() == 5
+    assert _ticket_filter(
+        user_profile=first_test_admin_user_profile, query=f"assigned_to={staff_id}&priority=high"
+    ).qs.count() == 2
+    assert _ticket_filter(
+        user_profile=first_test_admin_user_profile, query="assigned_to=null"
+    ).qs.count() == 3
+
+    tomorrow = (timezone.now() + timedelta(days=1)).date().isoformat()
+    assert _ticket_filter(
+        user_profile=first_test_admin_user_profile, query=f"created_after={tomorrow}"
+    ).qs.count() == 0
+
+
+def test_ticket_filter_get_facet_counts_return_successful(
+        first_test_admin_user_profile: 'Profile', first_test_staff_user_profile: 'Profile',
+        faceted_tickets: None, django_assert_num_queries: 'DjangoAssertNumQueries'
+) -> None:
+
+    """
+    Test that all facet counts come from one query, and that each facet
+    honours the selections of the other facets but not its own.
+    """
+
+    ticket_filter = _ticket_filter(
+        user_profile=first_test_admin_user_profile, query="status=pending"
+    )
+    # Validating the form loads the (cached) staff roster for the assignee choices.
+    ticket_filter.form.is_valid()
+
+    with django_assert_num_queries(1):
+        counts = ticket_filter.get_facet_counts()
+
+    assert counts['status'] == {
+        TicketStatus.PENDING: 3, TicketStatus.IN_PROGRESS: 2, TicketStatus.CLOSED: 1
+    }
+    assert counts['priority'] == {TicketPriority.HIGH: 3}
+    assert counts['assigned_to'] == {None: 3}
+
+
+def test_ticket_filter_hide_assignee_filter_from_non_admins(
+        first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that only admins get the assignee filter and facet.
+    """
+
+    ticket_filter = _ticket_filter(user_profile=first_test_user_profile, query="")
+
+    assert 'assigned_to' not in ticket_filter.filters
+    assert [facet['name'] for facet in ticket_filter.get_facets()] == ['status', 'priority']
@@ -0,0 +1,72 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ticketing_system.ticket.models import TicketPriority
+from ticketing_system.ticket.selectors import (
+    TicketListRow, get_user_ticket_rows, to_ticket_list_rows
+)
+from ticketing_system.ticket.services import create_ticket
+
+if TYPE_CHECKING:
+    from pytest_django import DjangoAssertNumQueries
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_user_ticket_rows_selector_return_successful(
+        first_test_user_profile: 'Profile', second_test_user_profile: 'Profile',
+        django_assert_num_queries: 'DjangoAssertNumQueries'
+) -> None:
+
+    """
+    Test that the list projection fetches only the displayed columns
+    of the visible tickets into slotted rows, in a single query.
+    """
+
+    ticket = create_ticket(
+        created_by=first_test_user_profile,
+        subject="Printer is broken",
+        description="A very long description. " * 1000
+    )
+    create_ticket(
+        created_by=second_test_user_profile, subject="Not mine", description="Hidden."
+    )
+
+    with django_assert_num_queries(1):
+        rows = to_ticket_list_rows(get_user_ticket_rows(user_profile=first_test_user_profile))
+
+    assert len(rows) == 1
+    row = rows[0]
+    assert isinstance(row, TicketListRow)
+    assert not hasattr(row, '__dict__')
+    assert not hasattr(row, 'description')
+    assert row.ticket_id == ticket.ticket_id
+    assert row.subject == "Printer is broken"
+    assert row.creator_email == first_test_user_profile.user.email
+    assert row.get_priority_display() == TicketPriority(ticket.priority).label
+
+
+def test_get_user_ticket_rows_selector_with_search_return_successful(
+        first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that searching projects the matching tickets along with their rank.
+    """
+
+    create_ticket(
+        created_by=first_test_user_profile, subject="Printer is broken", description="No ink."
+    )
+    create_ticket(
+        created_by=first_test_user_profile, subject="Password reset", description="Forgot it."
+    )
+
+    rows = to_ticket_list_rows(
+        get_user_ticket_rows(user_profile=first_test_user_profile, search="printer")
+    )
+
+    assert [row.subject for row in rows] == ["Printer is broken"]
+    assert rows[0].search_rank > 0
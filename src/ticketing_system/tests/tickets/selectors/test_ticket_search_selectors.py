@@ -0,0 +1,135 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.management import call_command
+
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
+from ticketing_system.ticket import search
+from ticketing_system.ticket.selectors import search_user_tickets
+from ticketing_system.ticket.services import create_ticket
+
+if TYPE_CHECKING:
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_search_user_tickets_selector_return_matching_tickets(
+        first_test_admin_user_profile: 'Profile', first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that only tickets matching the search input are returned,
+    including prefix matches of partially typed words.
+    """
+
+    printer_ticket = create_ticket(
+        created_by=first_test_user_profile,
+        subject="Printer is broken",
+        description="The office printer does not print anymore."
+    )
+    create_ticket(
+        created_by=first_test_user_profile,
+        subject="Password reset",
+        description="I forgot my password."
+    )
+
+    tickets = search_user_tickets(user_profile=first_test_admin_user_profile, search="print")
+    assert [ticket.id for ticket in tickets] == [printer_ticket.id]
+
+    tickets = search_user_tickets(user_profile=first_test_admin_user_profile, search="printer broken")
+    assert [ticket.id for ticket in tickets] == [printer_ticket.id]
+
+    tickets = search_user_tickets(user_profile=first_test_admin_user_profile, search="scanner")
+    assert not tickets.exists()
+
+
+def test_search_user_tickets_selector_rank_subject_matches_first(
+        first_test_admin_user_profile: 'Profile', first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that tickets matching in the subject rank above tickets matching
+    only in the description.
+    """
+
+    description_ticket = create_ticket(
+        created_by=first_test_user_profile,
+        subject="Cannot log in",
+        description="Maybe related to the VPN outage."
+    )
+    subject_ticket = create_ticket(
+        created_by=first_test_user_profile,
+        subject="VPN outage",
+        description="Nobody can connect."
+    )
+
+    tickets = search_user_tickets(
+        user_profile=first_test_admin_user_profile, search="vpn"
+    ).order_by("-search_rank")
+    assert [ticket.id for ticket in tickets] == [subject_ticket.id, description_ticket.id]
+
+
+def test_search_user_tickets_selector_respect_role_scoping(
+        first_test_user_profile: 'Profile', second_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that customers only find matching tickets they created.
+    """
+
+    own_ticket = create_ticket(
+        created_by=first_test_user_profile,
+        subject="Invoice missing",
+        description="Where is my invoice?"
+    )
+    create_ticket(
+        created_by=second_test_user_profile,
+        subject="Invoice wrong",
+        description="The invoice total is wrong."
+    )
+
+    tickets = search_user_tickets(user_profile=first_test_user_profile, search="invoice")
+    assert [ticket.id for ticket in tickets] == [own_ticket.id]
+
+
+def test_rebuild_ticket_search_index_command_index_existing_tickets(
+        first_test_admin_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that tickets written without the services become searchable
+    after rebuilding the index.
+    """
+
+    ticket = TicketFactory(subject="Keyboard unresponsive")
+
+    tickets = search_user_tickets(user_profile=first_test_admin_user_profile, search="keyboard")
+    assert not tickets.exists()
+
+    call_command("rebuild_ticket_search_index")
+
+    tickets = search_user_tickets(user_profile=first_test_admin_user_profile, search="keyboard")
+    assert [t.id for t in tickets] == [ticket.id]
+
+
+def test_index_tickets_service_index_in_batches(
+        first_test_admin_user_profile: 'Profile', django_assert_max_num_queries, monkeypatch
+) -> None:
+
+    """
+    Test that more ids than `SEARCH_INDEX_BATCH_SIZE` are indexed in
+    several statements, so no statement exceeds the query parameter limit.
+    """
+
+    monkeypatch.setattr(search, "SEARCH_INDEX_BATCH_SIZE", 2)
+    tickets = TicketFactory.create_batch(5, subject="Keyboard unresponsive")
+
+    with django_assert_max_num_queries(6):
+        search.index_tickets(ticket_ids=[ticket.id for ticket in tickets])
+
+    tickets_found = search_user_tickets(
+        user_profile=first_test_admin_user_profile, search="keyboard"
+    )
+    assert {t.id for t in tickets_found} == {ticket.id for ticket in tickets}
@@ -0,0 +1,68 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from django.http import Http404
+
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
+from ticketing_system.ticket.selectors import get_ticket_detail, get_user_tickets
+
+if TYPE_CHECKING:
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_ticket_detail_selector_single_query_return_successful(
+        first_test_staff_user_profile: 'Profile', django_assert_num_queries
+) -> None:
+
+    """
+    Test that a visible ticket, its creator and its assignee are loaded
+    in a single query.
+    """
+
+    ticket = TicketFactory(assigned_to=first_test_staff_user_profile)
+
+    with django_assert_num_queries(1):
+        fetched_ticket = get_ticket_detail(
+            user_profile=first_test_staff_user_profile, ticket_id=ticket.ticket_id
+        )
+        assert fetched_ticket.created_by.user.email == ticket.created_by.user.email
+        assert fetched_ticket.assigned_to.user.email == first_test_staff_user_profile.user.email
+
+
+@pytest.mark.parametrize("role_fixture", ["first_test_staff_user_profile", "first_test_user_profile"])
+def test_get_ticket_detail_selector_not_visible_ticket_return_error(
+        role_fixture: str, request: pytest.FixtureRequest, django_assert_num_queries
+) -> None:
+
+    """
+    Test that staff and customers cannot fetch tickets outside their scope,
+    and that the denial costs a single query.
+    """
+
+    user_profile = request.getfixturevalue(role_fixture)
+    ticket = TicketFactory()
+
+    with django_assert_num_queries(1):
+        with pytest.raises(Http404):
+            get_ticket_detail(user_profile=user_profile, ticket_id=ticket.ticket_id)
+
+
+def test_get_user_tickets_selector_share_visibility_filter_return_successful(
+        first_test_admin_user_profile: 'Profile', first_test_staff_user_profile: 'Profile',
+        first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that the ticket list applies the same visibility rules as the detail lookup.
+    """
+
+    own_ticket = TicketFactory(created_by=first_test_user_profile)
+    assigned_ticket = TicketFactory(assigned_to=first_test_staff_user_profile)
+    TicketFactory()
+
+    assert get_user_tickets(user_profile=first_test_admin_user_profile).count() == 3
+    assert list(get_user_tickets(user_profile=first_test_staff_user_profile)) == [assigned_ticket]
+    assert list(get_user_tickets(user_profile=first_test_user_profile)) == [own_ticket]
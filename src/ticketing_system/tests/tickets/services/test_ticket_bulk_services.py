@@ -0,0 +1,137 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.exceptions import PermissionDenied, ValidationError
+
+from ticketing_system.emails.models import Email
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
+from ticketing_system.ticket.models import Ticket, TicketCounterScope, TicketStatus
+from ticketing_system.ticket.selectors import get_ticket_counts, get_tickets_count
+from ticketing_system.ticket.services import (
+    bulk_assign_tickets, bulk_close_tickets, rebuild_ticket_counters
+)
+
+if TYPE_CHECKING:
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_bulk_assign_tickets_service_return_successful(
+        first_test_admin_user_profile: 'Profile', first_test_staff_user_profile: 'Profile',
+        first_test_user_profile: 'Profile', django_assert_max_num_queries
+) -> None:
+
+    """
+    Test that the selected open tickets are assigned with batched counter
+    updates and a single notification email to the staff member.
+    """
+
+    pending_tickets = TicketFactory.create_batch(10, created_by=first_test_user_profile)
+    closed_ticket = TicketFactory(created_by=first_test_user_profile, status=TicketStatus.CLOSED)
+    rebuild_ticket_counters()
+
+    tickets = Ticket.objects.filter(id__in=[t.id for t in [*pending_tickets, closed_ticket]])
+
+    # The queries depend on the counter rows touched, not on the number of tickets.
+    with django_assert_max_num_queries(25):
+        count = bulk_assign_tickets(
+            user_profile=first_test_admin_user_profile,
+            tickets=tickets,
+            staff_profile=first_test_staff_user_profile,
+        )
+
+    assert count == 10
+    assert set(
+        Ticket.objects.filter(assigned_to=first_test_staff_user_profile).values_list('id', flat=True)
+    ) == {ticket.id for ticket in pending_tickets}
+    assert Ticket.objects.get(id=closed_ticket.id).assigned_to is None
+
+    assert get_tickets_count() == {
+        'pending_tickets_count': 0,
+        'in_progress_tickets_count': 10,
+        'closed_tickets_count': 1,
+    }
+    assert get_ticket_counts(
+        scope=TicketCounterScope.ASSIGNED, profile=first_test_staff_user_profile
+    )['in_progress_tickets_count'] == 10
+
+    email = Email.objects.get()
+    assert email.to_email == first_test_staff_user_profile.user.email
+    assert email.status == Email.Status.READY
+    assert all(ticket.subject in email.message for ticket in pending_tickets)
+
+
+def test_bulk_assign_tickets_service_with_invalid_users_return_error(
+        first_test_admin_user_profile: 'Profile', first_test_staff_user_profile: 'Profile',
+        first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that only admins may bulk assign, and only to staff users.
+    """
+
+    TicketFactory.create_batch(2)
+
+    with pytest.raises(PermissionDenied):
+        bulk_assign_tickets(
+            user_profile=first_test_staff_user_profile,
+            tickets=Ticket.objects.all(),
+            staff_profile=first_test_staff_user_profile,
+        )
+
+    with pytest.raises(ValidationError):
+        bulk_assign_tickets(
+            user_profile=first_test_admin_user_profile,
+            tickets=Ticket.objects.all(),
+            staff_profile=first_test_user_profile,
+        )
+
+    assert not Ticket.objects.filter(status=TicketStatus.IN_PROGRESS).exists()
+
+
+def test_bulk_close_tickets_service_return_successful(
+        first_test_staff_user_profile: 'Profile', first_test_user_profile: 'Profile',
+        second_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that a staff user only closes the selected tickets assigned to them
+    and that every creator gets one notification email.
+    """
+
+    assigned_tickets = [
+        *TicketFactory.create_batch(
+            2, created_by=first_test_user_profile, assigned_to=first_test_staff_user_profile,
+            status=TicketStatus.IN_PROGRESS
+        ),
+        TicketFactory(
+            created_by=second_test_user_profile, assigned_to=first_test_staff_user_profile,
+            status=TicketStatus.IN_PROGRESS
+        ),
+    ]
+    unassigned_ticket = TicketFactory(created_by=first_test_user_profile)
+    rebuild_ticket_counters()
+
+    count = bulk_close_tickets(user_profile=first_test_staff_user_profile, tickets=Ticket.objects.all())
+
+    assert count == 3
+    assert set(
+        Ticket.objects.filter(status=TicketStatus.CLOSED).values_list('id', flat=True)
+    ) == {ticket.id for ticket in assigned_tickets}
+    assert Ticket.objects.get(id=unassigned_ticket.id).status == TicketStatus.PENDING
+
+    assert get_ticket_counts(
+        scope=TicketCounterScope.CREATED, profile=first_test_user_profile
+    ) == {
+        'pending_tickets_count': 1,
+        'in_progress_tickets_count': 0,
+        'closed_tickets_count': 2,
+    }
+    assert sorted(Email.objects.values_list('to_email', flat=True)) == sorted([
+        first_test_user_profile.user.email, second_test_user_profile.user.email
+    ])
+
+    with pytest.raises(PermissionDenied):
+        bulk_close_tickets(user_profile=first_test_user_profile, tickets=Ticket.objects.all())
@@ -0,0 +1,199 @@
+from typing import TYPE_CHECKING
+
+import pytest
+
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
+from ticketing_system.ticket.models import Ticket, TicketCounter, TicketCounterScope, TicketStatus
+from ticketing_system.ticket.selectors import get_ticket_counts, get_tickets_count
+from ticketing_system.ticket.services import (
+    assign_ticket, close_ticket, create_ticket, rebuild_ticket_counters
+)
+
+if TYPE_CHECKING:
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_ticket_services_maintain_ticket_counters_return_successful(
+        first_test_user_profile: 'Profile', first_test_staff_user_profile: 'Profile',
+        first_test_admin_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that creating, assigning and closing tickets keeps the global,
+    created and assigned counters in sync.
+    """
+
+    first_ticket = create_ticket(
+        created_by=first_test_user_profile, subject="First", description="First ticket"
+    )
+    create_ticket(
+        created_by=first_test_user_profile, subject="Second", description="Second ticket"
+    )
+
+    assert get_tickets_count() == {
+        'pending_tickets_count': 2,
+        'in_progress_tickets_count': 0,
+        'closed_tickets_count': 0,
+    }
+
+    assign_ticket(ticket=first_ticket, staff_profile=first_test_staff_user_profile)
+
+    assert get_ticket_counts(
+        scope=TicketCounterScope.CREATED, profile=first_test_user_profile
+    ) == {
+        'pending_tickets_count': 1,
+        'in_progress_tickets_count': 1,
+        'closed_tickets_count': 0,
+    }
+    assert get_ticket_counts(
+        scope=TicketCounterScope.ASSIGNED, profile=first_test_staff_user_profile
+    )['in_progress_tickets_count'] == 1
+
+    close_ticket(user_profile=first_test_admin_user_profile, ticket=first_ticket)
+
+    assert get_tickets_count() == {
+        'pending_tickets_count': 1,
+        'in_progress_tickets_count': 0,
+        'closed_tickets_count': 1,
+    }
+    assert get_ticket_counts(
+        scope=TicketCounterScope.ASSIGNED, profile=first_test_staff_user_profile
+    ) == {
+        'pending_tickets_count': 0,
+        'in_progress_tickets_count': 0,
+        'closed_tickets_count': 1,
+    }
+
+
+def test_rebuild_ticket_counters_service_return_successful(
+        first_test_user_profile: 'Profile', first_test_staff_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that rebuilding the counters recomputes them from the tickets table,
+    discarding drifted values.
+    """
+
+    TicketFactory(created_by=first_test_user_profile, status=TicketStatus.PENDING)
+    TicketFactory(
+        created_by=first_test_user_profile, assigned_to=first_test_staff_user_profile,
+        status=TicketStatus.CLOSED
+    )
+    TicketCounter.objects.create(
+        scope=TicketCounterScope.GLOBAL, status=TicketStatus.IN_PROGRESS, count=42
+    )
+
+    rebuild_ticket_counters()
+
+    assert get_tickets_count() == {
+        'pending_tickets_count': 1,
+        'in_progress_tickets_count': 0,
+        'closed_tickets_count': 1,
+    }
+    assert get_ticket_counts(
+        scope=TicketCounterScope.CREATED, profile=first_test_user_profile
+    )['pending_tickets_count'] == 1
+    assert get_ticket_counts(
+        scope=TicketCounterScope.ASSIGNED, profile=first_test_staff_user_profile
+    )['closed_tickets_count'] == 1
+
+
+def test_get_tickets_count_selector_cached_until_status_transition(
+        first_test_user_profile: 'Profile', first_test_admin_user_profile: 'Profile',
+        django_assert_num_queries
+) -> None:
+
+    """
+    Test that the global counts are served from the cache and refreshed
+    after a ticket service changes a ticket status.
+    """
+
+    ticket = create_ticket(
+        created_by=first_test_user_profile, subject="Cached", description="Cached counts"
+    )
+    assert get_tickets_count()['pending_tickets_count'] == 1
+
+    with django_assert_num_queries(0):
+        assert get_tickets_count()['pending_tickets_count'] == 1
+
+    close_ticket(user_profile=first_test_admin_user_profile, ticket=ticket)
+
+    assert get_tickets_count() == {
+        'pending_tickets_count': 0,
+        'in_progress_tickets_count': 0,
+        'closed_tickets_count': 1,
+    }
+
+
+def test_delete_ticket_decrement_ticket_counters_return_successful(
+        first_test_user_profile: 'Profile', first_test_staff_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that deleting a ticket takes it out of the global, created and
+    assigned counters, and that deleting a profile with tickets succeeds
+    although its counters are deleted along with it.
+    """
+
+    kept_ticket = create_ticket(
+        created_by=first_test_user_profile, subject="Kept", description="Kept ticket"
+    )
+    deleted_ticket = create_ticket(
+        created_by=first_test_user_profile, subject="Deleted", description="Deleted ticket"
+    )
+    assign_ticket(ticket=deleted_ticket, staff_profile=first_test_staff_user_profile)
+    assert get_tickets_count()['in_progress_tickets_count'] == 1
+
+    deleted_ticket.delete()
+
+    assert get_tickets_count() == {
+        'pending_tickets_count': 1,
+        'in_progress_tickets_count': 0,
+        'closed_tickets_count': 0,
+    }
+    assert get_ticket_counts(
+        scope=TicketCounterScope.CREATED, profile=first_test_user_profile
+    )['in_progress_tickets_count'] == 0
+    assert get_ticket_counts(
+        scope=TicketCounterScope.ASSIGNED, profile=first_test_staff_user_profile
+    )['in_progress_tickets_count'] == 0
+
+    first_test_user_profile.delete()
+
+    assert not Ticket.objects.filter(pk=kept_ticket.pk).exists()
+    assert get_tickets_count()['pending_tickets_count'] == 0
+
+
+def test_save_ticket_outside_services_maintain_ticket_counters_return_successful(
+        first_test_user_profile: 'Profile', first_test_staff_user_profile: 'Profile',
+        django_assert_num_queries
+) -> None:
+
+    """
+    Test that tickets created and changed with plain `save()` calls, e.g. by
+    factories or the shell, are counted without rebuilding the counters.
+    """
+
+    ticket = TicketFactory(created_by=first_test_user_profile, status=TicketStatus.PENDING)
+    assert get_tickets_count()['pending_tickets_count'] == 1
+
+    ticket.status = TicketStatus.IN_PROGRESS
+    ticket.assigned_to = first_test_staff_user_profile
+    ticket.save()
+
+    assert get_tickets_count() == {
+        'pending_tickets_count': 0,
+        'in_progress_tickets_count': 1,
+        'closed_tickets_count': 0,
+    }
+    assert get_ticket_counts(
+        scope=TicketCounterScope.ASSIGNED, profile=first_test_staff_user_profile
+    )['in_progress_tickets_count'] == 1
+
+    # Saving fields that cannot move the ticket leaves the counters alone.
+    ticket.subject = "Renamed"
+    with django_assert_num_queries(1):
+        ticket.save(update_fields=['subject', 'updated_at'])
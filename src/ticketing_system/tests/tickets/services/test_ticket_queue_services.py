@@ -0,0 +1,181 @@
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.exceptions import PermissionDenied
+from django.utils import timezone
+
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
+from ticketing_system.tests.factories.user_factories import UserProfileFactory
+from ticketing_system.ticket.models import (
+    Ticket, TicketCounterScope, TicketPriority, TicketStatus
+)
+from ticketing_system.ticket.selectors import get_ticket_counts, get_tickets_count
+from ticketing_system.ticket.services import (
+    accept_ticket_claim, claim_next_ticket, rebuild_ticket_counters, release_ticket_claim
+)
+from ticketing_system.users.models import UserRole
+
+if TYPE_CHECKING:
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_claim_next_ticket_service_return_successful(
+        first_test_staff_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that claims hand out the highest priority, oldest unassigned
+    tickets first, with a lease, and skip assigned and closed tickets.
+    """
+
+    now = timezone.now()
+    old_low = TicketFactory(priority=TicketPriority.LOW, created_at=now - timedelta(days=3))
+    new_urgent = TicketFactory(priority=TicketPriority.URGENT, created_at=now)
+    old_urgent = TicketFactory(priority=TicketPriority.URGENT, created_at=now - timedelta(days=1))
+    TicketFactory(priority=TicketPriority.URGENT, status=TicketStatus.CLOSED)
+    TicketFactory(
+        priority=TicketPriority.URGENT, status=TicketStatus.IN_PROGRESS,
+        assigned_to=UserProfileFactory(role=UserRole.STAFF)
+    )
+    rebuild_ticket_counters()
+
+    claimed = [
+        claim_next_ticket(staff_profile=first_test_staff_user_profile) for _ in range(4)
+    ]
+
+    assert [ticket.id if ticket else None for ticket in claimed] == [
+        old_urgent.id, new_urgent.id, old_low.id, None
+    ]
+    assert all(ticket.assigned_to == first_test_staff_user_profile for ticket in claimed[:3])
+    assert all(ticket.status == TicketStatus.IN_PROGRESS for ticket in claimed[:3])
+    assert all(ticket.lease_expires_at > now for ticket in claimed[:3])
+
+    assert get_ticket_counts(
+        scope=TicketCounterScope.ASSIGNED, profile=first_test_staff_user_profile
+    )['in_progress_tickets_count'] == 3
+    assert get_tickets_count()['pending_tickets_count'] == 0
+
+
+def test_claim_next_ticket_service_with_expired_lease_return_successful(
+        first_test_staff_user_profile: 'Profile', first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that an abandoned claim is handed to the next claimer, while
+    accepted claims and running leases are kept.
+    """
+
+    absent_staff = UserProfileFactory(role=UserRole.STAFF)
+    now = timezone.now()
+
+    abandoned = TicketFactory(
+        status=TicketStatus.IN_PROGRESS, assigned_to=absent_staff,
+        lease_expires_at=now - timedelta(minutes=1)
+    )
+    TicketFactory(
+        status=TicketStatus.IN_PROGRESS, assigned_to=absent_staff,
+        lease_expires_at=now + timedelta(minutes=10)
+    )
+    TicketFactory(status=TicketStatus.IN_PROGRESS, assigned_to=absent_staff)
+    rebuild_ticket_counters()
+
+    ticket = claim_next_ticket(staff_profile=first_test_staff_user_profile)
+
+    assert ticket.id == abandoned.id
+    assert ticket.assigned_to == first_test_staff_user_profile
+    assert claim_next_ticket(staff_profile=first_test_staff_user_profile) is None
+
+    assert get_ticket_counts(
+        scope=TicketCounterScope.ASSIGNED, profile=absent_staff
+    )['in_progress_tickets_count'] == 2
+
+    with pytest.raises(PermissionDenied):
+        claim_next_ticket(staff_profile=first_test_user_profile)
+
+
+def test_accept_and_release_ticket_claim_services_return_successful(
+        first_test_staff_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that an accepted claim loses its lease, and that a released claim
+    goes back to the queue.
+    """
+
+    other_staff = UserProfileFactory(role=UserRole.STAFF)
+    TicketFactory.create_batch(2)
+    rebuild_ticket_counters()
+
+    accepted = claim_next_ticket(staff_profile=first_test_staff_user_profile)
+    released = claim_next_ticket(staff_profile=first_test_staff_user_profile)
+
+    assert not accept_ticket_claim(staff_profile=other_staff, ticket=accepted)
+    assert accept_ticket_claim(staff_profile=first_test_staff_user_profile, ticket=accepted)
+    assert accepted.lease_expires_at is None
+    assert not release_ticket_claim(staff_profile=first_test_staff_user_profile, ticket=accepted)
+
+    assert release_ticket_claim(staff_profile=first_test_staff_user_profile, ticket=released)
+    released = Ticket.objects.get(id=released.id)
+    assert released.status == TicketStatus.PENDING
+    assert released.assigned_to is None
+    assert released.lease_expires_at is None
+
+    assert claim_next_ticket(staff_profile=other_staff).id == released.id
+    assert get_tickets_count() == {
+        'pending_tickets_count': 0,
+        'in_progress_tickets_count': 2,
+        'closed_tickets_count': 0,
+    }
+
+
+def test_accept_ticket_claim_service_with_expired_lease_return_error(
+        first_test_staff_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that an expired claim cannot be accepted, so it stays in the queue
+    for the next claimer.
+    """
+
+    ticket = TicketFactory(
+        status=TicketStatus.IN_PROGRESS, assigned_to=first_test_staff_user_profile,
+        lease_expires_at=timezone.now() - timedelta(minutes=1)
+    )
+
+    assert not accept_ticket_claim(staff_profile=first_test_staff_user_profile, ticket=ticket)
+    assert ticket.lease_expires_at is not None
+
+    other_staff = UserProfileFactory(role=UserRole.STAFF)
+    assert claim_next_ticket(staff_profile=other_staff).id == ticket.id
+
+
+def test_release_ticket_claim_service_after_concurrent_accept_return_error(
+        first_test_staff_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that a claim accepted after the ticket was loaded is not released,
+    so an accepted ticket never goes back to the queue.
+    """
+
+    TicketFactory()
+    rebuild_ticket_counters()
+    claimed = claim_next_ticket(staff_profile=first_test_staff_user_profile)
+
+    # Another request accepts the claim after this one loaded the ticket.
+    accepted = Ticket.objects.get(id=claimed.id)
+    assert accept_ticket_claim(staff_profile=first_test_staff_user_profile, ticket=accepted)
+
+    assert not release_ticket_claim(staff_profile=first_test_staff_user_profile, ticket=claimed)
+    assert claimed.lease_expires_at is None
+
+    ticket = Ticket.objects.get(id=claimed.id)
+    assert ticket.status == TicketStatus.IN_PROGRESS
+    assert ticket.assigned_to == first_test_staff_user_profile
+    assert get_ticket_counts(
+        scope=TicketCounterScope.ASSIGNED, profile=first_test_staff_user_profile
+    )['in_progress_tickets_count'] == 1
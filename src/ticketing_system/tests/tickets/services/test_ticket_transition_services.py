@@ -0,0 +1,113 @@
+from typing import TYPE_CHECKING
+
+import pytest
+from django.core.exceptions import ValidationError
+
+from ticketing_system.ticket.models import Ticket, TicketStatus
+from ticketing_system.ticket.selectors import get_tickets_count
+from ticketing_system.ticket.services import (
+    assign_ticket, close_ticket, create_ticket, ticket_transition
+)
+
+if TYPE_CHECKING:
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_ticket_transition_service_return_successful(
+        first_test_user_profile: 'Profile', first_test_staff_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that a transition writes only the status, `updated_at` and the
+    given fields, and moves the ticket's counters.
+    """
+
+    ticket = create_ticket(
+        created_by=first_test_user_profile, subject="Printer", description="Broken"
+    )
+    ticket.subject = "Unsaved change"
+
+    assert ticket_transition(
+        ticket=ticket, transition='assign', assigned_to=first_test_staff_user_profile
+    )
+    assert ticket.status == TicketStatus.IN_PROGRESS
+
+    stored = Ticket.objects.get(id=ticket.id)
+    assert stored.status == TicketStatus.IN_PROGRESS
+    assert stored.assigned_to == first_test_staff_user_profile
+    assert stored.subject == "Printer"
+
+    assert get_tickets_count() == {
+        'pending_tickets_count': 0,
+        'in_progress_tickets_count': 1,
+        'closed_tickets_count': 0,
+    }
+
+
+def test_ticket_transition_service_with_concurrent_change_return_error(
+        first_test_user_profile: 'Profile', first_test_staff_user_profile: 'Profile',
+        first_test_admin_user_profile: 'Profile', django_assert_num_queries
+) -> None:
+
+    """
+    Test that of two transitions made from the same observed state only the
+    first one wins; the loser changes nothing and sees the winner's state.
+    """
+
+    ticket = create_ticket(
+        created_by=first_test_user_profile, subject="Printer", description="Broken"
+    )
+    first_copy = Ticket.objects.get(id=ticket.id)
+    second_copy = Ticket.objects.get(id=ticket.id)
+
+    close_ticket(user_profile=first_test_admin_user_profile, ticket=first_copy)
+
+    assert not ticket_transition(
+        ticket=second_copy, transition='assign', assigned_to=first_test_staff_user_profile
+    )
+    assert second_copy.status == TicketStatus.CLOSED
+    assert second_copy.assigned_to is None
+
+    # A transition from a status outside its sources is rejected without a query.
+    with django_assert_num_queries(0):
+        assert not ticket_transition(ticket=second_copy, transition='close')
+
+    with pytest.raises(ValidationError, match="Closed tickets cannot be assigned."):
+        assign_ticket(ticket=second_copy, staff_profile=first_test_staff_user_profile)
+
+    assert Ticket.objects.get(id=ticket.id).status == TicketStatus.CLOSED
+    assert get_tickets_count() == {
+        'pending_tickets_count': 0,
+        'in_progress_tickets_count': 0,
+        'closed_tickets_count': 1,
+    }
+
+
+def test_close_ticket_service_with_reassigned_ticket_return_error(
+        first_test_user_profile: 'Profile', first_test_staff_user_profile: 'Profile',
+        first_test_admin_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that a ticket reassigned since it was read is not closed on the
+    stale state, so the old assignee's counters stay correct.
+    """
+
+    ticket = create_ticket(
+        created_by=first_test_user_profile, subject="Printer", description="Broken"
+    )
+    stale_copy = Ticket.objects.get(id=ticket.id)
+
+    assign_ticket(ticket=ticket, staff_profile=first_test_staff_user_profile)
+
+    with pytest.raises(ValueError, match="changed in the meantime"):
+        close_ticket(user_profile=first_test_admin_user_profile, ticket=stale_copy)
+
+    assert stale_copy.status == TicketStatus.IN_PROGRESS
+    assert stale_copy.assigned_to_id == first_test_staff_user_profile.id
+
+    close_ticket(user_profile=first_test_admin_user_profile, ticket=stale_copy)
+    assert Ticket.objects.get(id=ticket.id).status == TicketStatus.CLOSED
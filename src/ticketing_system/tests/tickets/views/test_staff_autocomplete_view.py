@@ -0,0 +1,77 @@
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+from django.urls import reverse
+
+from ticketing_system.tests.factories.user_factories import BaseUserFactory, UserProfileFactory
+from ticketing_system.users.models import UserRole
+
+if TYPE_CHECKING:
+    from django.test import Client
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+
+STAFF_AUTOCOMPLETE_URL = reverse('tickets:staff-autocomplete')
+
+
+def test_get_request_staff_autocomplete_view_admin_user_return_successful(
+        client: 'Client', first_test_admin_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that an admin receives the staff members matching the search term.
+    """
+
+    alice = UserProfileFactory(
+        role=UserRole.STAFF, user=BaseUserFactory(email="alice@example.com", username="alice")
+    )
+    UserProfileFactory(
+        role=UserRole.STAFF, user=BaseUserFactory(email="bob@example.com", username="bob")
+    )
+
+    client.force_login(first_test_admin_user_profile.user)
+
+    response = client.get(path=STAFF_AUTOCOMPLETE_URL, data={'q': 'ali'})
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"results": [{"id": alice.id, "text": "alice@example.com"}]}
+
+
+def test_get_request_staff_autocomplete_view_reflect_profile_changes_return_successful(
+        client: 'Client', first_test_admin_user_profile: 'Profile',
+        first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that the cached roster is invalidated when a profile becomes staff.
+    """
+
+    client.force_login(first_test_admin_user_profile.user)
+
+    response = client.get(path=STAFF_AUTOCOMPLETE_URL)
+    assert response.json() == {"results": []}
+
+    first_test_user_profile.role = UserRole.STAFF
+    first_test_user_profile.save()
+
+    response = client.get(path=STAFF_AUTOCOMPLETE_URL)
+    assert response.json()["results"] == [
+        {"id": first_test_user_profile.id, "text": first_test_user_profile.user.email}
+    ]
+
+
+def test_get_request_staff_autocomplete_view_non_admin_user_return_error(
+        client: 'Client', first_test_staff_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that non-admin users cannot list staff members.
+    """
+
+    client.force_login(first_test_staff_user_profile.user)
+
+    response = client.get(path=STAFF_AUTOCOMPLETE_URL)
+    assert response.status_code == HTTPStatus.FORBIDDEN
@@ -166,4 +166,33 @@ def test_post_request_ticket_assignment_view_assigned_to_none_staff_return_error
     assert error_message in str([m.message for m in get_messages(response.wsgi_request)])
 
     first_test_pending_ticket.refresh_from_db()
-    assert first_test_pending_ticket.assigned_to is None
\ No newline at end of file
+    assert first_test_pending_ticket.assigned_to is None
+
+
+def test_post_request_ticket_assignment_view_assigned_to_inactive_staff_return_error(
+        client: 'Client', first_test_admin_user_profile: 'Profile',
+        first_test_staff_user_profile: 'Profile', first_test_pending_ticket: 'Ticket',
+) -> None:
+
+    """
+    Test that a ticket cannot be assigned to a deactivated staff member.
+    """
+
+    staff_user = first_test_staff_user_profile.user
+    staff_user.is_active = False
+    staff_user.save(update_fields=['is_active'])
+    client.force_login(first_test_admin_user_profile.user)
+
+    form_data = {
+        "assigned_to": first_test_staff_user_profile.pk
+    }
+    ticket_assignment_url = TICKET_ASSIGNMENT_URL(first_test_pending_ticket.ticket_id)
+    response = client.post(path=ticket_assignment_url, data=form_data)
+
+    assert response.status_code == HTTPStatus.FOUND
+
+    error_message = "'Invalid assignment form submission."
+    assert error_message in str([m.message for m in get_messages(response.wsgi_request)])
+
+    first_test_pending_ticket.refresh_from_db()
+    assert first_test_pending_ticket.assigned_to is None
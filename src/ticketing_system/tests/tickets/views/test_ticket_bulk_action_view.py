@@ -0,0 +1,99 @@
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+from django.contrib.messages import get_messages
+from django.urls import reverse
+
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
+from ticketing_system.ticket.models import Ticket, TicketStatus
+
+if TYPE_CHECKING:
+    from django.test import Client
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+TICKET_BULK_URL = reverse(viewname="tickets:bulk")
+
+
+def test_post_request_ticket_bulk_action_view_assign_return_successful(
+        client: 'Client', first_test_admin_user_profile: 'Profile',
+        first_test_staff_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that an admin can assign the selected tickets at once.
+    """
+
+    tickets = TicketFactory.create_batch(3)
+    client.force_login(first_test_admin_user_profile.user)
+
+    response = client.post(path=TICKET_BULK_URL, data={
+        'action': 'assign',
+        'assigned_to': first_test_staff_user_profile.id,
+        'ticket_ids': [str(ticket.ticket_id) for ticket in tickets[:2]],
+    })
+
+    assert response.status_code == HTTPStatus.FOUND
+    assert response.url == reverse("tickets:list")
+    assert Ticket.objects.filter(
+        assigned_to=first_test_staff_user_profile, status=TicketStatus.IN_PROGRESS
+    ).count() == 2
+    assert "2 ticket(s) assigned successfully." in [
+        m.message for m in get_messages(response.wsgi_request)
+    ]
+
+
+def test_post_request_ticket_bulk_action_view_by_staff_user_return_error(
+        client: 'Client', first_test_staff_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that a staff user cannot bulk assign, and that closing skips
+    tickets not assigned to them.
+    """
+
+    ticket = TicketFactory()
+    client.force_login(first_test_staff_user_profile.user)
+
+    response = client.post(path=TICKET_BULK_URL, data={
+        'action': 'assign',
+        'assigned_to': first_test_staff_user_profile.id,
+        'ticket_ids': [str(ticket.ticket_id)],
+    })
+    assert "You don't have permission to assign tickets." in [
+        m.message for m in get_messages(response.wsgi_request)
+    ]
+
+    client.post(path=TICKET_BULK_URL, data={'action': 'close', 'ticket_ids': [str(ticket.ticket_id)]})
+
+    ticket.refresh_from_db()
+    assert ticket.status == TicketStatus.PENDING
+    assert ticket.assigned_to is None
+
+
+def test_post_request_ticket_bulk_action_view_with_invalid_data_return_error(
+        client: 'Client', first_test_admin_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that an assignment without a staff member or with a malformed
+    ticket id is rejected.
+    """
+
+    ticket = TicketFactory()
+    client.force_login(first_test_admin_user_profile.user)
+
+    for data in [
+        {'action': 'assign', 'ticket_ids': [str(ticket.ticket_id)]},
+        {'action': 'close', 'ticket_ids': ['not-a-uuid']},
+    ]:
+        response = client.post(path=TICKET_BULK_URL, data=data)
+        assert "Invalid bulk action form submission." in [
+            m.message for m in get_messages(response.wsgi_request)
+        ]
+
+    ticket.refresh_from_db()
+    assert ticket.status == TicketStatus.PENDING
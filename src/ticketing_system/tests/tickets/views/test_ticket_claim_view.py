@@ -0,0 +1,80 @@
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+from django.urls import reverse
+
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
+from ticketing_system.ticket.models import Ticket, TicketStatus
+
+if TYPE_CHECKING:
+    from django.test import Client
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+TICKET_CLAIM_NEXT_URL = reverse(viewname="tickets:claim-next")
+TICKET_CLAIM_ACCEPT_URL = lambda ticket_id: reverse(
+    viewname="tickets:claim-accept", kwargs={"ticket_id": ticket_id}
+)
+TICKET_CLAIM_RELEASE_URL = lambda ticket_id: reverse(
+    viewname="tickets:claim-release", kwargs={"ticket_id": ticket_id}
+)
+
+
+def test_post_request_ticket_claim_views_return_successful(
+        client: 'Client', first_test_staff_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that a staff user claims, accepts and releases tickets of the work queue.
+    """
+
+    tickets = TicketFactory.create_batch(2)
+    client.force_login(first_test_staff_user_profile.user)
+
+    response = client.post(path=TICKET_CLAIM_NEXT_URL)
+    assert response.status_code == HTTPStatus.OK
+    claimed = response.json()
+    assert claimed["status"] == TicketStatus.IN_PROGRESS
+    assert claimed["lease_expires_at"] is not None
+    assert claimed["url"] == reverse("tickets:detail", kwargs={"ticket_id": claimed["ticket_id"]})
+
+    response = client.post(path=TICKET_CLAIM_ACCEPT_URL(claimed["ticket_id"]))
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["lease_expires_at"] is None
+
+    # An accepted claim can no longer be released.
+    response = client.post(path=TICKET_CLAIM_RELEASE_URL(claimed["ticket_id"]))
+    assert response.status_code == HTTPStatus.CONFLICT
+
+    second = client.post(path=TICKET_CLAIM_NEXT_URL).json()
+    response = client.post(path=TICKET_CLAIM_RELEASE_URL(second["ticket_id"]))
+    assert response.status_code == HTTPStatus.OK
+    assert Ticket.objects.get(ticket_id=second["ticket_id"]).status == TicketStatus.PENDING
+
+    client.post(path=TICKET_CLAIM_NEXT_URL)
+    response = client.post(path=TICKET_CLAIM_NEXT_URL)
+    assert response.status_code == HTTPStatus.NO_CONTENT
+    assert {str(ticket.ticket_id) for ticket in tickets} == {
+        claimed["ticket_id"], second["ticket_id"]
+    }
+
+
+def test_post_request_ticket_claim_next_view_by_non_staff_user_return_error(
+        client: 'Client', first_test_admin_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that only staff users can pull from the work queue.
+    """
+
+    ticket = TicketFactory()
+    client.force_login(first_test_admin_user_profile.user)
+
+    response = client.post(path=TICKET_CLAIM_NEXT_URL)
+    assert response.status_code == HTTPStatus.FORBIDDEN
+
+    ticket.refresh_from_db()
+    assert ticket.status == TicketStatus.PENDING
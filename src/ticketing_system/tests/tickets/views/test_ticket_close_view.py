@@ -118,3 +118,28 @@ def test_post_request_close_ticket_view_by_non_admin_user_return_error(
 
     error_message = "You do not have permission to close this ticket."
     assert error_message in str([m.message for m in get_messages(response.wsgi_request)])
+
+
+def test_post_request_close_ticket_view_by_not_assigned_staff_user_return_error(
+        client: 'Client', first_test_staff_user_profile: 'Profile',
+        first_test_in_progress_ticket: 'Ticket'
+) -> None:
+
+    """
+    Test that a staff user cannot close a ticket that is not assigned to them.
+
+    Steps:
+      - Log in as a staff user.
+      - Attempt to close a ticket assigned to nobody.
+      - Assert that the ticket is not found and remains unchanged.
+    """
+
+    staff_user = first_test_staff_user_profile.user
+    client.force_login(staff_user)
+
+    ticket_close_url = TICKET_CLOSE_URL(first_test_in_progress_ticket.ticket_id)
+    response = client.post(path=ticket_close_url, data={"closing_message": "Not mine."})
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+    first_test_in_progress_ticket.refresh_from_db()
+    assert first_test_in_progress_ticket.status == TicketStatus.IN_PROGRESS
@@ -2,8 +2,13 @@ from typing import TYPE_CHECKING
 from http import HTTPStatus
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
+from ticketing_system.tests.factories.user_factories import UserProfileFactory
+from ticketing_system.users.models import UserRole
+
 if TYPE_CHECKING:
     from django.test import Client
     from ticketing_system.users.models import Profile
@@ -154,3 +159,109 @@ def test_get_request_ticket_detail_view_customer_not_owner_return_error(
     url = TICKET_DETAIL_URL(first_test_pending_ticket.ticket_id)
     response = client.get(path=url)
     assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_get_request_ticket_detail_view_admin_constant_queries_return_successful(
+        client: 'Client', first_test_admin_user_profile: 'Profile',
+        first_test_pending_ticket: 'Ticket'
+) -> None:
+
+    """
+    Test that the admin detail page renders in the same number of queries
+    no matter how many staff members can be assigned.
+
+    Steps:
+      - Create one staff member and render the detail page twice (warm cache).
+      - Add ten more staff members and render the detail page twice again.
+      - Assert that the warm renders issued the same number of queries and
+        that the new staff members are offered in the assignment form.
+    """
+
+    UserProfileFactory(role=UserRole.STAFF)
+
+    admin_user = first_test_admin_user_profile.user
+    client.force_login(admin_user)
+    url = TICKET_DETAIL_URL(first_test_pending_ticket.ticket_id)
+
+    client.get(path=url)
+    with CaptureQueriesContext(connection) as small_team_queries:
+        client.get(path=url)
+
+    UserProfileFactory.create_batch(10, role=UserRole.STAFF)
+
+    response = client.get(path=url)
+    assert len(response.context["assignment_form"].fields["assigned_to"].choices) == 12
+
+    with CaptureQueriesContext(connection) as large_team_queries:
+        client.get(path=url)
+
+    assert len(large_team_queries) == len(small_team_queries)
+
+
+def test_get_request_ticket_detail_view_conditional_get_return_not_modified(
+        client: 'Client', first_test_admin_user_profile: 'Profile',
+        first_test_pending_ticket: 'Ticket'
+) -> None:
+
+    """
+    Test that an unchanged ticket is answered with `304 Not Modified`,
+    and that changes to the ticket or the staff roster get a full page.
+    """
+
+    client.force_login(first_test_admin_user_profile.user)
+    url = TICKET_DETAIL_URL(first_test_pending_ticket.ticket_id)
+
+    response = client.get(path=url)
+    etag = response['ETag']
+    assert response.status_code == HTTPStatus.OK
+
+    response = client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    UserProfileFactory(role=UserRole.STAFF)
+
+    response = client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+    etag = response['ETag']
+
+    first_test_pending_ticket.subject = "Updated subject"
+    first_test_pending_ticket.save()
+
+    response = client.get(path=url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_get_request_ticket_detail_view_cache_body_per_role_return_successful(
+        client: 'Client', first_test_admin_user_profile: 'Profile',
+        first_test_pending_ticket: 'Ticket'
+) -> None:
+
+    """
+    Test that the ticket body is served from the fragment cache until the
+    ticket's `updated_at` moves, and is not shared between viewer roles.
+    """
+
+    creator = first_test_pending_ticket.created_by
+    url = TICKET_DETAIL_URL(first_test_pending_ticket.ticket_id)
+
+    client.force_login(first_test_admin_user_profile.user)
+    response = client.get(path=url)
+    assert creator.user.email in response.content.decode()
+
+    type(first_test_pending_ticket).objects.filter(
+        id=first_test_pending_ticket.id
+    ).update(subject="Changed behind the cache")
+
+    response = client.get(path=url)
+    assert "Changed behind the cache" not in response.content.decode()
+
+    client.force_login(creator.user)
+    response = client.get(path=url)
+    assert creator.user.email not in response.content.decode()
+
+    first_test_pending_ticket.refresh_from_db()
+    first_test_pending_ticket.save()
+
+    client.force_login(first_test_admin_user_profile.user)
+    response = client.get(path=url)
+    assert "Changed behind the cache" in response.content.decode()
@@ -0,0 +1,77 @@
+import csv
+import gzip
+import io
+import json
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import pytest
+from django.urls import reverse
+
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
+from ticketing_system.ticket.exports import TICKET_EXPORT_FIELDS
+from ticketing_system.ticket.models import TicketStatus
+
+if TYPE_CHECKING:
+    from django.test import Client
+    from ticketing_system.users.models import Profile
+
+
+pytestmark = pytest.mark.django_db
+
+TICKET_EXPORT_URL = reverse(viewname="tickets:export")
+
+
+def test_get_request_ticket_export_view_return_successful(
+        client: 'Client', first_test_user_profile: 'Profile',
+        second_test_user_profile: 'Profile', settings
+) -> None:
+
+    """
+    Test that the export streams only the user's tickets, as CSV, as JSON
+    Lines and gzipped, and that the list filters apply.
+    """
+
+    settings.TICKET_EXPORT_CHUNK_SIZE = 2
+    tickets = TicketFactory.create_batch(4, created_by=first_test_user_profile)
+    TicketFactory(created_by=second_test_user_profile)
+    closed = TicketFactory(created_by=first_test_user_profile, status=TicketStatus.CLOSED)
+    client.force_login(first_test_user_profile.user)
+
+    response = client.get(path=TICKET_EXPORT_URL)
+    assert response.status_code == HTTPStatus.OK
+    assert response.streaming
+    assert response["Content-Type"] == "text/csv"
+    assert 'filename="tickets.csv"' in response["Content-Disposition"]
+
+    rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode())))
+    assert list(rows[0]) == list(TICKET_EXPORT_FIELDS)
+    assert [row['ticket_id'] for row in rows] == [
+        str(ticket.ticket_id) for ticket in [*tickets, closed]
+    ]
+    assert rows[0]['creator_email'] == first_test_user_profile.user.email
+
+    response = client.get(
+        path=TICKET_EXPORT_URL, data={'format': 'jsonl', 'gzip': '1', 'status': TicketStatus.CLOSED}
+    )
+    assert response["Content-Type"] == "application/gzip"
+    assert 'filename="tickets.jsonl.gz"' in response["Content-Disposition"]
+
+    lines = gzip.decompress(b"".join(response.streaming_content)).decode().splitlines()
+    assert [json.loads(line)['ticket_id'] for line in lines] == [str(closed.ticket_id)]
+
+
+def test_get_request_ticket_export_view_return_error(
+        client: 'Client', first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that anonymous users are redirected and unknown formats are rejected.
+    """
+
+    response = client.get(path=TICKET_EXPORT_URL)
+    assert response.status_code == HTTPStatus.FOUND
+
+    client.force_login(first_test_user_profile.user)
+    response = client.get(path=TICKET_EXPORT_URL, data={'format': 'xlsx'})
+    assert response.status_code == HTTPStatus.BAD_REQUEST
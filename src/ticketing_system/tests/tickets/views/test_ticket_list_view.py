@@ -6,7 +6,9 @@ from django.contrib.auth import get_user_model
 from django.db.models import QuerySet
 from django.urls import reverse
 
+from ticketing_system.tests.factories.ticket_factories import TicketFactory
 from ticketing_system.ticket.models import TicketStatus
+from ticketing_system.ticket.services import create_ticket
 
 if TYPE_CHECKING:
     from django.test import Client
@@ -253,3 +255,214 @@ def test_get_request_ticket_list_view_context_customer_data_return_successful(
     assert user_profile.pending_tickets_count == 0
     assert user_profile.in_progress_tickets_count == 1
     assert user_profile.closed_tickets_count == 2
+
+
+def test_get_request_ticket_list_view_cursor_pagination_return_successful(
+        client: 'Client', first_test_admin_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that the ticket list is paginated by cursor without gaps or overlaps.
+
+    Steps:
+      - Create fifteen tickets.
+      - Log in as an admin and request the first page.
+      - Follow the `next_cursor` to the second page and back again.
+      - Assert that both pages together contain every ticket exactly once.
+    """
+
+    tickets = TicketFactory.create_batch(15)
+
+    admin_user = first_test_admin_user_profile.user
+    client.force_login(admin_user)
+
+    first_response = client.get(path=TICKET_LIST_URL)
+    first_page = first_response.context['page_obj']
+    assert first_response.status_code == HTTPStatus.OK
+    assert len(first_page) == 10
+    assert first_page.has_next()
+    assert not first_page.has_previous()
+
+    second_response = client.get(path=TICKET_LIST_URL, data={'cursor': first_page.next_cursor})
+    second_page = second_response.context['page_obj']
+    assert second_response.status_code == HTTPStatus.OK
+    assert len(second_page) == 5
+    assert not second_page.has_next()
+    assert second_page.has_previous()
+
+    seen_ids = [ticket.id for ticket in first_page] + [ticket.id for ticket in second_page]
+    assert sorted(seen_ids) == sorted(ticket.id for ticket in tickets)
+
+    previous_response = client.get(
+        path=TICKET_LIST_URL, data={'cursor': second_page.previous_cursor}
+    )
+    previous_page = previous_response.context['page_obj']
+    assert [ticket.id for ticket in previous_page] == [ticket.id for ticket in first_page]
+
+
+def test_get_request_ticket_list_view_with_invalid_cursor_return_error(
+        client: 'Client', first_test_admin_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that a malformed cursor results in a 404 response.
+    """
+
+    admin_user = first_test_admin_user_profile.user
+    client.force_login(admin_user)
+
+    response = client.get(path=TICKET_LIST_URL, data={'cursor': 'not-a-cursor'})
+    assert response.status_code == HTTPStatus.NOT_FOUND
+
+
+def test_get_request_ticket_list_view_with_search_return_successful(
+        client: 'Client', first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that the `search` parameter restricts the list to matching tickets.
+    """
+
+    create_ticket(
+        created_by=first_test_user_profile,
+        subject="Monitor flickers",
+        description="The screen flickers every few seconds."
+    )
+    create_ticket(
+        created_by=first_test_user_profile,
+        subject="Email not syncing",
+        description="Outlook does not sync."
+    )
+
+    customer_user = first_test_user_profile.user
+    client.force_login(customer_user)
+
+    response = client.get(path=TICKET_LIST_URL, data={'search': 'flicker'})
+    assert response.status_code == HTTPStatus.OK
+    assert [ticket.subject for ticket in response.context['tickets']] == ["Monitor flickers"]
+
+
+def test_get_request_ticket_list_view_conditional_get_return_not_modified(
+        client: 'Client', first_test_user_profile: 'Profile', second_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that an unchanged ticket list is answered with `304 Not Modified`,
+    and that ticket changes, other query strings and other users get a full page.
+    """
+
+    ticket = create_ticket(
+        created_by=first_test_user_profile, subject="Printer", description="Out of toner."
+    )
+
+    client.force_login(first_test_user_profile.user)
+
+    response = client.get(path=TICKET_LIST_URL)
+    etag = response['ETag']
+    assert response.status_code == HTTPStatus.OK
+    assert 'no-cache' in response['Cache-Control']
+
+    response = client.get(path=TICKET_LIST_URL, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.NOT_MODIFIED
+
+    response = client.get(path=TICKET_LIST_URL, data={'search': 'printer'}, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+
+    ticket.subject = "Printer jammed"
+    ticket.save()
+
+    response = client.get(path=TICKET_LIST_URL, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+    assert response['ETag'] != etag
+
+    client.force_login(second_test_user_profile.user)
+    response = client.get(path=TICKET_LIST_URL, HTTP_IF_NONE_MATCH=response['ETag'])
+    assert response.status_code == HTTPStatus.OK
+
+
+def test_get_request_ticket_list_view_conditional_get_after_delete_return_successful(
+        client: 'Client', first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that deleting a ticket other than the latest updated one changes
+    the ETag of the ticket list, so no stale list is answered with `304`.
+    """
+
+    older_ticket = create_ticket(
+        created_by=first_test_user_profile, subject="Printer", description="Out of toner."
+    )
+    create_ticket(
+        created_by=first_test_user_profile, subject="Scanner", description="Not found."
+    )
+
+    client.force_login(first_test_user_profile.user)
+    etag = client.get(path=TICKET_LIST_URL)['ETag']
+
+    older_ticket.delete()
+
+    response = client.get(path=TICKET_LIST_URL, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == HTTPStatus.OK
+    assert response['ETag'] != etag
+    assert len(response.context['tickets']) == 1
+
+
+def test_get_request_ticket_list_view_cache_rows_return_successful(
+        client: 'Client', first_test_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that ticket rows are served from the fragment cache until
+    the ticket's `updated_at` moves.
+    """
+
+    ticket = create_ticket(
+        created_by=first_test_user_profile, subject="Printer", description="Out of toner."
+    )
+
+    client.force_login(first_test_user_profile.user)
+    client.get(path=TICKET_LIST_URL)
+
+    # A write that bypasses the services leaves `updated_at` untouched.
+    type(ticket).objects.filter(id=ticket.id).update(subject="Scanner")
+
+    response = client.get(path=TICKET_LIST_URL)
+    assert "Printer" in response.content.decode()
+
+    ticket.refresh_from_db()
+    ticket.save()
+
+    response = client.get(path=TICKET_LIST_URL)
+    assert "Scanner" in response.content.decode()
+
+
+def test_get_request_ticket_list_view_with_filters_return_successful(
+        client: 'Client', first_test_admin_user_profile: 'Profile'
+) -> None:
+
+    """
+    Test that the list is filtered, that the facets carry their counts and
+    that pagination links keep the selected filters.
+    """
+
+    TicketFactory.create_batch(12, status=TicketStatus.PENDING)
+    TicketFactory.create_batch(2, status=TicketStatus.CLOSED)
+
+    client.force_login(first_test_admin_user_profile.user)
+
+    response = client.get(path=TICKET_LIST_URL, data={'status': TicketStatus.PENDING})
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.context['tickets']) == 10
+    assert response.context['page_obj'].has_next()
+    assert response.context['filter_querystring'] == 'status=pending'
+    assert f'?status=pending&cursor={response.context["page_obj"].next_cursor}' in (
+        response.content.decode()
+    )
+
+    status_facet = next(facet for facet in response.context['facets'] if facet['name'] == 'status')
+    assert {option['value']: option['count'] for option in status_facet['options']} == {
+        TicketStatus.PENDING: 12, TicketStatus.IN_PROGRESS: 0, TicketStatus.CLOSED: 2
+    }
+    assert [option['value'] for option in status_facet['options'] if option['selected']] == [
+        TicketStatus.PENDING
+    ]
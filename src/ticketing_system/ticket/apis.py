@@ -0,0 +1,303 @@
+from typing import Any, Dict, List
+
+from django.core.paginator import InvalidPage
+from django.http import Http404
+from rest_framework import exceptions, serializers, status
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+from ticketing_system.api.mixins import ApiAuthMixin
+from ticketing_system.api.pagination import (
+    CursorPagination, get_cursor_paginated_response, get_limit
+)
+from ticketing_system.api.utils import get_sparse_fields
+from ticketing_system.core.pagination import KeysetPaginator
+from ticketing_system.ticket.filters import TicketFilter
+from ticketing_system.ticket.search import SEARCH_ORDERING
+from ticketing_system.ticket.models import Ticket
+from ticketing_system.ticket.selectors import (
+    get_ticket_changes, get_user_ticket_values, get_visible_ticket
+)
+from ticketing_system.ticket.services import (
+    assign_ticket, claim_next_ticket, close_ticket, create_ticket
+)
+from ticketing_system.users.models import Profile, UserRole
+
+
+# API field name to model field path of a ticket. Every field is read with
+# `values()`, so responses never instantiate tickets, profiles or users.
+TICKET_API_FIELDS = {
+    'ticket_id': 'ticket_id',
+    'subject': 'subject',
+    'description': 'description',
+    'status': 'status',
+    'priority': 'priority',
+    'created_at': 'created_at',
+    'updated_at': 'updated_at',
+    'creator_email': 'created_by__user__email',
+    'assignee_email': 'assigned_to__user__email',
+    'lease_expires_at': 'lease_expires_at',
+}
+
+# The list leaves out the unbounded description unless it is asked for
+# with `?fields=`.
+TICKET_API_LIST_FIELDS = tuple(field for field in TICKET_API_FIELDS if field != 'description')
+TICKET_API_DETAIL_FIELDS = tuple(TICKET_API_FIELDS)
+
+# Columns the keyset pagination needs in every row, whether requested or not.
+TICKET_API_KEYSET_FIELDS = {'id': 'id', 'updated_at': 'updated_at'}
+
+# Fields every change feed row carries, whatever `?fields=` asks for, so
+# changed tickets and tombstones share the position the cursor is built from.
+TICKET_CHANGE_FEED_FIELDS = ('id', 'ticket_id', 'updated_at')
+
+
+def _ticket_values_fields(fields: List[str]) -> Dict[str, Any]:
+    return {field: TICKET_API_FIELDS[field] for field in fields}
+
+
+def _get_ticket_representation(
+        *, user_profile: 'Profile', ticket_id: Any, fields: List[str]
+) -> Dict[str, Any]:
+
+    """
+    Returns the requested fields of a ticket visible to the user.
+
+    Raises:
+        Http404: If the ticket does not exist or is not visible to the user.
+    """
+
+    row = (
+        get_user_ticket_values(user_profile=user_profile, fields=_ticket_values_fields(fields))
+        .filter(ticket_id=ticket_id)
+        .first()
+    )
+    if row is None:
+        raise Http404("Ticket not found.")
+
+    return row
+
+
+class TicketListApi(ApiAuthMixin, APIView):
+
+    """
+    Lists the tickets visible to the user, and creates tickets.
+
+    `GET` accepts the filters of `TicketFilter`, a full-text `search`, a
+    sparse fieldset (`?fields=ticket_id,subject`) and the cursor pagination
+    parameters (`cursor`, `limit`).
+    """
+
+    class InputSerializer(serializers.Serializer):
+        subject = serializers.CharField(max_length=255)
+        description = serializers.CharField()
+
+    def get(self, request) -> Response:
+        user_profile = request.user.profile
+        fields = get_sparse_fields(
+            request=request, available=TICKET_API_FIELDS, default=TICKET_API_LIST_FIELDS
+        )
+        search = request.query_params.get('search', '').strip()
+
+        filterset = TicketFilter(
+            request.query_params,
+            queryset=get_user_ticket_values(
+                user_profile=user_profile,
+                fields={**_ticket_values_fields(fields), **TICKET_API_KEYSET_FIELDS},
+                search=search,
+            ),
+            user_profile=user_profile,
+        )
+        if not filterset.is_valid():
+            raise exceptions.ValidationError(filterset.errors)
+
+        return get_cursor_paginated_response(
+            queryset=filterset.qs,
+            request=request,
+            ordering=SEARCH_ORDERING if search else ('-updated_at', '-id'),
+            to_representation=lambda row: {field: row[field] for field in fields},
+        )
+
+    def post(self, request) -> Response:
+        serializer = self.InputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        ticket = create_ticket(created_by=request.user.profile, **serializer.validated_data)
+
+        data = _get_ticket_representation(
+            user_profile=request.user.profile, ticket_id=ticket.ticket_id,
+            fields=list(TICKET_API_DETAIL_FIELDS),
+        )
+        return Response(data, status=status.HTTP_201_CREATED)
+
+
+class TicketDetailApi(ApiAuthMixin, APIView):
+
+    """
+    Returns a ticket visible to the user, with an optional sparse fieldset.
+    """
+
+    def get(self, request, ticket_id) -> Response:
+        fields = get_sparse_fields(
+            request=request, available=TICKET_API_FIELDS, default=TICKET_API_DETAIL_FIELDS
+        )
+        return Response(_get_ticket_representation(
+            user_profile=request.user.profile, ticket_id=ticket_id, fields=fields
+        ))
+
+
+class TicketAssignApi(ApiAuthMixin, APIView):
+
+    """
+    Assigns a ticket to a staff member, for admin users.
+    """
+
+    class InputSerializer(serializers.Serializer):
+        assigned_to = serializers.PrimaryKeyRelatedField(
+            queryset=Profile.objects.filter(
+                role=UserRole.STAFF, user__is_active=True
+            ).select_related('user')
+        )
+
+    def post(self, request, ticket_id) -> Response:
+        user_profile = request.user.profile
+
+        if user_profile.role != UserRole.ADMIN:
+            raise exceptions.PermissionDenied("You don't have permission to assign tickets.")
+
+        serializer = self.InputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        ticket = get_visible_ticket(user_profile=user_profile, ticket_id=ticket_id)
+        assign_ticket(ticket=ticket, staff_profile=serializer.validated_data['assigned_to'])
+
+        return Response(_get_ticket_representation(
+            user_profile=user_profile, ticket_id=ticket_id, fields=list(TICKET_API_DETAIL_FIELDS)
+        ))
+
+
+class TicketCloseApi(ApiAuthMixin, APIView):
+
+    """
+    Closes a ticket, for admin and staff users.
+    """
+
+    class InputSerializer(serializers.Serializer):
+        closing_message = serializers.CharField(required=False, allow_blank=True, default="")
+
+    def post(self, request, ticket_id) -> Response:
+        user_profile = request.user.profile
+
+        if user_profile.role not in [UserRole.ADMIN, UserRole.STAFF]:
+            raise exceptions.PermissionDenied("You do not have permission to close this ticket.")
+
+        serializer = self.InputSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        ticket = get_visible_ticket(user_profile=user_profile, ticket_id=ticket_id)
+        try:
+            close_ticket(user_profile=user_profile, ticket=ticket, **serializer.validated_data)
+        except ValueError as e:
+            raise exceptions.ValidationError(str(e))
+
+        return Response(_get_ticket_representation(
+            user_profile=user_profile, ticket_id=ticket_id, fields=list(TICKET_API_DETAIL_FIELDS)
+        ))
+
+
+class TicketClaimNextApi(ApiAuthMixin, APIView):
+
+    """
+    Claims the next ticket of the work queue, for staff users.
+
+    Responds with 204 when the queue is empty. See `claim_next_ticket()`.
+    """
+
+    def post(self, request) -> Response:
+        ticket = claim_next_ticket(staff_profile=request.user.profile)
+        if ticket is None:
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        return Response(_get_ticket_representation(
+            user_profile=request.user.profile, ticket_id=ticket.ticket_id,
+            fields=list(TICKET_API_DETAIL_FIELDS),
+        ))
+
+
+class TicketChangeFeedPagination(CursorPagination):
+
+    """
+    Larger pages for the change feed, which is read by sync jobs.
+    """
+
+    default_limit = 100
+    max_limit = 1000
+
+
+class TicketChangeFeedApi(ApiAuthMixin, APIView):
+
+    """
+    Incremental feed of ticket changes for sync jobs, for admin users.
+
+    Returns the tickets changed after `?cursor=`, oldest change first, so a
+    sync job only downloads what changed since its last run. Every row has
+    the `TICKET_CHANGE_FEED_FIELDS` and `deleted`; changed tickets also
+    carry their requested current fields (closed tickets their CLOSED
+    status), deleted tickets nothing else.
+
+    The returned `cursor` resumes the feed after the last change of the
+    page. Once `has_more` is false the client is up to date and polls the
+    same cursor again later. Without a cursor the feed starts from the
+    oldest ticket, which is the initial full sync.
+    """
+
+    pagination_class = TicketChangeFeedPagination
+
+    def get(self, request) -> Response:
+        if request.user.profile.role != UserRole.ADMIN:
+            raise exceptions.PermissionDenied("You don't have permission to read the change feed.")
+
+        fields = get_sparse_fields(
+            request=request, available=TICKET_API_FIELDS, default=TICKET_API_DETAIL_FIELDS
+        )
+        # Only the opaque cursor format of the keyset paginator is used here.
+        paginator = KeysetPaginator(
+            Ticket.objects.none(),
+            per_page=get_limit(request=request, pagination_class=self.pagination_class),
+            ordering=('updated_at', 'id'),
+        )
+
+        cursor = request.query_params.get(self.pagination_class.cursor_query_param) or None
+        after = None
+        if cursor:
+            try:
+                after, _reverse = paginator.decode_cursor(cursor)
+            except InvalidPage:
+                raise exceptions.ValidationError(
+                    {self.pagination_class.cursor_query_param: ["Invalid cursor."]}
+                )
+
+        changes, has_more = get_ticket_changes(
+            fields=_ticket_values_fields(fields), limit=paginator.per_page, after=after
+        )
+        if changes:
+            cursor = paginator.encode_cursor(changes[-1])
+
+        url = request.build_absolute_uri()
+        return Response({
+            "cursor": cursor,
+            "has_more": has_more,
+            "next": (
+                replace_query_param(url, self.pagination_class.cursor_query_param, cursor)
+                if cursor else url
+            ),
+            "results": [
+                {
+                    **{field: change[field] for field in TICKET_CHANGE_FEED_FIELDS},
+                    **({} if change['deleted'] else {field: change[field] for field in fields}),
+                    'deleted': change['deleted'],
+                }
+                for change in changes
+            ],
+        })
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TicketConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ticketing_system.ticket'
+
+    def ready(self) -> None:
+        from ticketing_system.ticket import signals  # noqa
@@ -0,0 +1,245 @@
+import heapq
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+
+from ticketing_system.core.cache import (
+    bump_cache_version, cache_get_or_compute, get_cache_version, versioned_cache_key
+)
+from ticketing_system.ticket.models import (
+    Ticket, TicketCounter, TicketCounterScope, TicketPriority, TicketStatus
+)
+from ticketing_system.users.selectors import STAFF_ROSTER_CACHE_NAMESPACE, get_staff_roster
+
+
+# Cache namespace of the staff workload heaps, one entry per strategy.
+# Entries are also keyed by the staff roster version, so adding or
+# deactivating a staff member reseeds the heaps.
+AUTO_ASSIGNMENT_CACHE_NAMESPACE = "tickets:auto_assignment"
+
+# Delay between two attempts to take the lock of a workload heap, in
+# seconds. The lock is only held for a cache read and write.
+AUTO_ASSIGNMENT_LOCK_POLL_INTERVAL = 0.005
+
+# Workload a ticket adds to its assignee under the priority-aware strategy.
+PRIORITY_WEIGHTS = {
+    TicketPriority.LOW: 1,
+    TicketPriority.MEDIUM: 2,
+    TicketPriority.HIGH: 3,
+    TicketPriority.URGENT: 5,
+}
+
+
+class AssignmentStrategy(ABC):
+
+    """
+    Base class of the auto-assignment strategies.
+
+    A strategy gives every staff member a key, the staff member with the
+    smallest key gets the next ticket. `seed()` computes the initial keys,
+    `next_key()` the key of a staff member after a ticket was assigned to them.
+    """
+
+    name = ""
+
+    def seed(self, *, staff_ids: List[int]) -> Dict[int, int]:
+        return dict.fromkeys(staff_ids, 0)
+
+    @abstractmethod
+    def next_key(self, *, key: int, priority: str, workload: 'StaffWorkload') -> int:
+        """Returns the key of a staff member after a ticket was assigned to them."""
+
+
+class LeastLoadedStrategy(AssignmentStrategy):
+
+    """
+    Assigns to the staff member with the fewest in-progress tickets,
+    seeded from the denormalized ASSIGNED ticket counters.
+    """
+
+    name = "least_loaded"
+
+    def seed(self, *, staff_ids: List[int]) -> Dict[int, int]:
+        counts = dict(
+            TicketCounter.objects
+            .filter(
+                scope=TicketCounterScope.ASSIGNED,
+                status=TicketStatus.IN_PROGRESS,
+                profile_id__in=staff_ids,
+            )
+            .values_list('profile_id', 'count')
+        )
+        return {staff_id: counts.get(staff_id, 0) for staff_id in staff_ids}
+
+    def next_key(self, *, key: int, priority: str, workload: 'StaffWorkload') -> int:
+        return key + 1
+
+
+class RoundRobinStrategy(AssignmentStrategy):
+
+    """
+    Assigns to the staff member who was assigned a ticket the longest time ago.
+    """
+
+    name = "round_robin"
+
+    def next_key(self, *, key: int, priority: str, workload: 'StaffWorkload') -> int:
+        workload.sequence += 1
+        return workload.sequence
+
+
+class PriorityAwareStrategy(AssignmentStrategy):
+
+    """
+    Assigns to the staff member with the smallest in-progress workload,
+    weighting every ticket by its priority (see `PRIORITY_WEIGHTS`).
+    """
+
+    name = "priority_aware"
+
+    def seed(self, *, staff_ids: List[int]) -> Dict[int, int]:
+        keys = dict.fromkeys(staff_ids, 0)
+        rows = (
+            Ticket.objects
+            .filter(status=TicketStatus.IN_PROGRESS, assigned_to_id__in=staff_ids)
+            .order_by()
+            .values('assigned_to', 'priority')
+            .annotate(tickets_count=Count('id'))
+        )
+        for row in rows:
+            keys[row['assigned_to']] += PRIORITY_WEIGHTS[row['priority']] * row['tickets_count']
+        return keys
+
+    def next_key(self, *, key: int, priority: str, workload: 'StaffWorkload') -> int:
+        return key + PRIORITY_WEIGHTS[priority]
+
+
+AUTO_ASSIGNMENT_STRATEGIES: Dict[str, AssignmentStrategy] = {
+    strategy.name: strategy
+    for strategy in (LeastLoadedStrategy(), RoundRobinStrategy(), PriorityAwareStrategy())
+}
+
+
+class StaffWorkload:
+
+    """
+    A min-heap of `(key, staff id)` pairs ordering the staff members by
+    the keys of an assignment strategy.
+
+    Picking the next assignee and updating their key is O(log staff); the
+    heap is only seeded from the database once. `expires_at` is the time
+    after which a cached heap must be reseeded.
+    """
+
+    def __init__(self, *, strategy: str, staff_ids: List[int], timeout: int = 0) -> None:
+        self.strategy = strategy
+        self.sequence = 0
+        self.expires_at = time.time() + timeout
+
+        keys = AUTO_ASSIGNMENT_STRATEGIES[strategy].seed(staff_ids=staff_ids)
+        self.heap: List[Tuple[int, int]] = [(key, staff_id) for staff_id, key in keys.items()]
+        heapq.heapify(self.heap)
+
+    def assign(self, *, priority: str) -> Optional[int]:
+
+        """
+        Returns the next assignee and accounts a ticket of the given priority to them.
+
+        Args:
+            priority (str): The priority of the assigned ticket.
+
+        Returns:
+            Optional[int]: The profile id of the assignee, or None without staff.
+        """
+
+        if not self.heap:
+            return None
+
+        key, staff_id = self.heap[0]
+        next_key = AUTO_ASSIGNMENT_STRATEGIES[self.strategy].next_key(
+            key=key, priority=priority, workload=self
+        )
+        heapq.heapreplace(self.heap, (next_key, staff_id))
+        return staff_id
+
+
+def pick_staff_for_ticket(*, priority: str, strategy: Optional[str] = None) -> Optional[int]:
+
+    """
+    Picks the staff member a new ticket is auto-assigned to.
+
+    The workload heap of the strategy is kept in the cache, seeded once per
+    `settings.TICKET_AUTO_ASSIGNMENT_CACHE_TIMEOUT` (or staff roster change)
+    and updated in place by every assignment, under a short cache lock so
+    concurrent assignments see each other's updates. If the lock is not
+    released within `settings.CACHE_SINGLE_FLIGHT_WAIT` (its holder died),
+    the heap is updated without it.
+
+    Args:
+        priority (str): The priority of the ticket.
+        strategy (str, optional): The strategy name, defaults to
+            `settings.TICKET_AUTO_ASSIGNMENT_STRATEGY`.
+
+    Returns:
+        Optional[int]: The profile id of the staff member, or None if
+        auto-assignment is disabled or there is no active staff member.
+    """
+
+    strategy = strategy or settings.TICKET_AUTO_ASSIGNMENT_STRATEGY
+    if not strategy:
+        return None
+
+    timeout = settings.TICKET_AUTO_ASSIGNMENT_CACHE_TIMEOUT
+    roster_version = get_cache_version(namespace=STAFF_ROSTER_CACHE_NAMESPACE)
+    key = versioned_cache_key(
+        namespace=AUTO_ASSIGNMENT_CACHE_NAMESPACE, key=f"{strategy}:{roster_version}"
+    )
+
+    def _seed_workload() -> StaffWorkload:
+        return StaffWorkload(
+            strategy=strategy,
+            staff_ids=[staff['id'] for staff in get_staff_roster()],
+            timeout=timeout,
+        )
+
+    workload = cache_get_or_compute(key=key, compute=_seed_workload, timeout=timeout)
+
+    lock_key = f"{key}:update"
+    lock_timeout = settings.CACHE_SINGLE_FLIGHT_LOCK_TIMEOUT
+    deadline = time.monotonic() + settings.CACHE_SINGLE_FLIGHT_WAIT
+    locked = cache.add(lock_key, 1, timeout=lock_timeout)
+    while not locked and time.monotonic() < deadline:
+        time.sleep(AUTO_ASSIGNMENT_LOCK_POLL_INTERVAL)
+        locked = cache.add(lock_key, 1, timeout=lock_timeout)
+
+    try:
+        # Re-read under the lock, the heap may have changed since.
+        workload = cache.get(key, workload)
+        staff_id = workload.assign(priority=priority)
+
+        # Keep the original expiry, so the heap is reseeded periodically
+        # even while it is updated all the time.
+        remaining = int(workload.expires_at - time.time())
+        if remaining > 0:
+            cache.set(key, workload, timeout=remaining)
+        else:
+            cache.delete(key)
+    finally:
+        if locked:
+            cache.delete(lock_key)
+
+    return staff_id
+
+
+def invalidate_staff_workloads() -> None:
+
+    """
+    Drops the cached workload heaps of all strategies, so they are reseeded
+    on the next assignment, e.g. after tickets were redistributed in bulk.
+    """
+
+    bump_cache_version(namespace=AUTO_ASSIGNMENT_CACHE_NAMESPACE)
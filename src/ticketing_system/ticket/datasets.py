@@ -0,0 +1,331 @@
+import multiprocessing
+import random
+import uuid
+from datetime import datetime, timedelta
+from itertools import accumulate
+from typing import Callable, List, NamedTuple, Optional, Sequence
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import connection, connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from ticketing_system.core.cache import bump_cache_version
+from ticketing_system.ticket.assignment import invalidate_staff_workloads
+from ticketing_system.ticket.models import Ticket, TicketPriority, TicketStatus
+from ticketing_system.ticket.search import index_tickets
+from ticketing_system.ticket.services import rebuild_ticket_counters
+from ticketing_system.users.models import Profile, UserRole
+from ticketing_system.users.selectors import STAFF_ROSTER_CACHE_NAMESPACE
+
+
+User = get_user_model()
+
+# Share of the priorities of generated tickets, most tickets are routine.
+TICKET_PRIORITY_MIX = {
+    TicketPriority.LOW: 40,
+    TicketPriority.MEDIUM: 35,
+    TicketPriority.HIGH: 20,
+    TicketPriority.URGENT: 5,
+}
+
+# Share of the statuses of tickets created within the last
+# `TICKET_OPEN_WINDOW_DAYS`; older tickets are almost all closed, apart
+# from a small stale backlog (`TICKET_STALE_SHARE`).
+TICKET_OPEN_WINDOW_DAYS = 14
+TICKET_RECENT_STATUS_MIX = {
+    TicketStatus.PENDING: 30,
+    TicketStatus.IN_PROGRESS: 45,
+    TicketStatus.CLOSED: 25,
+}
+TICKET_STALE_SHARE = 0.03
+
+# Exponents of the Zipf-like distributions of tickets over customers and
+# staff members: a few customers open many tickets, a few staff members
+# handle a large part of them.
+CUSTOMER_ACTIVITY_SKEW = 1.0
+STAFF_WORKLOAD_SKEW = 0.8
+
+_SUBJECT_PROBLEMS = (
+    "Cannot access", "Error when opening", "Slow response from", "Request for",
+    "Question about", "Unable to update", "Broken link in", "Missing data in",
+    "Password reset for", "Billing issue with",
+)
+_SUBJECT_OBJECTS = (
+    "VPN", "email account", "invoice", "dashboard", "mobile app", "printer",
+    "shared drive", "user profile", "monthly report", "subscription", "API key",
+    "calendar", "order", "shipping address", "license",
+)
+_DESCRIPTION_SENTENCES = (
+    "It started after the last update.",
+    "Restarting did not help.",
+    "Several colleagues see the same problem.",
+    "The error message says the request timed out.",
+    "This blocks our work, please have a look.",
+    "It works in the browser but not in the app.",
+    "I attached the steps to reproduce it below.",
+    "It happens every morning around nine.",
+    "We need this resolved before the end of the month.",
+    "Thanks for your help.",
+)
+
+
+class TicketDatasetSpec(NamedTuple):
+
+    """
+    Everything a worker needs to generate tickets on its own.
+    """
+
+    customer_ids: Sequence[int]
+    customer_cum_weights: Sequence[float]
+    staff_ids: Sequence[int]
+    staff_cum_weights: Sequence[float]
+    start: datetime
+    end: datetime
+    batch_size: int
+
+
+class TicketDatasetResult(NamedTuple):
+
+    """
+    Outcome of `generate_ticket_dataset()`.
+    """
+
+    users: int
+    tickets: int
+    tag: str
+
+
+def _zipf_cum_weights(count: int, *, skew: float, rng: random.Random) -> List[float]:
+
+    # Cumulative weights 1/rank^skew, shuffled so ids and activity are unrelated.
+    weights = [1 / (rank ** skew) for rank in range(1, count + 1)]
+    rng.shuffle(weights)
+    return list(accumulate(weights))
+
+
+def generate_users(
+        *, role: str, count: int, tag: str, password_hash: str, batch_size: int
+) -> List[int]:
+
+    """
+    Creates verified users with profiles of the given role, in bulk.
+
+    All users get the same precomputed password hash, so no password is
+    hashed per user. Emails look like ``staff.<tag>.<n>@example.com``.
+
+    Returns:
+        List[int]: The profile ids.
+    """
+
+    profile_ids = []
+    for offset in range(0, count, batch_size):
+        with transaction.atomic():
+            users = User.objects.bulk_create([
+                User(
+                    email=f"{role}.{tag}.{number}@example.com",
+                    username=f"{role}.{tag}.{number}",
+                    password=password_hash,
+                    is_verified=True,
+                )
+                for number in range(offset, min(offset + batch_size, count))
+            ])
+            profiles = Profile.objects.bulk_create(
+                [Profile(user_id=user.id, role=role) for user in users]
+            )
+        profile_ids += [profile.id for profile in profiles]
+
+    return profile_ids
+
+
+def _build_tickets(*, spec: TicketDatasetSpec, count: int, rng: random.Random) -> List[Ticket]:
+
+    span = (spec.end - spec.start).total_seconds()
+    open_window_start = spec.end - timedelta(days=TICKET_OPEN_WINDOW_DAYS)
+
+    creators = rng.choices(spec.customer_ids, cum_weights=spec.customer_cum_weights, k=count)
+    priorities = rng.choices(
+        list(TICKET_PRIORITY_MIX), weights=list(TICKET_PRIORITY_MIX.values()), k=count
+    )
+    recent_statuses = rng.choices(
+        list(TICKET_RECENT_STATUS_MIX), weights=list(TICKET_RECENT_STATUS_MIX.values()), k=count
+    )
+
+    tickets = []
+    for creator_id, priority, recent_status in zip(creators, priorities, recent_statuses):
+        # The square root skews creation times towards the end of the
+        # range, like a growing helpdesk.
+        created_at = spec.start + timedelta(seconds=span * rng.random() ** 0.5)
+
+        if created_at >= open_window_start:
+            status = recent_status
+        elif rng.random() < TICKET_STALE_SHARE:
+            status = TicketStatus.IN_PROGRESS
+        else:
+            status = TicketStatus.CLOSED
+
+        assigned_to_id = None
+        if status != TicketStatus.PENDING and spec.staff_ids:
+            assigned_to_id = rng.choices(spec.staff_ids, cum_weights=spec.staff_cum_weights)[0]
+
+        tickets.append(Ticket(
+            created_by_id=creator_id,
+            assigned_to_id=assigned_to_id,
+            subject=f"{rng.choice(_SUBJECT_PROBLEMS)} {rng.choice(_SUBJECT_OBJECTS)}",
+            description=" ".join(rng.sample(_DESCRIPTION_SENTENCES, rng.randint(1, 4))),
+            status=status,
+            priority=priority,
+            created_at=created_at,
+        ))
+
+    return tickets
+
+
+def generate_tickets(*, spec: TicketDatasetSpec, count: int, seed: int) -> int:
+
+    """
+    Generates tickets in bulk, one transaction per batch.
+
+    Every batch is inserted with `bulk_create()`, gets its `updated_at` set
+    to its creation time (`auto_now` would stamp all of them with the
+    current time) and is added to the full-text index.
+
+    Returns:
+        int: The number of generated tickets.
+    """
+
+    rng = random.Random(seed)
+    generated = 0
+
+    while generated < count:
+        tickets = _build_tickets(
+            spec=spec, count=min(spec.batch_size, count - generated), rng=rng
+        )
+        with transaction.atomic():
+            Ticket.objects.bulk_create(tickets)
+            ticket_ids = [ticket.id for ticket in tickets]
+            Ticket.objects.filter(id__in=ticket_ids).update(updated_at=F('created_at'))
+            index_tickets(ticket_ids=ticket_ids)
+        generated += len(tickets)
+
+    return generated
+
+
+_worker_spec: Optional[TicketDatasetSpec] = None
+
+
+def _init_worker(spec: TicketDatasetSpec) -> None:
+    global _worker_spec
+    _worker_spec = spec
+
+
+def _generate_tickets_job(job: tuple) -> int:
+    count, seed = job
+    try:
+        return generate_tickets(spec=_worker_spec, count=count, seed=seed)
+    finally:
+        connections.close_all()
+
+
+def generate_ticket_dataset(
+        *, customers: int, staff: int, admins: int, tickets: int, days: int, password: str,
+        workers: int = 1, batch_size: int = 2000, seed: Optional[int] = None,
+        on_progress: Optional[Callable[[int], None]] = None
+) -> TicketDatasetResult:
+
+    """
+    Generates a realistic dataset of users, profiles and tickets, e.g. to
+    seed a performance test environment.
+
+    - Tickets are spread over the last `days`, more of them recently.
+    - Recent tickets are pending, in progress or closed, older ones are
+      almost all closed (see `TICKET_RECENT_STATUS_MIX`).
+    - Priorities follow `TICKET_PRIORITY_MIX`.
+    - Customers and staff workloads follow Zipf-like distributions.
+
+    Users share one precomputed password hash. Tickets are generated by
+    `workers` processes in parallel (forked, so POSIX only), each with its
+    own database connection. The ticket counters are rebuilt once at the end.
+
+    Args:
+        customers (int): Number of customers to create.
+        staff (int): Number of staff members to create.
+        admins (int): Number of admins to create.
+        tickets (int): Number of tickets to create.
+        days (int): Number of days the creation times are spread over.
+        password (str): Password of all generated users.
+        workers (int, optional): Number of processes generating tickets.
+        batch_size (int, optional): Rows inserted per statement.
+        seed (int, optional): Seed of the random generators, for reproducible data.
+        on_progress (Callable[[int], None], optional): Called with the number
+            of generated tickets whenever a worker finished a job.
+
+    Returns:
+        TicketDatasetResult: The number of users and tickets, and the tag in
+        the generated emails.
+    """
+
+    rng = random.Random(seed)
+    tag = uuid.UUID(int=rng.getrandbits(128)).hex[:8]
+    password_hash = make_password(password)
+
+    profile_ids = {
+        role: generate_users(
+            role=role, count=count, tag=tag, password_hash=password_hash, batch_size=batch_size
+        )
+        for role, count in (
+            (UserRole.CUSTOMER, customers), (UserRole.STAFF, staff), (UserRole.ADMIN, admins)
+        )
+    }
+    # `bulk_create()` sends no signals, invalidate the staff roster by hand.
+    bump_cache_version(namespace=STAFF_ROSTER_CACHE_NAMESPACE)
+
+    end = timezone.now()
+    spec = TicketDatasetSpec(
+        customer_ids=profile_ids[UserRole.CUSTOMER],
+        customer_cum_weights=_zipf_cum_weights(customers, skew=CUSTOMER_ACTIVITY_SKEW, rng=rng),
+        staff_ids=profile_ids[UserRole.STAFF],
+        staff_cum_weights=_zipf_cum_weights(staff, skew=STAFF_WORKLOAD_SKEW, rng=rng),
+        start=end - timedelta(days=days),
+        end=end,
+        batch_size=batch_size,
+    )
+
+    generated = 0
+    if tickets and workers <= 1:
+        generated = generate_tickets(spec=spec, count=tickets, seed=rng.getrandbits(64))
+        if on_progress is not None:
+            on_progress(generated)
+    elif tickets:
+        # Jobs of a few batches each keep the workers busy until the end.
+        job_size = min(batch_size * 10, -(-tickets // workers))
+        jobs = [
+            (min(job_size, tickets - offset), rng.getrandbits(64))
+            for offset in range(0, tickets, job_size)
+        ]
+
+        # Forked workers must not share the parent's database connection.
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        with context.Pool(processes=workers, initializer=_init_worker, initargs=(spec,)) as pool:
+            for count in pool.imap_unordered(_generate_tickets_job, jobs):
+                generated += count
+                if on_progress is not None:
+                    on_progress(generated)
+
+    if generated:
+        rebuild_ticket_counters()
+        invalidate_staff_workloads()
+
+    return TicketDatasetResult(users=customers + staff + admins, tickets=generated, tag=tag)
+
+
+def supports_parallel_generation() -> bool:
+
+    """
+    Whether tickets may be generated by several processes at once; SQLite
+    allows a single writer only.
+    """
+
+    return connection.vendor != "sqlite"
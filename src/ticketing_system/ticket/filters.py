@@ -0,0 +1,128 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import django_filters
+from django.db.models import QuerySet
+
+from ticketing_system.ticket.models import Ticket, TicketPriority, TicketStatus
+from ticketing_system.ticket.selectors import get_ticket_facet_counts
+from ticketing_system.users.models import UserRole
+from ticketing_system.users.selectors import get_staff_roster
+
+
+UNASSIGNED = "null"
+
+
+def _staff_choices() -> List[Tuple[str, str]]:
+
+    # Served from the cached staff roster, like the assignment form.
+    return [(str(staff['id']), staff['email']) for staff in get_staff_roster()]
+
+
+class TicketFilter(django_filters.FilterSet):
+
+    """
+    Filters of the ticket list: status, priority, assignee and a
+    created-at date range.
+
+    Status, priority and assignee are facets: `get_facets()` returns the
+    number of tickets for each of their values with a single grouped query.
+    The assignee filter is only offered to admins, since staff members and
+    customers only see tickets of one assignee or creator anyway.
+    """
+
+    status = django_filters.ChoiceFilter(choices=TicketStatus.choices, empty_label="All statuses")
+    priority = django_filters.ChoiceFilter(
+        choices=TicketPriority.choices, empty_label="All priorities"
+    )
+    assigned_to = django_filters.ChoiceFilter(
+        choices=_staff_choices, empty_label="All assignees",
+        null_value=UNASSIGNED, null_label="Unassigned",
+    )
+    created = django_filters.DateFromToRangeFilter(field_name='created_at')
+
+    facet_fields = ('status', 'priority', 'assigned_to')
+
+    class Meta:
+        model = Ticket
+        fields = ['status', 'priority', 'assigned_to', 'created']
+
+    def __init__(self, *args: Any, user_profile: Optional[Any] = None, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+
+        if user_profile is None or user_profile.role != UserRole.ADMIN:
+            self.filters.pop('assigned_to')
+
+    def to_column_value(self, name: str, value: Any) -> Any:
+
+        """
+        Convert a submitted facet value to the value stored in its column.
+        """
+
+        if name == 'assigned_to':
+            return None if value == UNASSIGNED else int(value)
+
+        return value
+
+    def get_facet_counts(self) -> Dict[str, Dict[Any, int]]:
+
+        """
+        Count the tickets of every facet value with a single grouped query.
+
+        The counts of a facet respect every active filter except its own
+        one, so each count tells how many tickets selecting that value
+        would list.
+
+        Returns:
+            Dict[str, Dict[Any, int]]: Per facet, the ticket count of every column value.
+        """
+
+        # Like `qs`, invalid filter values are ignored rather than rejected.
+        self.form.is_valid()
+        cleaned_data = getattr(self.form, 'cleaned_data', {})
+
+        queryset: QuerySet = self.queryset
+        selected = {}
+
+        for name, value in cleaned_data.items():
+            if name not in self.filters:
+                continue
+            if name not in self.facet_fields:
+                queryset = self.filters[name].filter(queryset, value)
+            elif value not in (None, ''):
+                selected[name] = self.to_column_value(name, value)
+
+        return get_ticket_facet_counts(
+            queryset=queryset,
+            fields=[name for name in self.facet_fields if name in self.filters],
+            selected=selected,
+        )
+
+    def get_facets(self) -> List[Dict[str, Any]]:
+
+        """
+        Build the facet options of the filter form with their ticket counts.
+
+        Returns:
+            List[Dict[str, Any]]: Per facet, its `name`, its `label` and its
+            `options`, each with `value`, `label`, `count` and `selected`.
+        """
+
+        facets = []
+
+        for name, counts in self.get_facet_counts().items():
+            field = self.form[name]
+            selected = str(field.value() or '')
+
+            options = [
+                {
+                    'value': value,
+                    'label': label,
+                    'count': counts.get(self.to_column_value(name, value), 0),
+                    'selected': str(value) == selected,
+                }
+                for value, label in field.field.choices
+                if value != ''
+            ]
+            facets.append({'name': name, 'label': field.field.empty_label, 'options': options})
+
+        return facets
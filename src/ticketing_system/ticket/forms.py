@@ -1,7 +1,11 @@
+import uuid
+
 from django import forms
+from django.core.exceptions import ValidationError
 
 from ticketing_system.ticket.models import Ticket
-from ticketing_system.users.models import Profile
+from ticketing_system.users.models import Profile, UserRole
+from ticketing_system.users.selectors import get_staff_roster
 
 
 class TicketCreationForm(forms.ModelForm):
@@ -29,12 +33,76 @@ class TicketCreationForm(forms.ModelForm):
 
 
 class TicketAssignmentForm(forms.Form):
+
+    """
+    Form for assigning a ticket to a staff member.
+
+    The rendered choices come from the cached staff roster, so rendering the
+    form issues no queries; only validating a submission looks up the
+    selected profile.
+    """
+
     assigned_to = forms.ModelChoiceField(
-        queryset=Profile.objects.filter(role='staff').order_by('user__username'),
+        queryset=Profile.objects.filter(
+            role=UserRole.STAFF, user__is_active=True
+        ).order_by('user__username'),
         label="Assign to Staff",
         required=True
     )
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+
+        field = self.fields['assigned_to']
+        field.choices = [
+            ("", field.empty_label),
+            *((staff['id'], staff['email']) for staff in get_staff_roster()),
+        ]
+
+
+class TicketIdListField(forms.Field):
+
+    """
+    A list of ticket ids, submitted as repeated inputs of the same name.
+    """
+
+    widget = forms.MultipleHiddenInput
+
+    def to_python(self, value):
+        try:
+            return list({uuid.UUID(str(ticket_id)) for ticket_id in value or []})
+        except ValueError:
+            raise ValidationError("Invalid ticket id.", code='invalid')
+
+    def validate(self, value):
+        if self.required and not value:
+            raise ValidationError("Select at least one ticket.", code='required')
+
+
+class TicketBulkActionForm(TicketAssignmentForm):
+
+    """
+    Form for assigning or closing the selected tickets at once.
+
+    `assigned_to` is only required for the assign action.
+    """
+
+    ASSIGN = 'assign'
+    CLOSE = 'close'
+
+    action = forms.ChoiceField(choices=[(ASSIGN, "Assign"), (CLOSE, "Close")])
+    ticket_ids = TicketIdListField()
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.fields['assigned_to'].required = False
+
+    def clean(self):
+        cleaned_data = super().clean()
+        if cleaned_data.get('action') == self.ASSIGN and not cleaned_data.get('assigned_to'):
+            self.add_error('assigned_to', "Select a staff member to assign the tickets to.")
+        return cleaned_data
+
 
 class TicketCloseForm(forms.Form):
     """
@@ -0,0 +1,237 @@
+import csv
+import json
+import os
+import uuid
+from itertools import islice
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple
+)
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from ticketing_system.ticket.assignment import invalidate_staff_workloads
+from ticketing_system.ticket.models import Ticket, TicketPriority, TicketStatus
+from ticketing_system.ticket.search import index_tickets
+from ticketing_system.ticket.services import (
+    rebuild_ticket_counters, ticket_counter_keys, ticket_counters_move
+)
+from ticketing_system.users.models import Profile, UserRole
+
+
+# Import formats, the same as the ones written by `ticket.exports`.
+TICKET_IMPORT_FORMATS = ('csv', 'jsonl')
+
+SUBJECT_MAX_LENGTH = Ticket._meta.get_field('subject').max_length
+
+
+class TicketImportResult(NamedTuple):
+
+    """
+    Outcome of `import_tickets()`.
+    """
+
+    imported: int
+    skipped: int
+
+
+def read_ticket_import_rows(*, file: TextIO, import_format: str) -> Iterator[Dict[str, Any]]:
+
+    """
+    Reads the rows of a CSV or JSON Lines file lazily, one row at a time.
+
+    Both formats use the columns of `TICKET_EXPORT_FIELDS`; only
+    `subject` and `creator_email` are required.
+
+    Raises:
+        ValidationError: If a JSON line cannot be decoded.
+    """
+
+    if import_format == 'csv':
+        yield from csv.DictReader(file)
+        return
+
+    for number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError:
+            raise ValidationError(f"Line {number}: invalid JSON.")
+
+
+def _get_profile_map() -> Dict[str, Tuple[int, str]]:
+
+    # Lowercased email to (profile id, role) of every user, with a single query.
+    return {
+        email.lower(): (profile_id, role)
+        for email, profile_id, role in (
+            Profile.objects.values_list('user__email', 'id', 'role').iterator(chunk_size=10000)
+        )
+    }
+
+
+def _uuid4_batch(count: int) -> List[uuid.UUID]:
+
+    # Random UUIDs like `uuid.uuid4()`, from one `os.urandom()` call per batch.
+    randomness = os.urandom(16 * count)
+    return [
+        uuid.UUID(bytes=randomness[offset:offset + 16], version=4)
+        for offset in range(0, 16 * count, 16)
+    ]
+
+
+def _build_ticket(
+        row: Dict[str, Any], *, profiles: Dict[str, Tuple[int, str]],
+        ticket_uuid: uuid.UUID, now
+) -> Ticket:
+
+    """
+    Builds an unsaved ticket from an import row.
+
+    Raises:
+        ValidationError: If the row is invalid.
+    """
+
+    creator_email = (row.get('creator_email') or '').strip()
+    creator = profiles.get(creator_email.lower())
+    if creator is None:
+        raise ValidationError(f"Unknown creator {creator_email!r}.")
+
+    assigned_to_id = None
+    assignee_email = (row.get('assignee_email') or '').strip()
+    if assignee_email:
+        assignee = profiles.get(assignee_email.lower())
+        if assignee is None or assignee[1] != UserRole.STAFF:
+            raise ValidationError(f"Assignee {assignee_email!r} is not a staff member.")
+        assigned_to_id = assignee[0]
+
+    subject = (row.get('subject') or '').strip()
+    if not subject or len(subject) > SUBJECT_MAX_LENGTH:
+        raise ValidationError(f"Subject must have 1 to {SUBJECT_MAX_LENGTH} characters.")
+
+    status = row.get('status') or TicketStatus.PENDING
+    if status not in TicketStatus.values:
+        raise ValidationError(f"Unknown status {status!r}.")
+
+    priority = row.get('priority') or TicketPriority.MEDIUM
+    if priority not in TicketPriority.values:
+        raise ValidationError(f"Unknown priority {priority!r}.")
+
+    created_at = now
+    if row.get('created_at'):
+        created_at = parse_datetime(row['created_at'])
+        if created_at is None:
+            raise ValidationError(f"Invalid created_at {row['created_at']!r}.")
+        if timezone.is_naive(created_at):
+            created_at = timezone.make_aware(created_at)
+
+    if row.get('ticket_id'):
+        try:
+            ticket_uuid = uuid.UUID(str(row['ticket_id']))
+        except ValueError:
+            raise ValidationError(f"Invalid ticket_id {row['ticket_id']!r}.")
+
+    return Ticket(
+        ticket_id=ticket_uuid,
+        created_by_id=creator[0],
+        assigned_to_id=assigned_to_id,
+        subject=subject,
+        description=row.get('description') or '',
+        status=status,
+        priority=priority,
+        created_at=created_at,
+    )
+
+
+def import_tickets(
+        *, rows: Iterable[Dict[str, Any]], batch_size: int = 1000,
+        batches_per_transaction: int = 10, skip_invalid: bool = False,
+        on_progress: Optional[Callable[[int], None]] = None
+) -> TicketImportResult:
+
+    """
+    Bulk-imports tickets, e.g. migrated from another helpdesk.
+
+    Creators and assignees are resolved by email through an in-memory map
+    of all profiles, built with one query. Tickets are inserted with
+    `bulk_create()` and added to the full-text index `batch_size` at a time,
+    and `batches_per_transaction` batches are committed together. Rows are
+    consumed lazily, so the input can be streamed from a file of any size.
+
+    Unlike `create_ticket()` there is no auto-assignment and no counter
+    update per ticket: the counter deltas of all tickets of a transaction
+    are applied together, in that transaction. Only when the import fails
+    are the counters rebuilt from the whole tickets table. `updated_at` is
+    the time of the import.
+
+    Args:
+        rows (Iterable[Dict[str, Any]]): Rows with the columns of
+            `TICKET_EXPORT_FIELDS`, see `read_ticket_import_rows()`.
+        batch_size (int, optional): Tickets per INSERT.
+        batches_per_transaction (int, optional): Batches per transaction.
+        skip_invalid (bool, optional): Skip invalid rows instead of failing.
+        on_progress (Callable[[int], None], optional): Called with the number
+            of imported tickets after every committed transaction.
+
+    Raises:
+        ValidationError: If a row is invalid and `skip_invalid` is not set;
+            the rows of the current transaction are rolled back.
+
+    Returns:
+        TicketImportResult: The number of imported and of skipped rows.
+    """
+
+    profiles = _get_profile_map()
+    now = timezone.now()
+    numbered_rows = enumerate(rows, start=1)
+    imported = skipped = 0
+    finished = False
+
+    try:
+        while not finished:
+            committed = 0
+            counter_keys = []
+            with transaction.atomic():
+                for _ in range(batches_per_transaction):
+                    batch = list(islice(numbered_rows, batch_size))
+                    if not batch:
+                        finished = True
+                        break
+
+                    tickets = []
+                    for ticket_uuid, (number, row) in zip(_uuid4_batch(len(batch)), batch):
+                        try:
+                            tickets.append(_build_ticket(
+                                row, profiles=profiles, ticket_uuid=ticket_uuid, now=now
+                            ))
+                        except ValidationError as e:
+                            if not skip_invalid:
+                                raise ValidationError(f"Row {number}: {e.messages[0]}")
+                            skipped += 1
+
+                    Ticket.objects.bulk_create(tickets, batch_size=batch_size)
+                    index_tickets(ticket_ids=[ticket.id for ticket in tickets])
+                    counter_keys += [
+                        key for ticket in tickets for key in ticket_counter_keys(ticket=ticket)
+                    ]
+                    committed += len(tickets)
+
+                # `bulk_create()` sends no signals, count the tickets here.
+                if counter_keys:
+                    ticket_counters_move(before=[], after=counter_keys)
+
+            imported += committed
+            if committed and on_progress is not None:
+                on_progress(imported)
+    except Exception:
+        if imported:
+            rebuild_ticket_counters()
+        raise
+    finally:
+        if imported:
+            invalidate_staff_workloads()
+
+    return TicketImportResult(imported=imported, skipped=skipped)
@@ -0,0 +1,127 @@
+import uuid
+from typing import Dict, List
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import reverse
+
+from ticketing_system.ticket.services import create_ticket
+from ticketing_system.users.models import Profile
+
+
+User = get_user_model()
+
+# Settings compared by the benchmark: the defaults of `config.django.base`
+# and the session/message setup of `config.django.production`.
+SETTINGS_PROFILES = {
+    "base": {
+        "SESSION_ENGINE": "django.contrib.sessions.backends.db",
+        "MESSAGE_STORAGE": "django.contrib.messages.storage.fallback.FallbackStorage",
+    },
+    "production": {
+        "SESSION_ENGINE": "django.contrib.sessions.backends.cached_db",
+        "MESSAGE_STORAGE": "django.contrib.messages.storage.cookie.CookieStorage",
+    },
+}
+
+BENCHMARK_PASSWORD = "Benchmark_passw0rd"
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+
+    """
+    Counts the database queries per request of the ticket list and detail
+    pages under the base and the production session/message settings.
+
+    A throwaway customer logs in through the login view (which flashes a
+    message) and then browses both pages. Everything runs in a transaction
+    that is rolled back, so the command is safe to run against any database.
+    The cache configured for the current settings is used as is.
+    """
+
+    help = "Benchmark the queries per request of the ticket list and detail pages."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--requests", type=int, default=10,
+            help="Number of requests per page and settings profile.",
+        )
+
+    def handle(self, *args, **options):
+        results: Dict[str, Dict[str, float]] = {}
+
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    email=f"benchmark-{uuid.uuid4().hex}@example.com",
+                    username=f"benchmark-{uuid.uuid4().hex[:16]}",
+                    password=BENCHMARK_PASSWORD,
+                    is_verified=True,
+                )
+                profile = Profile.objects.create(user=user)
+                ticket = create_ticket(
+                    created_by=profile, subject="Benchmark ticket",
+                    description="Created by benchmark_request_queries."
+                )
+
+                pages = {
+                    "list": reverse("tickets:list"),
+                    "detail": reverse("tickets:detail", args=[ticket.ticket_id]),
+                }
+
+                for name, profile_settings in SETTINGS_PROFILES.items():
+                    with override_settings(ALLOWED_HOSTS=["*"], **profile_settings):
+                        results[name] = self._benchmark(
+                            user=user, pages=pages, requests=options["requests"]
+                        )
+
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        self._report(results=results)
+
+    def _benchmark(self, *, user: 'User', pages: Dict[str, str], requests: int) -> Dict[str, float]:
+
+        """
+        Log in and request every page, returning the average queries per request.
+        """
+
+        client = Client()
+        response = client.post(
+            path=reverse("auth:login"),
+            data={"email": user.email, "password": BENCHMARK_PASSWORD},
+        )
+        if response.status_code != 302:
+            raise CommandError("Could not log in the benchmark user.")
+
+        averages = {}
+        for name, url in pages.items():
+            counts: List[int] = []
+            for _ in range(requests):
+                with CaptureQueriesContext(connection) as context:
+                    client.get(path=url)
+                counts.append(len(context.captured_queries))
+            averages[name] = sum(counts) / len(counts)
+
+        # Drop the session from the cache, the rows are rolled back anyway.
+        client.logout()
+        return averages
+
+    def _report(self, *, results: Dict[str, Dict[str, float]]) -> None:
+
+        base, production = results["base"], results["production"]
+
+        self.stdout.write(f"{'page':<10}{'base':>10}{'production':>12}{'saved':>8}")
+        for page in base:
+            self.stdout.write(
+                f"{page:<10}{base[page]:>10.1f}{production[page]:>12.1f}"
+                f"{base[page] - production[page]:>8.1f}"
+            )
@@ -0,0 +1,60 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ticketing_system.ticket.exports import (
+    TICKET_EXPORT_FIELDS, TICKET_EXPORT_FORMATS, iter_ticket_export
+)
+from ticketing_system.ticket.selectors import get_user_ticket_values
+from ticketing_system.users.models import Profile
+
+
+class Command(BaseCommand):
+
+    """
+    Streams the tickets visible to a user into a CSV or JSON Lines file.
+
+    The export is scoped like the ticket list of the given user: admins
+    export all tickets, staff members their assigned and customers their
+    own tickets. Rows are written while they are read, so memory use does
+    not grow with the number of tickets, see `iter_ticket_export()`.
+    """
+
+    help = "Export the tickets visible to a user into a CSV or JSON Lines file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", help="Path of the file to write.")
+        parser.add_argument(
+            "--user", required=True,
+            help="Email of the user whose visible tickets are exported.",
+        )
+        parser.add_argument(
+            "--format", choices=sorted(TICKET_EXPORT_FORMATS), default="csv",
+            help="Format of the export.",
+        )
+        parser.add_argument(
+            "--search", default="",
+            help="Only export tickets matching this full-text search.",
+        )
+        parser.add_argument("--gzip", action="store_true", help="Gzip the file.")
+
+    def handle(self, *args, **options):
+        try:
+            user_profile = Profile.objects.select_related('user').get(
+                user__email=options["user"]
+            )
+        except Profile.DoesNotExist:
+            raise CommandError(f"No user with the email {options['user']}.")
+
+        rows = get_user_ticket_values(
+            user_profile=user_profile, fields=TICKET_EXPORT_FIELDS,
+            search=options["search"].strip(),
+        )
+
+        written = 0
+        with open(options["output"], "wb") as output:
+            for chunk in iter_ticket_export(
+                    rows=rows, export_format=options["format"], compress=options["gzip"]
+            ):
+                output.write(chunk)
+                written += len(chunk)
+
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} bytes to {options['output']}."))
@@ -0,0 +1,79 @@
+import gzip
+import time
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError
+
+from ticketing_system.ticket.imports import (
+    TICKET_IMPORT_FORMATS, import_tickets, read_ticket_import_rows
+)
+
+
+class Command(BaseCommand):
+
+    """
+    Bulk-imports tickets from a CSV or JSON Lines file, e.g. when migrating
+    from another helpdesk.
+
+    The file uses the columns written by `export_tickets` and may be
+    gzipped (`.gz`). Creators and assignees are matched by email. See
+    `import_tickets()` for how the rows are written.
+    """
+
+    help = "Import tickets from a CSV or JSON Lines file (optionally gzipped)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("input", help="Path of the file to import.")
+        parser.add_argument(
+            "--format", choices=TICKET_IMPORT_FORMATS,
+            help="Format of the file, guessed from its extension by default.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000,
+            help="Number of tickets inserted per statement.",
+        )
+        parser.add_argument(
+            "--batches-per-transaction", type=int, default=10,
+            help="Number of batches committed together.",
+        )
+        parser.add_argument(
+            "--skip-invalid", action="store_true",
+            help="Skip invalid rows instead of stopping at the first one.",
+        )
+
+    def handle(self, *args, **options):
+        path = options["input"]
+        compressed = path.endswith(".gz")
+        import_format = options["format"] or path.removesuffix(".gz").rpartition(".")[2]
+        if import_format not in TICKET_IMPORT_FORMATS:
+            raise CommandError("Cannot guess the format of the file, pass --format.")
+
+        opener = gzip.open if compressed else open
+        started = time.monotonic()
+
+        def _report(imported: int) -> None:
+            rate = self._rate(imported, started)
+            self.stdout.write(f"{imported} tickets imported ({rate} rows/s).")
+
+        try:
+            with opener(path, "rt", encoding="utf-8", newline="") as file:
+                result = import_tickets(
+                    rows=read_ticket_import_rows(file=file, import_format=import_format),
+                    batch_size=options["batch_size"],
+                    batches_per_transaction=options["batches_per_transaction"],
+                    skip_invalid=options["skip_invalid"],
+                    on_progress=_report,
+                )
+        except (IntegrityError, OSError, ValidationError) as e:
+            message = e.messages[0] if isinstance(e, ValidationError) else str(e)
+            raise CommandError(message)
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {result.imported} tickets, skipped {result.skipped}, in "
+            f"{time.monotonic() - started:.1f}s ({self._rate(result.imported, started)} rows/s)."
+        ))
+
+    @staticmethod
+    def _rate(imported: int, started: float) -> int:
+        return round(imported / max(time.monotonic() - started, 1e-6))
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from ticketing_system.ticket.services import rebuild_ticket_counters
+
+
+class Command(BaseCommand):
+
+    """
+    Rebuilds the denormalized ticket counters from the tickets table.
+
+    Run it after writing tickets outside the ticket services,
+    or whenever the counters are suspected to have drifted.
+    """
+
+    help = "Rebuild the per-profile and global ticket counters from scratch."
+
+    def handle(self, *args, **options):
+        written = rebuild_ticket_counters()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {written} ticket counters."))
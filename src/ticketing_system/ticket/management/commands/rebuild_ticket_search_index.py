@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ticketing_system.ticket.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+
+    """
+    Rebuilds the full-text search index of all tickets.
+
+    Useful after loading data that bypassed the ticket services,
+    e.g. raw SQL imports or restored backups.
+    """
+
+    help = "Rebuild the full-text search index of all tickets."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=900,
+            help="Number of tickets indexed per statement.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            indexed = rebuild_search_index(batch_size=options["batch_size"])
+
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} tickets."))
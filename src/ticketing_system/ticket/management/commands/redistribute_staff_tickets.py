@@ -0,0 +1,61 @@
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from ticketing_system.ticket.assignment import AUTO_ASSIGNMENT_STRATEGIES
+from ticketing_system.ticket.models import TicketStatus
+from ticketing_system.ticket.services import redistribute_staff_tickets
+from ticketing_system.users.models import Profile, UserRole
+
+
+class Command(BaseCommand):
+
+    """
+    Redistributes the in-progress tickets of staff members over the other
+    active staff members, e.g. after a staff member was deactivated.
+
+    Either name the staff members by email, or pass `--inactive` to take the
+    tickets of every deactivated staff member that still holds some.
+    """
+
+    help = "Move the in-progress tickets of the given staff members to the remaining staff."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "emails", nargs="*",
+            help="Emails of the staff members to take the tickets from.",
+        )
+        parser.add_argument(
+            "--inactive", action="store_true",
+            help="Take the tickets of all deactivated staff members.",
+        )
+        parser.add_argument(
+            "--strategy", choices=sorted(AUTO_ASSIGNMENT_STRATEGIES),
+            help="Assignment strategy used to pick the new assignees.",
+        )
+
+    def handle(self, *args, **options):
+        staff = Profile.objects.filter(role=UserRole.STAFF)
+
+        if options["inactive"]:
+            staff = staff.filter(
+                user__is_active=False, assigned_tickets__status=TicketStatus.IN_PROGRESS
+            ).distinct()
+        elif options["emails"]:
+            staff = staff.filter(user__email__in=options["emails"])
+        else:
+            raise CommandError("Pass the emails of the staff members or --inactive.")
+
+        staff_ids = list(staff.values_list('id', flat=True))
+        if not staff_ids:
+            self.stdout.write("No matching staff members.")
+            return
+
+        try:
+            moved = redistribute_staff_tickets(staff_ids=staff_ids, strategy=options["strategy"])
+        except ValidationError as e:
+            raise CommandError(e.messages[0])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Moved {sum(moved.values())} tickets from {len(staff_ids)} staff members "
+            f"to {len(moved)} staff members."
+        ))
@@ -0,0 +1,68 @@
+from django.db import migrations
+
+
+SQLITE_SEARCH_TABLE = "ticket_ticket_fts"
+POSTGRES_SEARCH_COLUMN = "search_vector"
+POSTGRES_SEARCH_INDEX = "ticket_search_vector_idx"
+
+
+def create_search_index(apps, schema_editor):
+
+    """
+    Create the backend specific full-text index for tickets and backfill it.
+
+    - SQLite: an FTS5 virtual table keyed by the ticket id (rowid).
+    - PostgreSQL: a weighted tsvector column with a GIN index.
+    """
+
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_SEARCH_TABLE} USING fts5("
+            "subject, description, tokenize = 'porter unicode61', prefix = '2 3'"
+            ")"
+        )
+        schema_editor.execute(
+            f"INSERT INTO {SQLITE_SEARCH_TABLE} (rowid, subject, description) "
+            "SELECT id, subject, description FROM ticket_ticket"
+        )
+
+    elif vendor == "postgresql":
+        schema_editor.execute(
+            f"ALTER TABLE ticket_ticket ADD COLUMN IF NOT EXISTS {POSTGRES_SEARCH_COLUMN} tsvector"
+        )
+        schema_editor.execute(
+            f"UPDATE ticket_ticket SET {POSTGRES_SEARCH_COLUMN} = "
+            "setweight(to_tsvector('english', coalesce(subject, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')"
+        )
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {POSTGRES_SEARCH_INDEX} "
+            f"ON ticket_ticket USING GIN ({POSTGRES_SEARCH_COLUMN})"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+
+    vendor = schema_editor.connection.vendor
+
+    if vendor == "sqlite":
+        schema_editor.execute(f"DROP TABLE IF EXISTS {SQLITE_SEARCH_TABLE}")
+
+    elif vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {POSTGRES_SEARCH_INDEX}")
+        schema_editor.execute(
+            f"ALTER TABLE ticket_ticket DROP COLUMN IF EXISTS {POSTGRES_SEARCH_COLUMN}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticket', '0002_ticket_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
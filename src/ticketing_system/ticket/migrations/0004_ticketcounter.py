@@ -0,0 +1,73 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:27
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+def backfill_ticket_counters(apps, schema_editor):
+
+    """
+    Populate the counters from the tickets that already exist.
+    """
+
+    Ticket = apps.get_model('ticket', 'Ticket')
+    TicketCounter = apps.get_model('ticket', 'TicketCounter')
+
+    counters = [
+        TicketCounter(scope='global', status=row['status'], count=row['count'])
+        for row in Ticket.objects.order_by().values('status').annotate(count=models.Count('id'))
+    ]
+    counters += [
+        TicketCounter(
+            scope='created', profile_id=row['created_by'], status=row['status'], count=row['count']
+        )
+        for row in Ticket.objects.order_by().values('created_by', 'status').annotate(
+            count=models.Count('id')
+        )
+    ]
+    counters += [
+        TicketCounter(
+            scope='assigned', profile_id=row['assigned_to'], status=row['status'], count=row['count']
+        )
+        for row in Ticket.objects.filter(assigned_to__isnull=False).order_by().values(
+            'assigned_to', 'status'
+        ).annotate(count=models.Count('id'))
+    ]
+    TicketCounter.objects.bulk_create(counters, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_remove_profile_tickets_closed_and_more'),
+        ('ticket', '0003_ticket_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('scope', models.CharField(choices=[('global', 'Global'), ('created', 'Created'), ('assigned', 'Assigned')], help_text='Which tickets this counter covers.', max_length=10, verbose_name='Scope')),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('in_progress', 'In Progress'), ('closed', 'Closed')], help_text='Ticket status being counted.', max_length=15, verbose_name='Status')),
+                ('count', models.IntegerField(default=0, help_text='Number of tickets in this scope and status.', verbose_name='Count')),
+                ('profile', models.ForeignKey(blank=True, help_text='Profile the counter belongs to, empty for global counters.', null=True, on_delete=django.db.models.deletion.CASCADE, related_name='ticket_counters', to='users.profile', verbose_name='Profile')),
+            ],
+            options={
+                'verbose_name': 'Ticket Counter',
+                'verbose_name_plural': 'Ticket Counters',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='ticketcounter',
+            constraint=models.UniqueConstraint(condition=models.Q(('profile__isnull', False)), fields=('profile', 'scope', 'status'), name='unique_profile_ticket_counter'),
+        ),
+        migrations.AddConstraint(
+            model_name='ticketcounter',
+            constraint=models.UniqueConstraint(condition=models.Q(('profile__isnull', True)), fields=('scope', 'status'), name='unique_global_ticket_counter'),
+        ),
+        migrations.RunPython(backfill_ticket_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticket', '0004_ticketcounter'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['status', '-updated_at', '-id'], name='ticket_status_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['priority', '-updated_at', '-id'], name='ticket_priority_updated_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['status', 'priority', 'assigned_to'], name='ticket_facets_idx'),
+        ),
+    ]
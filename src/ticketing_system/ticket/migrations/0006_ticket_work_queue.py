@@ -0,0 +1,26 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticket', '0005_ticket_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ticket',
+            name='lease_expires_at',
+            field=models.DateTimeField(blank=True, help_text='Set while a ticket claimed from the work queue is not yet accepted; once passed, the ticket may be claimed by someone else.', null=True, verbose_name='Lease Expires At'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(condition=models.Q(('assigned_to__isnull', True), ('status', 'pending')), fields=['priority', 'created_at', 'id'], name='ticket_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(condition=models.Q(('lease_expires_at__isnull', False)), fields=['lease_expires_at'], name='ticket_lease_expires_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.30 on 2026-10-17 08:01
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ticket', '0006_ticket_work_queue'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ticket_pk', models.BigIntegerField(help_text='Primary key the deleted ticket had.', verbose_name='Ticket Primary Key')),
+                ('ticket_id', models.UUIDField(help_text='Public identifier the deleted ticket had.', verbose_name='Ticket ID')),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now, help_text='When the ticket was deleted.', verbose_name='Deleted At')),
+            ],
+            options={
+                'verbose_name': 'Ticket Deletion',
+                'verbose_name_plural': 'Ticket Deletions',
+                'indexes': [models.Index(fields=['deleted_at', 'ticket_pk'], name='ticket_deletion_feed_idx')],
+            },
+        ),
+    ]
@@ -1,6 +1,8 @@
 import uuid
+from typing import NamedTuple, Tuple
 
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from ticketing_system.core.models import BaseModel
@@ -19,12 +21,46 @@ class TicketPriority(models.TextChoices):
     URGENT = "urgent", _("Urgent")
 
 
+class TicketTransition(NamedTuple):
+
+    """
+    A ticket status transition: the statuses it may start from and the
+    status it ends in.
+    """
+
+    sources: Tuple[str, ...]
+    target: str
+
+
 class Ticket(BaseModel):
 
     """
     Model representing a support ticket.
     """
 
+    # The ticket state machine, PENDING -> IN_PROGRESS -> CLOSED. Transitions
+    # are applied as conditional UPDATEs by `ticket.services.ticket_transition()`.
+    TRANSITIONS = {
+        'assign': TicketTransition(
+            sources=(TicketStatus.PENDING, TicketStatus.IN_PROGRESS),
+            target=TicketStatus.IN_PROGRESS,
+        ),
+        'close': TicketTransition(
+            sources=(TicketStatus.PENDING, TicketStatus.IN_PROGRESS),
+            target=TicketStatus.CLOSED,
+        ),
+        # A staff member hands a claimed ticket back to the work queue.
+        'release': TicketTransition(
+            sources=(TicketStatus.IN_PROGRESS,),
+            target=TicketStatus.PENDING,
+        ),
+    }
+
+    # Order in which the work queue hands out unassigned tickets.
+    QUEUE_PRIORITIES = (
+        TicketPriority.URGENT, TicketPriority.HIGH, TicketPriority.MEDIUM, TicketPriority.LOW
+    )
+
     ticket_id = models.UUIDField(
         default=uuid.uuid4,
         editable=False,
@@ -91,11 +127,182 @@ class Ticket(BaseModel):
         help_text=_("Priority level of the ticket.")
     )
 
+    lease_expires_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name=_("Lease Expires At"),
+        help_text=_(
+            "Set while a ticket claimed from the work queue is not yet accepted; "
+            "once passed, the ticket may be claimed by someone else."
+        )
+    )
+
     class Meta:
 
         ordering = ["-updated_at", "-created_at"]
         verbose_name = _("Ticket")
         verbose_name_plural = _("Tickets")
+        indexes = [
+            # Keyset pagination on (updated_at, id), one index per role scope
+            # in `get_user_tickets`: admins (all), staff (assigned_to) and
+            # customers (created_by). The change feed (`get_ticket_changes`)
+            # walks the first one backwards, in ascending order.
+            models.Index(
+                fields=["-updated_at", "-id"], name="ticket_updated_id_idx"
+            ),
+            models.Index(
+                fields=["assigned_to", "-updated_at", "-id"],
+                name="ticket_assignee_updated_idx"
+            ),
+            models.Index(
+                fields=["created_by", "-updated_at", "-id"],
+                name="ticket_creator_updated_idx"
+            ),
+            # Filtered list pages (`TicketFilter`): the filter column first,
+            # then the keyset ordering, so a filtered page is a range scan.
+            models.Index(
+                fields=["status", "-updated_at", "-id"],
+                name="ticket_status_updated_idx"
+            ),
+            models.Index(
+                fields=["priority", "-updated_at", "-id"],
+                name="ticket_priority_updated_idx"
+            ),
+            # Covers the grouped facet count query (`get_ticket_facet_counts`).
+            models.Index(
+                fields=["status", "priority", "assigned_to"],
+                name="ticket_facets_idx"
+            ),
+            # Work queue (`claim_next_ticket`): the oldest unassigned ticket of
+            # a priority, and claims whose lease has expired.
+            models.Index(
+                fields=["priority", "created_at", "id"],
+                name="ticket_queue_idx",
+                condition=models.Q(status=TicketStatus.PENDING, assigned_to__isnull=True),
+            ),
+            models.Index(
+                fields=["lease_expires_at"],
+                name="ticket_lease_expires_idx",
+                condition=models.Q(lease_expires_at__isnull=False),
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.subject} ({self.get_status_display()})"
+
+
+class TicketDeletion(models.Model):
+
+    """
+    Tombstone of a deleted ticket, so the change feed can report deletions.
+
+    Written by the `post_delete` signal of `Ticket` (see `ticket.signals`).
+    Tombstones are ordered on `(deleted_at, ticket_pk)`, the same keyset as
+    the `(updated_at, id)` of the tickets themselves.
+    """
+
+    ticket_pk = models.BigIntegerField(
+        verbose_name=_("Ticket Primary Key"),
+        help_text=_("Primary key the deleted ticket had.")
+    )
+
+    ticket_id = models.UUIDField(
+        verbose_name=_("Ticket ID"),
+        help_text=_("Public identifier the deleted ticket had.")
+    )
+
+    deleted_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name=_("Deleted At"),
+        help_text=_("When the ticket was deleted.")
+    )
+
+    class Meta:
+
+        verbose_name = _("Ticket Deletion")
+        verbose_name_plural = _("Ticket Deletions")
+        indexes = [
+            models.Index(
+                fields=["deleted_at", "ticket_pk"], name="ticket_deletion_feed_idx"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.ticket_id} deleted at {self.deleted_at}"
+
+
+class TicketCounterScope(models.TextChoices):
+    GLOBAL = "global", _("Global")
+    CREATED = "created", _("Created")
+    ASSIGNED = "assigned", _("Assigned")
+
+
+class TicketCounter(BaseModel):
+
+    """
+    Denormalized number of tickets per status.
+
+    One row exists per (scope, profile, status):
+
+    - GLOBAL rows have no profile and count all tickets.
+    - CREATED rows count the tickets a profile created.
+    - ASSIGNED rows count the tickets assigned to a profile.
+
+    Rows are maintained with `F()` increments: by the ticket services for
+    set-based UPDATEs, and by the `ticket.signals` handlers for every
+    `Ticket.save()` and delete, so tickets written by factories, the shell or
+    the admin are counted too. Writes that send no signals (`update()`,
+    `bulk_create()`, raw SQL, data migrations using historical models) must
+    adjust the counters themselves or run the `rebuild_ticket_counters`
+    command afterwards.
+    """
+
+    scope = models.CharField(
+        max_length=10,
+        choices=TicketCounterScope.choices,
+        verbose_name=_("Scope"),
+        help_text=_("Which tickets this counter covers.")
+    )
+
+    profile = models.ForeignKey(
+        to='users.Profile',
+        on_delete=models.CASCADE,
+        related_name="ticket_counters",
+        null=True,
+        blank=True,
+        verbose_name=_("Profile"),
+        help_text=_("Profile the counter belongs to, empty for global counters.")
+    )
+
+    status = models.CharField(
+        max_length=15,
+        choices=TicketStatus.choices,
+        verbose_name=_("Status"),
+        help_text=_("Ticket status being counted.")
+    )
+
+    count = models.IntegerField(
+        default=0,
+        verbose_name=_("Count"),
+        help_text=_("Number of tickets in this scope and status.")
+    )
+
+    class Meta:
+
+        verbose_name = _("Ticket Counter")
+        verbose_name_plural = _("Ticket Counters")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["profile", "scope", "status"],
+                condition=models.Q(profile__isnull=False),
+                name="unique_profile_ticket_counter"
+            ),
+            models.UniqueConstraint(
+                fields=["scope", "status"],
+                condition=models.Q(profile__isnull=True),
+                name="unique_global_ticket_counter"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_scope_display()} {self.get_status_display()}: {self.count}"
@@ -0,0 +1,231 @@
+import re
+from typing import Iterable, List
+
+from django.db import connection
+from django.db.models import BooleanField, FloatField, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
+
+from ticketing_system.ticket.models import Ticket
+
+
+# SQLite keeps an FTS5 virtual table whose rowid mirrors `Ticket.id`,
+# PostgreSQL keeps a weighted tsvector column on the ticket table itself.
+# Both are created by the `0003_ticket_search_index` migration.
+SQLITE_SEARCH_TABLE = "ticket_ticket_fts"
+POSTGRES_SEARCH_COLUMN = "search_vector"
+POSTGRES_SEARCH_CONFIG = "english"
+
+# Relative weight of `subject` over `description` when ranking.
+SQLITE_SUBJECT_WEIGHT = 10.0
+SQLITE_DESCRIPTION_WEIGHT = 1.0
+
+# Order search results by relevance, then by id to keep the order total
+# for keyset pagination.
+SEARCH_ORDERING = ("-search_rank", "-id")
+
+# Upper bound on terms taken from a single search input.
+MAX_SEARCH_TERMS = 16
+
+# Ticket ids bound per indexing statement, below SQLite's default limit of
+# 999 query parameters.
+SEARCH_INDEX_BATCH_SIZE = 900
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def _search_terms(search: str) -> List[str]:
+
+    """
+    Split raw user input into plain word terms.
+
+    Everything that is not a word character is dropped, so the terms can be
+    safely embedded into FTS5 and tsquery expressions without escaping issues.
+    """
+
+    return _TERM_RE.findall(search or "")[:MAX_SEARCH_TERMS]
+
+
+def _sqlite_match_expression(terms: List[str]) -> str:
+
+    # Every term is quoted and prefix-matched so results update as the user types.
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _postgres_tsquery_expression(terms: List[str]) -> str:
+
+    return " & ".join(f"{term}:*" for term in terms)
+
+
+def apply_ticket_search(*, queryset: QuerySet['Ticket'], search: str) -> QuerySet['Ticket']:
+
+    """
+    Restrict a ticket queryset to full-text matches and annotate their relevance.
+
+    The queryset keeps any filtering applied before (e.g. role scoping), and
+    gains a `search_rank` annotation where higher means more relevant.
+
+    - SQLite: matches against the FTS5 index and ranks with `bm25()`.
+    - PostgreSQL: matches the GIN-indexed tsvector and ranks with `ts_rank_cd()`.
+    - Other backends fall back to `icontains` with a constant rank.
+
+    Args:
+        queryset (QuerySet[Ticket]): The ticket queryset to search in.
+        search (str): The raw search input.
+
+    Returns:
+        QuerySet[Ticket]: The matching tickets annotated with `search_rank`.
+    """
+
+    terms = _search_terms(search)
+    if not terms:
+        return queryset.annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+    ticket_table = Ticket._meta.db_table
+
+    if connection.vendor == "sqlite":
+        match = _sqlite_match_expression(terms)
+        return queryset.filter(
+            RawSQL(
+                f"{ticket_table}.id IN ("
+                f"SELECT rowid FROM {SQLITE_SEARCH_TABLE} WHERE {SQLITE_SEARCH_TABLE} MATCH %s"
+                f")",
+                (match,),
+                output_field=BooleanField(),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f"SELECT -bm25({SQLITE_SEARCH_TABLE}, %s, %s) FROM {SQLITE_SEARCH_TABLE} "
+                f"WHERE {SQLITE_SEARCH_TABLE} MATCH %s "
+                f"AND {SQLITE_SEARCH_TABLE}.rowid = {ticket_table}.id",
+                (SQLITE_SUBJECT_WEIGHT, SQLITE_DESCRIPTION_WEIGHT, match),
+                output_field=FloatField(),
+            )
+        )
+
+    if connection.vendor == "postgresql":
+        tsquery = _postgres_tsquery_expression(terms)
+        return queryset.filter(
+            RawSQL(
+                f"{ticket_table}.{POSTGRES_SEARCH_COLUMN} @@ to_tsquery(%s, %s)",
+                (POSTGRES_SEARCH_CONFIG, tsquery),
+                output_field=BooleanField(),
+            )
+        ).annotate(
+            search_rank=RawSQL(
+                f"ts_rank_cd({ticket_table}.{POSTGRES_SEARCH_COLUMN}, to_tsquery(%s, %s))",
+                (POSTGRES_SEARCH_CONFIG, tsquery),
+                output_field=FloatField(),
+            )
+        )
+
+    condition = Q()
+    for term in terms:
+        condition &= Q(subject__icontains=term) | Q(description__icontains=term)
+
+    return queryset.filter(condition).annotate(
+        search_rank=Value(0.0, output_field=FloatField())
+    )
+
+
+def index_tickets(*, ticket_ids: Iterable[int]) -> None:
+
+    """
+    Refresh the full-text index entries of the given tickets.
+
+    Must be called by every service that creates tickets or changes their
+    `subject` or `description`, and by `TicketAdmin.save_model()`. Works
+    set-based, so bulk writers can pass a whole batch of ids at once; the
+    ids are indexed `SEARCH_INDEX_BATCH_SIZE` at a time.
+
+    Args:
+        ticket_ids (Iterable[int]): Primary keys of the tickets to (re)index.
+    """
+
+    ticket_ids = list(ticket_ids)
+    ticket_table = Ticket._meta.db_table
+
+    with connection.cursor() as cursor:
+        for offset in range(0, len(ticket_ids), SEARCH_INDEX_BATCH_SIZE):
+            batch = ticket_ids[offset:offset + SEARCH_INDEX_BATCH_SIZE]
+            placeholders = ", ".join(["%s"] * len(batch))
+
+            if connection.vendor == "sqlite":
+                cursor.execute(
+                    f"DELETE FROM {SQLITE_SEARCH_TABLE} WHERE rowid IN ({placeholders})",
+                    batch,
+                )
+                cursor.execute(
+                    f"INSERT INTO {SQLITE_SEARCH_TABLE} (rowid, subject, description) "
+                    f"SELECT id, subject, description FROM {ticket_table} "
+                    f"WHERE id IN ({placeholders})",
+                    batch,
+                )
+
+            elif connection.vendor == "postgresql":
+                cursor.execute(
+                    f"UPDATE {ticket_table} SET {POSTGRES_SEARCH_COLUMN} = "
+                    f"setweight(to_tsvector(%s, coalesce(subject, '')), 'A') || "
+                    f"setweight(to_tsvector(%s, coalesce(description, '')), 'B') "
+                    f"WHERE id IN ({placeholders})",
+                    [POSTGRES_SEARCH_CONFIG, POSTGRES_SEARCH_CONFIG, *batch],
+                )
+
+
+def unindex_tickets(*, ticket_ids: Iterable[int]) -> None:
+
+    """
+    Remove the full-text index entries of deleted tickets.
+
+    Only SQLite keeps the index in a separate table; on PostgreSQL the
+    tsvector column is deleted together with the ticket row.
+
+    Args:
+        ticket_ids (Iterable[int]): Primary keys of the deleted tickets.
+    """
+
+    ticket_ids = list(ticket_ids)
+    if connection.vendor != "sqlite":
+        return
+
+    with connection.cursor() as cursor:
+        for offset in range(0, len(ticket_ids), SEARCH_INDEX_BATCH_SIZE):
+            batch = ticket_ids[offset:offset + SEARCH_INDEX_BATCH_SIZE]
+            placeholders = ", ".join(["%s"] * len(batch))
+            cursor.execute(
+                f"DELETE FROM {SQLITE_SEARCH_TABLE} WHERE rowid IN ({placeholders})",
+                batch,
+            )
+
+
+def rebuild_search_index(*, batch_size: int = SEARCH_INDEX_BATCH_SIZE) -> int:
+
+    """
+    Rebuild the full-text index for every ticket from scratch.
+
+    Args:
+        batch_size (int): Number of tickets indexed per statement.
+
+    Returns:
+        int: The number of indexed tickets.
+    """
+
+    if connection.vendor == "sqlite":
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SQLITE_SEARCH_TABLE}")
+
+    indexed = 0
+    last_id = 0
+    while True:
+        ticket_ids = list(
+            Ticket.objects.filter(id__gt=last_id)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not ticket_ids:
+            break
+
+        index_tickets(ticket_ids=ticket_ids)
+        indexed += len(ticket_ids)
+        last_id = ticket_ids[-1]
+
+    return indexed
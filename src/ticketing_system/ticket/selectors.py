@@ -1,10 +1,93 @@
-from typing import Dict
+import heapq
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from django.db.models import Count, Q, QuerySet
+from django.conf import settings
+from django.db.models import Count, F, Max, Q, QuerySet
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 
+from ticketing_system.core.cache import cache_get_or_compute, versioned_cache_key
 from ticketing_system.users.models import Profile, UserRole
-from ticketing_system.ticket.models import Ticket, TicketStatus
+from ticketing_system.ticket.models import (
+    Ticket, TicketCounter, TicketCounterScope, TicketDeletion, TicketPriority, TicketStatus
+)
+from ticketing_system.ticket.search import apply_ticket_search
+
+
+# Cache namespace of the global ticket status counts. The ticket services bump
+# its version on every status transition.
+TICKET_COUNTS_CACHE_NAMESPACE = "tickets:counts"
+
+# Columns fetched for a row of the ticket list, see `get_user_ticket_rows`.
+TICKET_LIST_FIELDS = (
+    "id", "ticket_id", "subject", "status", "priority",
+    "created_at", "updated_at", "created_by_id",
+)
+
+
+class TicketListRow:
+
+    """
+    A lightweight, read-only ticket of the ticket list.
+
+    Holds only the displayed and paginated columns in `__slots__`, so a page
+    of rows carries neither the ticket's description nor whole creator
+    profiles and users. Mirrors the `Ticket` API used by the list template.
+
+    Attributes:
+        creator_email (str): The email of the user who created the ticket.
+        search_rank (Optional[float]): Relevance of a search result.
+        viewer_is_creator (bool): Whether the viewing profile created the ticket,
+            set by the view.
+    """
+
+    __slots__ = (*TICKET_LIST_FIELDS, "creator_email", "search_rank", "viewer_is_creator")
+
+    def __init__(self, **values: Any) -> None:
+        for name in self.__slots__:
+            setattr(self, name, values.get(name))
+
+    def get_status_display(self) -> str:
+        return TicketStatus(self.status).label
+
+    def get_priority_display(self) -> str:
+        return TicketPriority(self.priority).label
+
+    def __repr__(self) -> str:
+        return f"<TicketListRow: {self.ticket_id}>"
+
+
+def get_ticket_visibility_filter(*, user_profile: 'Profile') -> Q:
+
+    """
+    Build the filter selecting the tickets a profile may see.
+
+    - ADMIN: all tickets.
+    - STAFF: only tickets assigned to them.
+    - CUSTOMER: only tickets they created.
+
+    Every ticket lookup made on behalf of a user should apply this filter, so
+    access control is enforced by the (indexed) query itself.
+
+    Args:
+        user_profile (Profile): The profile of the logged-in user.
+
+    Returns:
+        Q: The visibility filter for the `Ticket` model.
+    """
+
+    role = user_profile.role
+
+    if role == UserRole.ADMIN:
+        return Q()
+
+    if role == UserRole.STAFF:
+        return Q(assigned_to=user_profile)
+
+    # Default for customers
+    return Q(created_by=user_profile)
 
 
 def get_user_tickets(*, user_profile: 'Profile') -> QuerySet['Ticket']:
@@ -23,21 +106,232 @@ def get_user_tickets(*, user_profile: 'Profile') -> QuerySet['Ticket']:
         QuerySet[Ticket]: A queryset containing tickets relevant to the user.
     """
 
-    role = user_profile.role
+    return (
+        Ticket.objects
+        .select_related("created_by", "created_by__user")
+        .filter(get_ticket_visibility_filter(user_profile=user_profile))
+    )
 
-    if role == UserRole.ADMIN:
-        return Ticket.objects.select_related("created_by", "created_by__user").all()
 
-    if role == UserRole.STAFF:
-        return (
-            Ticket.objects
-            .select_related("created_by", "created_by__user")
-            .filter(assigned_to=user_profile)
+def search_user_tickets(*, user_profile: 'Profile', search: str) -> QuerySet['Ticket']:
+
+    """
+    Full-text search within the tickets visible to the user.
+
+    Applies the same role scoping as `get_user_tickets()` and restricts it
+    to tickets whose subject or description match the search input, using
+    the backend's full-text index.
+
+    Args:
+        user_profile (Profile): The profile of the logged-in user.
+        search (str): The raw search input.
+
+    Returns:
+        QuerySet[Ticket]: Matching tickets annotated with `search_rank`
+        (higher is more relevant).
+    """
+
+    return apply_ticket_search(
+        queryset=get_user_tickets(user_profile=user_profile), search=search
+    )
+
+
+def get_user_ticket_rows(*, user_profile: 'Profile', search: str = "") -> QuerySet:
+
+    """
+    Projects the tickets visible to the user onto the ticket list columns.
+
+    Fetches only `TICKET_LIST_FIELDS` and the creator's email through
+    `values()`, so unbounded columns like `description` never leave the
+    database. Turn a page of the returned dicts into `TicketListRow` objects
+    with `to_ticket_list_rows()`.
+
+    Args:
+        user_profile (Profile): The profile of the logged-in user.
+        search (str, optional): Full-text search input; if given, only matching
+            tickets are returned, with their `search_rank`.
+
+    Returns:
+        QuerySet: A `values()` queryset of the ticket list columns.
+    """
+
+    fields = TICKET_LIST_FIELDS
+
+    if search:
+        queryset = search_user_tickets(user_profile=user_profile, search=search)
+        fields += ("search_rank",)
+    else:
+        queryset = get_user_tickets(user_profile=user_profile)
+
+    return queryset.values(*fields, creator_email=F("created_by__user__email"))
+
+
+def get_user_ticket_values(
+        *, user_profile: 'Profile', fields: Dict[str, Any], search: str = ""
+) -> QuerySet:
+
+    """
+    Projects the tickets visible to the user onto the given named columns.
+
+    Like `get_user_ticket_rows()`, but the caller picks the columns, e.g. the
+    sparse fieldset requested from the API. Rows are plain dicts, no model
+    instances are built.
+
+    Args:
+        user_profile (Profile): The profile of the logged-in user.
+        fields (Dict[str, Any]): Output name to model field path or expression,
+            e.g. ``{'subject': 'subject', 'creator_email': F('created_by__user__email')}``.
+        search (str, optional): Full-text search input; if given, only matching
+            tickets are returned, with their `search_rank`.
+
+    Returns:
+        QuerySet: A `values()` queryset with one key per entry of `fields`.
+    """
+
+    if search:
+        queryset = search_user_tickets(user_profile=user_profile, search=search)
+        return _ticket_values(queryset, fields=fields, columns=["search_rank"])
+
+    return _ticket_values(get_user_tickets(user_profile=user_profile), fields=fields)
+
+
+def _ticket_values(
+        queryset: QuerySet['Ticket'], *, fields: Dict[str, Any], columns: Iterable[str] = ()
+) -> QuerySet:
+
+    """
+    Projects a ticket queryset onto the given named columns, see
+    `get_user_ticket_values()`.
+    """
+
+    columns = list(columns)
+    expressions = {}
+    for name, expression in fields.items():
+        if expression == name:
+            columns.append(name)
+        else:
+            expressions[name] = F(expression) if isinstance(expression, str) else expression
+
+    return queryset.values(*columns, **expressions)
+
+
+def get_ticket_changes(
+        *, fields: Dict[str, Any], limit: int, after: Optional[Tuple[datetime, int]] = None
+) -> Tuple[List[Dict[str, Any]], bool]:
+
+    """
+    Returns the tickets changed or deleted after a position, oldest change first.
+
+    Changes are ordered on `(updated_at, id)`. Tickets and the tombstones of
+    deleted tickets (`TicketDeletion`) are each read with an index range
+    scan starting right after the position, then merged, so a page costs
+    two `LIMIT` queries however large the table is. Changes younger than
+    `settings.TICKET_CHANGES_SETTLE_SECONDS` are held back, see there.
+
+    Args:
+        fields (Dict[str, Any]): Output name to model field path or expression
+            of the changed tickets, as in `get_user_ticket_values()`.
+        limit (int): Maximum number of changes to return.
+        after (Tuple[datetime, int], optional): The `(updated_at, id)` of
+            the last change seen, or None to start from the oldest ticket.
+
+    Returns:
+        Tuple[List[Dict[str, Any]], bool]: The changes, and whether more
+        changes follow. Every change has `id`, `ticket_id`, `updated_at` and
+        `deleted`; changed tickets also have the requested fields.
+    """
+
+    settled_before = timezone.now() - timedelta(seconds=settings.TICKET_CHANGES_SETTLE_SECONDS)
+    tickets = Ticket.objects.filter(updated_at__lt=settled_before)
+    deletions = TicketDeletion.objects.filter(deleted_at__lt=settled_before)
+
+    if after is not None:
+        updated_at, pk = after
+        tickets = tickets.filter(
+            Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, id__gt=pk)
+        )
+        deletions = deletions.filter(
+            Q(deleted_at__gt=updated_at) | Q(deleted_at=updated_at, ticket_pk__gt=pk)
         )
 
-    # Default for customers
-    return Ticket.objects.select_related("created_by", "created_by__user").filter(
-        created_by=user_profile
+    ticket_rows = _ticket_values(
+        tickets.order_by('updated_at', 'id'),
+        fields={**fields, 'ticket_id': 'ticket_id', 'updated_at': 'updated_at', 'id': 'id'},
+    )[:limit + 1]
+    deletion_rows = deletions.order_by('deleted_at', 'ticket_pk').values(
+        'ticket_id', 'deleted_at', 'ticket_pk'
+    )[:limit + 1]
+
+    changes = list(islice(heapq.merge(
+        ({**row, 'deleted': False} for row in ticket_rows),
+        (
+            {
+                'ticket_id': row['ticket_id'], 'updated_at': row['deleted_at'],
+                'id': row['ticket_pk'], 'deleted': True,
+            }
+            for row in deletion_rows
+        ),
+        key=lambda change: (change['updated_at'], change['id']),
+    ), limit + 1))
+
+    return changes[:limit], len(changes) > limit
+
+
+def to_ticket_list_rows(rows: Iterable[Dict[str, Any]]) -> List[TicketListRow]:
+
+    """
+    Wraps `get_user_ticket_rows()` dicts into `TicketListRow` objects.
+    """
+
+    return [TicketListRow(**row) for row in rows]
+
+
+def get_visible_ticket(*, user_profile: 'Profile', ticket_id: str) -> 'Ticket':
+
+    """
+    Fetches a ticket the user is allowed to see, in a single query.
+
+    Args:
+        user_profile (Profile): The profile of the logged-in user.
+        ticket_id (str): The unique ticket identifier.
+
+    Returns:
+        Ticket: The requested ticket.
+
+    Raises:
+        Http404: If the ticket does not exist or is not visible to the user.
+    """
+
+    return get_object_or_404(
+        Ticket.objects.filter(get_ticket_visibility_filter(user_profile=user_profile)),
+        ticket_id=ticket_id
+    )
+
+
+def get_visible_ticket_updated_at(
+        *, user_profile: 'Profile', ticket_id: str
+) -> Optional[datetime]:
+
+    """
+    Returns when a ticket visible to the user was last modified.
+
+    A single lookup on the unique `ticket_id` index, used to validate
+    conditional requests without loading the ticket.
+
+    Args:
+        user_profile (Profile): The profile of the logged-in user.
+        ticket_id (str): The unique ticket identifier.
+
+    Returns:
+        Optional[datetime]: The ticket's `updated_at`, or `None` if the
+        ticket does not exist or is not visible to the user.
+    """
+
+    return (
+        Ticket.objects
+        .filter(get_ticket_visibility_filter(user_profile=user_profile), ticket_id=ticket_id)
+        .values_list('updated_at', flat=True)
+        .first()
     )
 
 
@@ -50,6 +344,9 @@ def get_ticket_detail(*, user_profile: 'Profile', ticket_id: str) -> 'Ticket':
     - Staff users can only view tickets assigned to them.
     - Customers can only view tickets they created.
 
+    The role check is part of the query, so the ticket, its creator and its
+    assignee are loaded in one query and unauthorized requests fetch nothing.
+
     Args:
         user_profile (Profile): The profile of the logged-in user.
         ticket_id (str): The unique ticket identifier.
@@ -58,25 +355,46 @@ def get_ticket_detail(*, user_profile: 'Profile', ticket_id: str) -> 'Ticket':
         Ticket: The requested ticket if permitted.
 
     Raises:
-        PermissionError: If the user does not have permission to view the ticket.
+        Http404: If the ticket does not exist or the user does not have
+            permission to view it.
     """
 
-    ticket = get_object_or_404(
+    return get_object_or_404(
         Ticket.objects
-        .select_related("created_by", "created_by__user"), ticket_id=ticket_id
+        .select_related("created_by__user", "assigned_to__user")
+        .filter(get_ticket_visibility_filter(user_profile=user_profile)),
+        ticket_id=ticket_id
     )
-    user_role = user_profile.role
 
-    if user_role == UserRole.ADMIN:
-        return ticket  # Admins can see all tickets
 
-    if user_role == UserRole.STAFF and ticket.assigned_to == user_profile:
-        return ticket  # Staff can only see assigned tickets
+def get_ticket_counts(
+        *, scope: str, profile: Optional['Profile'] = None
+) -> Dict[str, int]:
+
+    """
+    Returns the denormalized ticket counts of a counter scope.
+
+    Reads the `TicketCounter` rows of the scope (and profile) through their
+    unique index instead of aggregating the tickets table.
+
+    Args:
+        scope (str): A `TicketCounterScope` value.
+        profile (Profile, optional): The profile for CREATED and ASSIGNED scopes.
+
+    Returns:
+        Dict[str, int]: `<status>_tickets_count` for every ticket status.
+    """
 
-    if user_role == UserRole.CUSTOMER and ticket.created_by == user_profile:
-        return ticket  # Customers can only see their own tickets
+    counts = dict(
+        TicketCounter.objects
+        .filter(scope=scope, profile=profile)
+        .values_list('status', 'count')
+    )
 
-    raise PermissionError("You do not have permission to view this ticket.")
+    return {
+        f'{status}_tickets_count': counts.get(status, 0)
+        for status in TicketStatus.values
+    }
 
 
 def get_tickets_count() -> Dict[str, int]:
@@ -84,6 +402,9 @@ def get_tickets_count() -> Dict[str, int]:
     """
     Returns a dictionary with overall ticket counts based on status.
 
+    The counts are cached under a versioned key, and a cache miss is
+    recomputed by a single caller while concurrent callers wait for it.
+
     Returns:
         Dict[str, int]: Aggregated counts for:
             - pending_tickets_count: Total tickets with status PENDING.
@@ -91,14 +412,88 @@ def get_tickets_count() -> Dict[str, int]:
             - closed_tickets_count: Total tickets with status CLOSED.
     """
 
-    return Ticket.objects.aggregate(
-        pending_tickets_count=Count(
-            'id', filter=Q(status=TicketStatus.PENDING)
-        ),
-        in_progress_tickets_count=Count(
-            'id', filter=Q(status=TicketStatus.IN_PROGRESS)
-        ),
-        closed_tickets_count=Count(
-            'id', filter=Q(status=TicketStatus.CLOSED)
-        ),
+    return cache_get_or_compute(
+        key=versioned_cache_key(namespace=TICKET_COUNTS_CACHE_NAMESPACE, key="global"),
+        compute=lambda: get_ticket_counts(scope=TicketCounterScope.GLOBAL),
+        timeout=settings.TICKET_COUNTS_CACHE_TIMEOUT,
     )
+
+
+def get_user_tickets_state(*, user_profile: 'Profile') -> Tuple[Optional[datetime], int]:
+
+    """
+    Returns a cheap fingerprint of the tickets visible to the user.
+
+    Any ticket change moves `updated_at`, and any creation, deletion or
+    status change moves the counters, so the pair changes whenever the
+    ticket list does.
+
+    - The latest `updated_at` comes from the `(..., updated_at)` indexes.
+    - The number of tickets comes from the denormalized counters.
+
+    Args:
+        user_profile (Profile): The profile of the logged-in user.
+
+    Returns:
+        Tuple[Optional[datetime], int]: The latest `updated_at` of the visible
+        tickets (`None` if there are none) and their number.
+    """
+
+    last_updated_at = (
+        Ticket.objects
+        .filter(get_ticket_visibility_filter(user_profile=user_profile))
+        .aggregate(last_updated_at=Max('updated_at'))['last_updated_at']
+    )
+
+    if user_profile.role == UserRole.ADMIN:
+        counts = get_tickets_count()
+    elif user_profile.role == UserRole.STAFF:
+        counts = get_ticket_counts(scope=TicketCounterScope.ASSIGNED, profile=user_profile)
+    else:
+        counts = get_ticket_counts(scope=TicketCounterScope.CREATED, profile=user_profile)
+
+    return last_updated_at, sum(counts.values())
+
+
+def get_ticket_facet_counts(
+        *, queryset: QuerySet, fields: List[str], selected: Dict[str, Any]
+) -> Dict[str, Dict[Any, int]]:
+
+    """
+    Counts tickets per value of several facets with one grouped query.
+
+    The queryset is grouped by all facet columns at once, and the per-facet
+    counts are rolled up in Python. The count of a facet value honours the
+    selections of all *other* facets, so picking that value would list
+    exactly that many tickets.
+
+    Args:
+        queryset (QuerySet): Tickets to count, with non-facet filters applied.
+        fields (List[str]): The facet columns, e.g. ``['status', 'priority']``.
+        selected (Dict[str, Any]): The selected value per facet, for active facets only.
+
+    Returns:
+        Dict[str, Dict[Any, int]]: Per facet, the ticket count of every value.
+    """
+
+    groups = (
+        queryset
+        .order_by()
+        .values(*fields)
+        .annotate(tickets_count=Count('id'))
+    )
+
+    facets: Dict[str, Dict[Any, int]] = {field: {} for field in fields}
+    for group in groups:
+        for field in fields:
+            matches_other_facets = all(
+                group[other] == value
+                for other, value in selected.items()
+                if other != field
+            )
+            if matches_other_facets:
+                facets[field][group[field]] = (
+                    facets[field].get(group[field], 0) + group['tickets_count']
+                )
+
+    return facets
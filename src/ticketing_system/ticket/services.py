@@ -1,40 +1,280 @@
-from django.core.exceptions import PermissionDenied
+from collections import Counter, defaultdict
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.db import connection, transaction
+from django.db.models import Count, F, QuerySet
+from django.utils import timezone
+from django.utils.html import format_html, format_html_join
+
+from ticketing_system.core.cache import bump_cache_version
+from ticketing_system.emails.models import Email
+from ticketing_system.emails.services import create_emails
 from ticketing_system.users.models import Profile, UserRole
-from ticketing_system.ticket.models import Ticket
+from ticketing_system.users.selectors import get_staff_roster
+from ticketing_system.ticket.models import Ticket, TicketCounter, TicketCounterScope
 from ticketing_system.ticket.models import TicketStatus
+from ticketing_system.ticket.assignment import (
+    AUTO_ASSIGNMENT_STRATEGIES, PRIORITY_WEIGHTS, StaffWorkload, invalidate_staff_workloads,
+    pick_staff_for_ticket
+)
+from ticketing_system.ticket.search import index_tickets
+from ticketing_system.ticket.selectors import (
+    TICKET_COUNTS_CACHE_NAMESPACE, get_ticket_visibility_filter
+)
+
+
+# (scope, profile id, status) identifying a single `TicketCounter` row.
+TicketCounterKey = Tuple[str, Optional[int], str]
+
+
+def _ticket_counter_keys(
+        *, status: str, created_by_id: int, assigned_to_id: Optional[int]
+) -> List[TicketCounterKey]:
+
+    """Returns the keys of all counters a ticket in the given state is counted in."""
+
+    keys = [
+        (TicketCounterScope.GLOBAL, None, status),
+        (TicketCounterScope.CREATED, created_by_id, status),
+    ]
+    if assigned_to_id is not None:
+        keys.append((TicketCounterScope.ASSIGNED, assigned_to_id, status))
+
+    return keys
+
+
+def ticket_counter_keys(*, ticket: 'Ticket') -> List[TicketCounterKey]:
+
+    """
+    Returns the keys of all counters the ticket is currently counted in.
+
+    Services capture these before mutating a ticket and pass them to
+    `ticket_counters_move()` afterwards.
+    """
+
+    return _ticket_counter_keys(
+        status=ticket.status,
+        created_by_id=ticket.created_by_id,
+        assigned_to_id=ticket.assigned_to_id,
+    )
+
+
+def ticket_counters_update(*, deltas: Dict[TicketCounterKey, int]) -> None:
+
+    """
+    Applies the given deltas to the ticket counters with atomic `F()` increments.
+
+    Counter rows are created on first use. Must run inside the same
+    transaction as the ticket change it accounts for.
+
+    Args:
+        deltas (Dict[TicketCounterKey, int]): Change per (scope, profile id, status).
+    """
+
+    for (scope, profile_id, status), delta in deltas.items():
+        if not delta:
+            continue
+
+        counters = TicketCounter.objects.filter(scope=scope, profile_id=profile_id, status=status)
+        if counters.update(count=F('count') + delta):
+            continue
+
+        counter, created = TicketCounter.objects.get_or_create(
+            scope=scope, profile_id=profile_id, status=status, defaults={'count': delta}
+        )
+        if not created:
+            # Another transaction created the row in the meantime.
+            counters.update(count=F('count') + delta)
+
+
+def ticket_counters_move(
+        *, before: List[TicketCounterKey], after: List[TicketCounterKey]
+) -> None:
 
+    """
+    Moves a ticket from the counters it was counted in to its new ones.
+
+    Args:
+        before (List[TicketCounterKey]): Counter keys before the change.
+        after (List[TicketCounterKey]): Counter keys after the change.
+    """
+
+    deltas = Counter(after)
+    deltas.subtract(before)
+    ticket_counters_update(deltas=deltas)
+
+    # Every counter change is a status transition, invalidate the cached counts.
+    bump_cache_version(namespace=TICKET_COUNTS_CACHE_NAMESPACE)
+
+
+def ticket_counters_remove(*, keys: List[TicketCounterKey]) -> None:
+
+    """
+    Takes a deleted ticket out of the counters it was counted in.
+
+    Unlike `ticket_counters_update()` no counter row is created: when a
+    profile is deleted, its counters may be gone before its tickets are.
+
+    Args:
+        keys (List[TicketCounterKey]): Counter keys of the deleted ticket.
+    """
+
+    for scope, profile_id, status in keys:
+        TicketCounter.objects.filter(
+            scope=scope, profile_id=profile_id, status=status
+        ).update(count=F('count') - 1)
 
+    bump_cache_version(namespace=TICKET_COUNTS_CACHE_NAMESPACE)
+
+
+@transaction.atomic
+def rebuild_ticket_counters() -> int:
+
+    """
+    Rebuilds all ticket counters from the tickets table.
+
+    Returns:
+        int: The number of counter rows written.
+    """
+
+    TicketCounter.objects.all().delete()
+
+    tickets = Ticket.objects.order_by()
+    counters = [
+        TicketCounter(scope=TicketCounterScope.GLOBAL, status=row['status'], count=row['count'])
+        for row in tickets.values('status').annotate(count=Count('id'))
+    ]
+    counters += [
+        TicketCounter(
+            scope=TicketCounterScope.CREATED, profile_id=row['created_by'],
+            status=row['status'], count=row['count']
+        )
+        for row in tickets.values('created_by', 'status').annotate(count=Count('id'))
+    ]
+    counters += [
+        TicketCounter(
+            scope=TicketCounterScope.ASSIGNED, profile_id=row['assigned_to'],
+            status=row['status'], count=row['count']
+        )
+        for row in tickets.filter(assigned_to__isnull=False)
+        .values('assigned_to', 'status').annotate(count=Count('id'))
+    ]
+
+    TicketCounter.objects.bulk_create(counters, batch_size=1000)
+    bump_cache_version(namespace=TICKET_COUNTS_CACHE_NAMESPACE)
+    return len(counters)
+
+
+@transaction.atomic
 def create_ticket(
         *, created_by: Profile, subject: str, description: str, file=None
 ) -> 'Ticket':
 
-    """Creates a new ticket and updates the user’s pending ticket count."""
+    """
+    Creates a new ticket and adds it to the full-text search index; the
+    `post_save` handler in `ticket.signals` counts it.
 
-    ticket = Ticket.objects.create(
-        created_by=created_by,
-        subject=subject,
-        description=description,
-        file=file
-    )
+    With `settings.TICKET_AUTO_ASSIGNMENT_STRATEGY` set, the ticket is
+    created IN_PROGRESS and assigned to the staff member picked by the
+    auto-assignment engine (see `ticket.assignment`), in the same INSERT.
+    """
+
+    ticket = Ticket(created_by=created_by, subject=subject, description=description, file=file)
+
+    staff_id = pick_staff_for_ticket(priority=ticket.priority)
+    if staff_id is not None:
+        ticket.assigned_to_id = staff_id
+        ticket.status = Ticket.TRANSITIONS['assign'].target
+
+    ticket.save(force_insert=True)
+    index_tickets(ticket_ids=[ticket.id])
     return ticket
 
 
+def ticket_transition(
+        *, ticket: 'Ticket', transition: str, conditions: Optional[Dict[str, Any]] = None,
+        **changes
+) -> bool:
+
+    """
+    Moves a ticket along one of `Ticket.TRANSITIONS` with a single conditional UPDATE.
+
+    The UPDATE only matches while the ticket is still in the state the caller
+    has seen, i.e. the status (one of the transition's sources) and the
+    assignee of `ticket`, and the given `conditions`. Of two concurrent
+    transitions of the same ticket exactly one wins, without locking the
+    row; the other one updates no row and returns False, with `ticket`
+    refreshed to the winner's state.
+
+    Only the status, `updated_at` and the given fields are written, and on
+    success the ticket is moved to its new counters.
+
+    Args:
+        ticket (Ticket): The ticket to transition.
+        transition (str): The name of the transition, a key of `Ticket.TRANSITIONS`.
+        conditions (Dict[str, Any], optional): Additional lookups the ticket
+            row must match, e.g. `lease_expires_at__isnull`.
+        **changes: Additional field values to write, e.g. `assigned_to`.
+
+    Returns:
+        bool: Whether the transition was applied.
+    """
+
+    sources, target = Ticket.TRANSITIONS[transition]
+    if ticket.status not in sources:
+        return False
+
+    counter_keys = ticket_counter_keys(ticket=ticket)
+    values = {'status': target, 'updated_at': timezone.now(), **changes}
+
+    with transaction.atomic():
+        updated = Ticket.objects.filter(
+            id=ticket.id, status=ticket.status, assigned_to_id=ticket.assigned_to_id,
+            **(conditions or {})
+        ).update(**values)
+
+        if not updated:
+            ticket.refresh_from_db(
+                fields=['status', 'assigned_to', 'lease_expires_at', 'updated_at']
+            )
+            return False
+
+        for field, value in values.items():
+            setattr(ticket, field, value)
+
+        ticket_counters_move(before=counter_keys, after=ticket_counter_keys(ticket=ticket))
+
+    return True
+
+
 def assign_ticket(*, ticket: 'Ticket', staff_profile: 'Profile') -> 'Ticket':
 
     """
-    Assigns the given ticket to a staff user.
+    Assigns the given ticket to a staff user and moves it to the
+    staff member's in-progress counters.
 
     Args:
         ticket (Ticket): The ticket to assign.
         staff_profile (Profile): The profile of the staff user to assign the ticket to.
 
+    Raises:
+        ValidationError: If the ticket is closed, or was changed by someone
+            else since it was read.
+
     Returns:
         Ticket: The updated ticket.
     """
 
-    ticket.assigned_to = staff_profile
-    ticket.status = TicketStatus.IN_PROGRESS
-    ticket.save()
+    if not ticket_transition(
+            ticket=ticket, transition='assign', assigned_to=staff_profile, lease_expires_at=None
+    ):
+        if ticket.status == TicketStatus.CLOSED:
+            raise ValidationError("Closed tickets cannot be assigned.")
+        raise ValidationError("The ticket was changed in the meantime, please try again.")
+
     return ticket
 
 
@@ -56,7 +296,8 @@ def close_ticket(
 
     Raises:
         PermissionDenied: If the user does not have permission (i.e., is not admin or staff).
-        ValueError: If the ticket is already closed.
+        ValueError: If the ticket is already closed, or was changed by someone
+            else since it was read.
 
     Returns:
         Ticket: The updated ticket with status set to CLOSED.
@@ -65,9 +306,6 @@ def close_ticket(
     if user_profile.role not in [UserRole.ADMIN, UserRole.STAFF]:
         raise PermissionDenied("You do not have permission to close this ticket.")
 
-    if ticket.status == TicketStatus.CLOSED:
-        raise ValueError("Ticket is already closed.")
-
     # Optionally, record the closing message as a TicketReply
     # if closing_message:
     #     TicketReply.objects.create(
@@ -76,8 +314,452 @@ def close_ticket(
     #         message=closing_message,
     #     )
 
-    # Update ticket status
-    ticket.status = TicketStatus.CLOSED
-    ticket.save()
+    if not ticket_transition(ticket=ticket, transition='close', lease_expires_at=None):
+        if ticket.status == TicketStatus.CLOSED:
+            raise ValueError("Ticket is already closed.")
+        raise ValueError("The ticket was changed in the meantime, please try again.")
 
     return ticket
+
+
+def _ticket_notifications_queue(
+        *, tickets_by_email: Dict[str, List[str]], subject: str, intro: str
+) -> List['Email']:
+
+    """
+    Queues one notification email per recipient, listing all of their tickets.
+
+    Args:
+        tickets_by_email (Dict[str, List[str]]): Ticket subjects per recipient email.
+        subject (str): Subject of the emails.
+        intro (str): First line of the emails, followed by the ticket subjects.
+
+    Returns:
+        List[Email]: The queued emails.
+    """
+
+    return create_emails(emails=[
+        Email(
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to_email=to_email,
+            subject=subject,
+            message="\n".join([intro, "", *(f"- {ticket_subject}" for ticket_subject in subjects)]),
+            html=format_html(
+                "<p>{}</p><ul>{}</ul>",
+                intro, format_html_join("", "<li>{}</li>", ((s,) for s in subjects)),
+            ),
+        )
+        for to_email, subjects in tickets_by_email.items()
+    ])
+
+
+def _tickets_bulk_transition(
+        *, tickets: QuerySet['Ticket'], transition: str, **changes
+) -> List[dict]:
+
+    """
+    Moves the given tickets along one of `Ticket.TRANSITIONS` with a single UPDATE.
+
+    Tickets outside the transition's source statuses are skipped, and open
+    work queue leases of the changed tickets are dropped. The affected rows
+    are locked first, so concurrent single-ticket changes
+    cannot interleave with the counter bookkeeping. All counter deltas are
+    summed up and applied at once.
+
+    Args:
+        tickets (QuerySet[Ticket]): The tickets to change.
+        transition (str): The name of the transition, a key of `Ticket.TRANSITIONS`.
+        **changes: Additional field values to write, e.g. `assigned_to_id`.
+
+    Returns:
+        List[dict]: The state of the changed tickets before the change
+        (`id`, `subject`, `status`, `created_by_id`, `assigned_to_id` and
+        `creator_email`).
+    """
+
+    sources, target = Ticket.TRANSITIONS[transition]
+    changes.update(status=target, lease_expires_at=None)
+
+    rows = list(
+        tickets.filter(status__in=sources)
+        .select_for_update(of=('self',))
+        .order_by('id')
+        .values(
+            'id', 'subject', 'status', 'created_by_id', 'assigned_to_id',
+            creator_email=F('created_by__user__email'),
+        )
+    )
+    if not rows:
+        return rows
+
+    # `update()` skips `auto_now`, bump `updated_at` explicitly so the list
+    # and detail ETags and the cached fragments see the change.
+    Ticket.objects.filter(id__in=[row['id'] for row in rows]).update(
+        updated_at=timezone.now(), **changes
+    )
+
+    deltas = Counter()
+    for row in rows:
+        deltas.subtract(_ticket_counter_keys(
+            status=row['status'],
+            created_by_id=row['created_by_id'],
+            assigned_to_id=row['assigned_to_id'],
+        ))
+        deltas.update(_ticket_counter_keys(
+            status=changes.get('status', row['status']),
+            created_by_id=row['created_by_id'],
+            assigned_to_id=changes.get('assigned_to_id', row['assigned_to_id']),
+        ))
+
+    ticket_counters_update(deltas=deltas)
+    bump_cache_version(namespace=TICKET_COUNTS_CACHE_NAMESPACE)
+    return rows
+
+
+@transaction.atomic
+def bulk_assign_tickets(
+        *, user_profile: 'Profile', tickets: QuerySet['Ticket'], staff_profile: 'Profile'
+) -> int:
+
+    """
+    Assigns many tickets to a staff user at once and moves them to IN_PROGRESS.
+
+    Closed tickets are skipped. The tickets are changed with one UPDATE, the
+    counters are adjusted in one pass and the staff user gets a single
+    notification email listing all tickets assigned to them.
+
+    Args:
+        user_profile (Profile): The profile of the user assigning the tickets.
+        tickets (QuerySet[Ticket]): The tickets to assign.
+        staff_profile (Profile): The profile of the staff user to assign the tickets to.
+
+    Raises:
+        PermissionDenied: If the user is not an admin.
+        ValidationError: If `staff_profile` is not a staff user.
+
+    Returns:
+        int: The number of assigned tickets.
+    """
+
+    if user_profile.role != UserRole.ADMIN:
+        raise PermissionDenied("You don't have permission to assign tickets.")
+
+    if staff_profile.role != UserRole.STAFF:
+        raise ValidationError("Tickets can only be assigned to staff users.")
+
+    rows = _tickets_bulk_transition(
+        tickets=tickets,
+        transition='assign',
+        assigned_to_id=staff_profile.id,
+    )
+
+    if rows:
+        _ticket_notifications_queue(
+            tickets_by_email={staff_profile.user.email: [row['subject'] for row in rows]},
+            subject=f"{len(rows)} ticket(s) assigned to you",
+            intro="The following tickets have been assigned to you:",
+        )
+
+    return len(rows)
+
+
+@transaction.atomic
+def bulk_close_tickets(*, user_profile: 'Profile', tickets: QuerySet['Ticket']) -> int:
+
+    """
+    Closes many tickets at once.
+
+    The same rules as `close_ticket()` apply: only admin and staff users may
+    close tickets, and only those visible to them (staff users their
+    assigned tickets). Tickets that are already closed are skipped. The
+    tickets are changed with one UPDATE, the counters are adjusted in one
+    pass and every creator gets a single notification email listing their
+    closed tickets.
+
+    Args:
+        user_profile (Profile): The profile of the user closing the tickets.
+        tickets (QuerySet[Ticket]): The tickets to close.
+
+    Raises:
+        PermissionDenied: If the user is not an admin or staff user.
+
+    Returns:
+        int: The number of closed tickets.
+    """
+
+    if user_profile.role not in [UserRole.ADMIN, UserRole.STAFF]:
+        raise PermissionDenied("You do not have permission to close this ticket.")
+
+    rows = _tickets_bulk_transition(
+        tickets=tickets.filter(get_ticket_visibility_filter(user_profile=user_profile)),
+        transition='close',
+    )
+
+    tickets_by_email = defaultdict(list)
+    for row in rows:
+        tickets_by_email[row['creator_email']].append(row['subject'])
+
+    _ticket_notifications_queue(
+        tickets_by_email=tickets_by_email,
+        subject="Your tickets have been closed",
+        intro="The following tickets of yours have been closed:",
+    )
+
+    return len(rows)
+
+
+@transaction.atomic
+def redistribute_staff_tickets(
+        *, staff_ids: List[int], strategy: Optional[str] = None
+) -> Dict[int, int]:
+
+    """
+    Moves the in-progress tickets of the given staff members to the other
+    active staff members, e.g. after they were deactivated.
+
+    The targets are picked from a workload heap of the remaining staff,
+    most urgent tickets first, so the load stays balanced. Every target gets
+    its tickets with a single UPDATE, the counters are adjusted in one pass
+    and every target gets one notification email.
+
+    Args:
+        staff_ids (List[int]): Profile ids of the staff members to take the tickets from.
+        strategy (str, optional): The assignment strategy, defaults to
+            `settings.TICKET_AUTO_ASSIGNMENT_STRATEGY`, or least loaded.
+
+    Raises:
+        ValidationError: If there is no other active staff member.
+
+    Returns:
+        Dict[int, int]: The number of tickets moved to each target staff member.
+    """
+
+    strategy = strategy or settings.TICKET_AUTO_ASSIGNMENT_STRATEGY or 'least_loaded'
+    if strategy not in AUTO_ASSIGNMENT_STRATEGIES:
+        raise ValidationError(f"Unknown assignment strategy: {strategy}.")
+
+    rows = list(
+        Ticket.objects
+        .filter(assigned_to_id__in=staff_ids, status=TicketStatus.IN_PROGRESS)
+        .select_for_update(of=('self',))
+        .order_by('id')
+        .values('id', 'subject', 'priority', 'status', 'created_by_id', 'assigned_to_id')
+    )
+    if not rows:
+        return {}
+
+    emails = {
+        staff['id']: staff['email']
+        for staff in get_staff_roster() if staff['id'] not in staff_ids
+    }
+    if not emails:
+        raise ValidationError("There is no other active staff member to take over the tickets.")
+
+    workload = StaffWorkload(strategy=strategy, staff_ids=list(emails))
+    rows.sort(key=lambda row: -PRIORITY_WEIGHTS[row['priority']])
+
+    rows_by_staff = defaultdict(list)
+    deltas = Counter()
+    for row in rows:
+        staff_id = workload.assign(priority=row['priority'])
+        rows_by_staff[staff_id].append(row)
+
+        deltas.subtract(_ticket_counter_keys(
+            status=row['status'], created_by_id=row['created_by_id'],
+            assigned_to_id=row['assigned_to_id'],
+        ))
+        deltas.update(_ticket_counter_keys(
+            status=row['status'], created_by_id=row['created_by_id'], assigned_to_id=staff_id,
+        ))
+
+    now = timezone.now()
+    for staff_id, staff_rows in rows_by_staff.items():
+        Ticket.objects.filter(id__in=[row['id'] for row in staff_rows]).update(
+            assigned_to_id=staff_id, lease_expires_at=None, updated_at=now
+        )
+
+    ticket_counters_update(deltas=deltas)
+    bump_cache_version(namespace=TICKET_COUNTS_CACHE_NAMESPACE)
+    invalidate_staff_workloads()
+
+    _ticket_notifications_queue(
+        tickets_by_email={
+            emails[staff_id]: [row['subject'] for row in staff_rows]
+            for staff_id, staff_rows in rows_by_staff.items()
+        },
+        subject="Tickets have been reassigned to you",
+        intro="The following tickets have been reassigned to you:",
+    )
+
+    return {staff_id: len(staff_rows) for staff_id, staff_rows in rows_by_staff.items()}
+
+
+# Candidates a claim tries per queue, on backends without SKIP LOCKED.
+TICKET_CLAIM_FALLBACK_CANDIDATES = 10
+
+# Row values a claim needs to move the claimed ticket's counters.
+_TICKET_CLAIM_FIELDS = ('id', 'status', 'created_by_id', 'assigned_to_id', 'lease_expires_at')
+
+
+def _ticket_claim_queues(*, now) -> List[QuerySet['Ticket']]:
+
+    """
+    Returns the queues a claim takes tickets from, in order.
+
+    Claims whose lease has expired come first, they have waited the longest,
+    then the unassigned pending tickets by priority, oldest first. Each queue
+    is a range scan over a partial index (`ticket_lease_expires_idx`,
+    `ticket_queue_idx`).
+    """
+
+    return [
+        Ticket.objects
+        .filter(status=TicketStatus.IN_PROGRESS, lease_expires_at__lte=now)
+        .order_by('lease_expires_at', 'id'),
+        *(
+            Ticket.objects
+            .filter(status=TicketStatus.PENDING, assigned_to__isnull=True, priority=priority)
+            .order_by('created_at', 'id')
+            for priority in Ticket.QUEUE_PRIORITIES
+        ),
+    ]
+
+
+def _ticket_claim_row(*, queue: QuerySet['Ticket'], values: dict) -> Optional[dict]:
+
+    """
+    Claims the first ticket of the queue that nobody else is claiming.
+
+    With `SELECT ... FOR UPDATE SKIP LOCKED` concurrent claimers skip the
+    rows locked by each other instead of queueing up behind them. Elsewhere
+    the first candidates are claimed with conditional UPDATEs, which only
+    match while the ticket is still in the state it was read in.
+
+    Returns:
+        Optional[dict]: The ticket's `_TICKET_CLAIM_FIELDS` before the claim,
+        or None if the queue is empty.
+    """
+
+    if connection.features.has_select_for_update_skip_locked:
+        row = queue.select_for_update(skip_locked=True, of=('self',)).values(
+            *_TICKET_CLAIM_FIELDS
+        ).first()
+        if row is not None:
+            Ticket.objects.filter(id=row['id']).update(**values)
+        return row
+
+    for row in queue.values(*_TICKET_CLAIM_FIELDS)[:TICKET_CLAIM_FALLBACK_CANDIDATES]:
+        if Ticket.objects.filter(
+            id=row['id'], status=row['status'], assigned_to_id=row['assigned_to_id'],
+            lease_expires_at=row['lease_expires_at'],
+        ).update(**values):
+            return row
+
+    return None
+
+
+def claim_next_ticket(*, staff_profile: 'Profile') -> Optional['Ticket']:
+
+    """
+    Claims the next ticket of the work queue for a staff member.
+
+    The claimed ticket is assigned to the staff member and moved to
+    IN_PROGRESS, with a lease of `settings.TICKET_CLAIM_LEASE_SECONDS`. The
+    staff member accepts it with `accept_ticket_claim()` or hands it back
+    with `release_ticket_claim()`; a claim left alone past its lease is
+    handed to the next claimer.
+
+    Every claim is a short transaction locking a single row, so any number
+    of staff members can pull from the queue at once.
+
+    Args:
+        staff_profile (Profile): The profile of the claiming staff user.
+
+    Raises:
+        PermissionDenied: If the user is not a staff user.
+
+    Returns:
+        Optional[Ticket]: The claimed ticket, or None if the queue is empty.
+    """
+
+    if staff_profile.role != UserRole.STAFF:
+        raise PermissionDenied("Only staff users can claim tickets.")
+
+    now = timezone.now()
+    values = {
+        'status': Ticket.TRANSITIONS['assign'].target,
+        'assigned_to_id': staff_profile.id,
+        'lease_expires_at': now + timedelta(seconds=settings.TICKET_CLAIM_LEASE_SECONDS),
+        'updated_at': now,
+    }
+
+    with transaction.atomic():
+        for queue in _ticket_claim_queues(now=now):
+            row = _ticket_claim_row(queue=queue, values=values)
+            if row is None:
+                continue
+
+            ticket_counters_move(
+                before=_ticket_counter_keys(
+                    status=row['status'], created_by_id=row['created_by_id'],
+                    assigned_to_id=row['assigned_to_id'],
+                ),
+                after=_ticket_counter_keys(
+                    status=values['status'], created_by_id=row['created_by_id'],
+                    assigned_to_id=staff_profile.id,
+                ),
+            )
+            return Ticket.objects.get(id=row['id'])
+
+    return None
+
+
+def accept_ticket_claim(*, staff_profile: 'Profile', ticket: 'Ticket') -> bool:
+
+    """
+    Accepts a claimed ticket, ending its lease so it stays with the staff member.
+
+    Args:
+        staff_profile (Profile): The profile of the staff user who claimed the ticket.
+        ticket (Ticket): The claimed ticket.
+
+    Returns:
+        bool: Whether the ticket was still claimed by the staff member; an
+        expired claim cannot be accepted, the ticket may be claimed again.
+    """
+
+    now = timezone.now()
+    accepted = Ticket.objects.filter(
+        id=ticket.id,
+        status=TicketStatus.IN_PROGRESS,
+        assigned_to_id=staff_profile.id,
+        lease_expires_at__gt=now,
+    ).update(lease_expires_at=None, updated_at=now)
+
+    ticket.refresh_from_db(fields=['status', 'assigned_to', 'lease_expires_at', 'updated_at'])
+    return bool(accepted)
+
+
+def release_ticket_claim(*, staff_profile: 'Profile', ticket: 'Ticket') -> bool:
+
+    """
+    Hands a claimed, not yet accepted ticket back to the work queue.
+
+    The lease is checked in the UPDATE itself, so a claim accepted
+    concurrently is never released.
+
+    Args:
+        staff_profile (Profile): The profile of the staff user who claimed the ticket.
+        ticket (Ticket): The claimed ticket.
+
+    Returns:
+        bool: Whether the ticket was still claimed by the staff member.
+    """
+
+    if ticket.assigned_to_id != staff_profile.id or ticket.lease_expires_at is None:
+        return False
+
+    return ticket_transition(
+        ticket=ticket, transition='release', conditions={'lease_expires_at__isnull': False},
+        assigned_to=None, lease_expires_at=None
+    )
@@ -0,0 +1,63 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from ticketing_system.ticket.models import Ticket, TicketDeletion
+from ticketing_system.ticket.search import unindex_tickets
+from ticketing_system.ticket.services import (
+    ticket_counter_keys, ticket_counters_move, ticket_counters_remove
+)
+
+
+# Fields that decide which counters a ticket is counted in.
+COUNTED_TICKET_FIELDS = {'status', 'created_by', 'created_by_id', 'assigned_to', 'assigned_to_id'}
+
+
+@receiver(pre_save, sender=Ticket)
+def capture_ticket_counter_keys(sender, instance: Ticket, update_fields=None, **kwargs) -> None:
+
+    """
+    Remembers the counters a ticket is counted in before it is saved.
+
+    A new ticket is not counted yet. A changed ticket is read back from the
+    database, unless the saved fields cannot move it between counters.
+    """
+
+    if instance._state.adding:
+        instance._counter_keys_before = []
+    elif update_fields is not None and not COUNTED_TICKET_FIELDS.intersection(update_fields):
+        instance._counter_keys_before = None
+    else:
+        stored = Ticket.objects.only('status', 'created_by', 'assigned_to').filter(
+            pk=instance.pk
+        ).first()
+        instance._counter_keys_before = ticket_counter_keys(ticket=stored) if stored else []
+
+
+@receiver(post_save, sender=Ticket)
+def count_saved_ticket(sender, instance: Ticket, **kwargs) -> None:
+
+    """
+    Moves a saved ticket to the counters of its new state, so tickets
+    saved outside the ticket services are counted as well.
+    """
+
+    before = instance.__dict__.pop('_counter_keys_before', None)
+    if before is None:
+        return
+
+    after = ticket_counter_keys(ticket=instance)
+    if before != after:
+        ticket_counters_move(before=before, after=after)
+
+
+@receiver(post_delete, sender=Ticket)
+def record_ticket_deletion(sender, instance: Ticket, **kwargs) -> None:
+
+    """
+    Leaves a tombstone of a deleted ticket for the change feed, drops its
+    full-text index entry and takes it out of the ticket counters.
+    """
+
+    TicketDeletion.objects.create(ticket_pk=instance.pk, ticket_id=instance.ticket_id)
+    unindex_tickets(ticket_ids=[instance.pk])
+    ticket_counters_remove(keys=ticket_counter_keys(ticket=instance))
@@ -2,7 +2,8 @@ from django.urls import path
 
 from ticketing_system.ticket.views import (
     TicketListView, TicketCreateView, TicketDetailView,
-    TicketCloseView, TicketAssignmentView
+    TicketCloseView, TicketAssignmentView, TicketBulkActionView, StaffAutocompleteView,
+    TicketClaimNextView, TicketClaimUpdateView, TicketExportView
 )
 
 
@@ -12,7 +13,19 @@ app_name = 'tickets'
 urlpatterns = [
     path(route='', view=TicketListView.as_view(), name="list"),
     path(route='create/', view=TicketCreateView.as_view(), name="create"),
+    path(route='bulk/', view=TicketBulkActionView.as_view(), name="bulk"),
+    path(route='export/', view=TicketExportView.as_view(), name="export"),
     path(route="<uuid:ticket_id>/", view=TicketDetailView.as_view(), name="detail"),
     path(route="<uuid:ticket_id>/assign/", view=TicketAssignmentView.as_view(), name="assign"),
     path(route="<uuid:ticket_id>/close/", view=TicketCloseView.as_view(), name="close"),
+    path(route="queue/claim/", view=TicketClaimNextView.as_view(), name="claim-next"),
+    path(
+        route="<uuid:ticket_id>/claim/accept/",
+        view=TicketClaimUpdateView.as_view(action="accept"), name="claim-accept"
+    ),
+    path(
+        route="<uuid:ticket_id>/claim/release/",
+        view=TicketClaimUpdateView.as_view(action="release"), name="claim-release"
+    ),
+    path(route="staff/autocomplete/", view=StaffAutocompleteView.as_view(), name="staff-autocomplete"),
 ]
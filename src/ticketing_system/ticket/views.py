@@ -1,30 +1,138 @@
-from typing import Any, Dict
+import hashlib
+from typing import Any, Dict, Optional
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import PermissionDenied, ValidationError
-from django.http import Http404
-from django.shortcuts import get_object_or_404, redirect
-from django.urls import reverse_lazy
+from django.core.paginator import InvalidPage
+from django.http import (
+    Http404, HttpResponse, HttpResponseBadRequest, JsonResponse, StreamingHttpResponse
+)
+from django.shortcuts import redirect
+from django.urls import reverse, reverse_lazy
+from django.utils.decorators import method_decorator
 from django.views import View
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
 from django.views.generic import CreateView, DetailView, FormView, ListView
 
+from ticketing_system.core.cache import get_cache_version
+from ticketing_system.core.pagination import KeysetPaginator
 from ticketing_system.ticket.models import Ticket
-from ticketing_system.ticket.forms import TicketCreationForm, TicketCloseForm, TicketAssignmentForm
-from ticketing_system.ticket.selectors import get_user_tickets, get_ticket_detail
-from ticketing_system.ticket.services import create_ticket, close_ticket, assign_ticket
-from ticketing_system.users.selectors import get_user_profile
+from ticketing_system.ticket.exports import (
+    TICKET_EXPORT_FIELDS, TICKET_EXPORT_FORMATS, iter_ticket_export
+)
+from ticketing_system.ticket.filters import TicketFilter
+from ticketing_system.ticket.forms import (
+    TicketCreationForm, TicketCloseForm, TicketAssignmentForm, TicketBulkActionForm
+)
+from ticketing_system.ticket.search import SEARCH_ORDERING
+from ticketing_system.ticket.selectors import (
+    get_user_ticket_rows, get_user_ticket_values, get_user_tickets_state, get_ticket_detail,
+    get_visible_ticket, get_visible_ticket_updated_at, to_ticket_list_rows
+)
+from ticketing_system.ticket.services import (
+    create_ticket, close_ticket, assign_ticket, bulk_assign_tickets, bulk_close_tickets,
+    accept_ticket_claim, claim_next_ticket, release_ticket_claim
+)
+from ticketing_system.users.models import UserRole
+from ticketing_system.users.selectors import (
+    STAFF_ROSTER_CACHE_NAMESPACE, get_staff_roster, get_user_profile
+)
+
+
+def _page_etag(request: Any, *parts: Any) -> str:
 
+    """
+    Build the ETag of a page rendered for the current user.
+
+    Besides the given validators, the tag covers the release, the session
+    (CSRF tokens rotate with it), the user, their role and the full path
+    including the query string.
+    """
+
+    parts = (
+        settings.APP_RELEASE, request.session.session_key, request.user.pk,
+        request.user.profile.role, request.get_full_path(), *parts
+    )
+    return hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()
+
+
+def ticket_list_etag(request: Any, *args: Any, **kwargs: Any) -> Optional[str]:
+
+    """
+    ETag of the ticket list: the latest `updated_at` and the number
+    of the tickets visible to the user.
+    """
+
+    if not request.user.is_authenticated:
+        return None
+
+    last_updated_at, count = get_user_tickets_state(user_profile=request.user.profile)
+    return _page_etag(request, last_updated_at, count)
 
-class TicketListView(LoginRequiredMixin, ListView):
+
+def ticket_detail_etag(request: Any, ticket_id: str, *args: Any, **kwargs: Any) -> Optional[str]:
+
+    """
+    ETag of a ticket detail page: the ticket, its `updated_at` and, for
+    admins, the version of the staff roster rendered into the assignment form.
+    """
+
+    if not request.user.is_authenticated:
+        return None
+
+    user_profile = request.user.profile
+    updated_at = get_visible_ticket_updated_at(user_profile=user_profile, ticket_id=ticket_id)
+    if updated_at is None:
+        return None
+
+    roster_version = None
+    if user_profile.role == UserRole.ADMIN:
+        roster_version = get_cache_version(namespace=STAFF_ROSTER_CACHE_NAMESPACE)
+
+    return _page_etag(request, ticket_id, updated_at, roster_version)
+
+
+class TicketFragmentCacheMixin:
+
+    """
+    Provides the settings of the `{% cache %}` fragments of ticket templates.
+
+    Context:
+        fragment_cache_timeout (int): Lifetime of a cached fragment.
+        fragment_cache_release (str): The deployed release, part of every
+            fragment key so template changes never serve stale markup.
+    """
+
+    def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
+        context = super().get_context_data(**kwargs)
+        context['fragment_cache_timeout'] = settings.TICKET_FRAGMENT_CACHE_TIMEOUT
+        context['fragment_cache_release'] = settings.APP_RELEASE
+        return context
+
+
+@method_decorator(cache_control(private=True, no_cache=True), name='get')
+@method_decorator(condition(etag_func=ticket_list_etag), name='get')
+class TicketListView(LoginRequiredMixin, TicketFragmentCacheMixin, ListView):
 
     """
     View for listing tickets based on the user's role.
 
     - Requires authentication (`LoginRequiredMixin`).
     - Uses pagination to display 10 tickets per page.
-    - Retrieves a filtered ticket queryset via `get_user_tickets()`.
+    - With `cursor_pagination` enabled, pages are fetched by seeking on
+      `(updated_at, id)` via a `cursor` GET parameter instead of `OFFSET`,
+      so deep pages cost the same as the first one.
+    - A `search` GET parameter switches to full-text search, ordered by relevance.
+    - Filters by status, priority, assignee and creation date (`TicketFilter`),
+      with the ticket count of every facet value in the context.
+    - Retrieves only the displayed columns via `get_user_ticket_rows()`.
     - Adds the annotated user profile (with ticket counts) to the template context.
+    - Answers conditional GETs with `304 Not Modified` while the visible
+      tickets did not change (see `ticket_list_etag`).
+    - Caches every rendered row, keyed on the ticket's `updated_at`.
 
     Attributes:
         model (Ticket): The model associated with this view.
@@ -32,6 +140,9 @@ class TicketListView(LoginRequiredMixin, ListView):
         template_name (str): Template used to render the ticket list.
         context_object_name (str): Name of the queryset in the template.
         paginate_by (int): Number of tickets per page.
+        cursor_pagination (bool): Use keyset pagination instead of page numbers.
+        cursor_kwarg (str): Name of the GET parameter carrying the cursor.
+        search_kwarg (str): Name of the GET parameter carrying the search input.
     """
 
     model = Ticket
@@ -39,20 +150,71 @@ class TicketListView(LoginRequiredMixin, ListView):
     template_name = 'ticket/ticket_list.html'
     context_object_name = 'tickets'
     paginate_by = 10
+    cursor_pagination = True
+    cursor_kwarg = 'cursor'
+    search_kwarg = 'search'
 
     def get_queryset(self):
 
         """
-        Get the ticket queryset based on the user's profile.
+        Get the ticket list projection based on the user's profile.
+
+        If a search input is given, only matching tickets are returned.
+        The selected filters of `TicketFilter` are applied on top.
 
         Returns:
-            QuerySet[Ticket]: A filtered queryset containing tickets
-            relevant to the user.
+            QuerySet: A `values()` queryset of the ticket list columns
+            relevant to the user, see `get_user_ticket_rows()`.
         """
 
         user_profile = self.request.user.profile
-        return get_user_tickets(user_profile=user_profile)
 
+        self.filterset = TicketFilter(
+            self.request.GET,
+            queryset=get_user_ticket_rows(user_profile=user_profile, search=self.get_search()),
+            user_profile=user_profile,
+        )
+        return self.filterset.qs
+
+    def get_search(self) -> str:
+
+        """
+        Return the stripped search input from the query string.
+        """
+
+        return self.request.GET.get(self.search_kwarg, '').strip()
+
+    def paginate_queryset(self, queryset, page_size):
+
+        """
+        Paginate the queryset by keyset when `cursor_pagination` is enabled.
+
+        Falls back to Django's offset pagination otherwise. Either way, the
+        rows of the page are returned as `TicketListRow` objects.
+
+        Raises:
+            Http404: If the cursor is malformed.
+        """
+
+        if not self.cursor_pagination:
+            paginator, page, object_list, is_paginated = super().paginate_queryset(
+                queryset, page_size
+            )
+            page.object_list = to_ticket_list_rows(object_list)
+            return paginator, page, page.object_list, is_paginated
+
+        if self.get_search():
+            paginator = KeysetPaginator(queryset, per_page=page_size, ordering=SEARCH_ORDERING)
+        else:
+            paginator = KeysetPaginator(queryset, per_page=page_size)
+
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+        except InvalidPage:
+            raise Http404("Invalid cursor.")
+
+        page.object_list = to_ticket_list_rows(page.object_list)
+        return paginator, page, page.object_list, page.has_other_pages()
 
     def get_context_data(self, **kwargs):
 
@@ -61,6 +223,9 @@ class TicketListView(LoginRequiredMixin, ListView):
         Extend the context with the annotated user profile.
 
         - Adds `user_profile` to the context for role-based UI rendering.
+        - Adds the `filter` form, its `facets` and the `filter_querystring`
+          used by the pagination links.
+        - Adds the `bulk_action_form` for admin and staff users.
 
         Returns:
             dict: Context data containing the user profile with aggregated
@@ -71,6 +236,22 @@ class TicketListView(LoginRequiredMixin, ListView):
 
         user = self.request.user
         context['user_profile'] = get_user_profile(user=user)
+        context['filter'] = self.filterset
+        context['facets'] = self.filterset.get_facets()
+
+        # Query string of the current search and filters, kept by the pagination links.
+        querystring = self.request.GET.copy()
+        querystring.pop(self.cursor_kwarg, None)
+        context['filter_querystring'] = querystring.urlencode()
+
+        if user.profile.role in [UserRole.ADMIN, UserRole.STAFF]:
+            context['bulk_action_form'] = TicketBulkActionForm()
+
+        # Rows are cached per viewer role; whether the viewer created the
+        # ticket is the only other viewer-dependent part of a row.
+        for ticket in context['tickets']:
+            ticket.viewer_is_creator = ticket.created_by_id == user.profile.id
+
         return context
 
 
@@ -94,7 +275,9 @@ class TicketCreateView(LoginRequiredMixin, CreateView):
         return redirect(self.success_url)
 
 
-class TicketDetailView(LoginRequiredMixin, DetailView):
+@method_decorator(cache_control(private=True, no_cache=True), name='get')
+@method_decorator(condition(etag_func=ticket_detail_etag), name='get')
+class TicketDetailView(LoginRequiredMixin, TicketFragmentCacheMixin, DetailView):
 
     """
     Displays the details of a specific ticket based on the user's role.
@@ -104,6 +287,10 @@ class TicketDetailView(LoginRequiredMixin, DetailView):
         - Staff: can view a ticket only if it is assigned to them.
         - Customer: can view a ticket only if they created it.
 
+    Conditional GETs are answered with `304 Not Modified` while the ticket
+    did not change (see `ticket_detail_etag`), and the ticket body is served
+    from the fragment cache until the ticket's `updated_at` moves.
+
     Attributes:
         model (Ticket): The Ticket model.
         template_name (str): Template used for rendering the ticket detail.
@@ -129,12 +316,9 @@ class TicketDetailView(LoginRequiredMixin, DetailView):
 
         user_profile = self.request.user.profile
 
-        try:
-            return get_ticket_detail(
-                user_profile=user_profile, ticket_id=self.kwargs["ticket_id"]
-            )
-        except PermissionError:
-            raise Http404("You do not have permission to view this ticket.")
+        return get_ticket_detail(
+            user_profile=user_profile, ticket_id=self.kwargs["ticket_id"]
+        )
 
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
 
@@ -187,12 +371,14 @@ class TicketAssignmentView(LoginRequiredMixin, View):
             PermissionDenied: If the user does not have admin privileges.
         """
 
-        ticket = get_object_or_404(Ticket, ticket_id=ticket_id)
-        form = TicketAssignmentForm(request.POST)
+        user_profile = request.user.profile
 
-        if request.user.profile.role != 'admin':
+        if user_profile.role != 'admin':
             messages.error(request, message="You don't have permission to assign tickets.")
-            return redirect(reverse_lazy("tickets:detail", kwargs={"ticket_id": ticket.ticket_id}))
+            return redirect(reverse_lazy("tickets:detail", kwargs={"ticket_id": ticket_id}))
+
+        ticket = get_visible_ticket(user_profile=user_profile, ticket_id=ticket_id)
+        form = TicketAssignmentForm(request.POST)
 
         if form.is_valid():
             try:
@@ -209,6 +395,231 @@ class TicketAssignmentView(LoginRequiredMixin, View):
         return redirect(reverse_lazy("tickets:detail", kwargs={"ticket_id": ticket.ticket_id}))
 
 
+class TicketBulkActionView(LoginRequiredMixin, View):
+
+    """
+    Handles the bulk action form of the ticket list.
+
+    Assigns (admin users) or closes (admin and staff users) all selected
+    tickets at once through `bulk_assign_tickets()` and `bulk_close_tickets()`,
+    then redirects back to the ticket list.
+    """
+
+    success_url = reverse_lazy("tickets:list")
+
+    def post(self, request: Any, *args: Any, **kwargs: Any) -> Any:
+
+        """
+        Process the bulk action form submission.
+
+        Returns:
+            HttpResponse: A redirection to the ticket list with appropriate messages.
+        """
+
+        user_profile = request.user.profile
+        form = TicketBulkActionForm(request.POST)
+
+        if not form.is_valid():
+            messages.error(request, message="Invalid bulk action form submission.")
+            return redirect(self.success_url)
+
+        tickets = Ticket.objects.filter(ticket_id__in=form.cleaned_data['ticket_ids'])
+
+        try:
+            if form.cleaned_data['action'] == TicketBulkActionForm.ASSIGN:
+                count = bulk_assign_tickets(
+                    user_profile=user_profile,
+                    tickets=tickets,
+                    staff_profile=form.cleaned_data['assigned_to'],
+                )
+                messages.success(request, message=f"{count} ticket(s) assigned successfully.")
+            else:
+                count = bulk_close_tickets(user_profile=user_profile, tickets=tickets)
+                messages.success(request, message=f"{count} ticket(s) successfully closed.")
+        except PermissionDenied as e:
+            messages.error(request, str(e))
+        except ValidationError as e:
+            messages.error(request, str(e))
+
+        return redirect(self.success_url)
+
+
+def _ticket_claim_payload(ticket: 'Ticket') -> Dict[str, Any]:
+
+    """
+    Returns the JSON representation of a claimed ticket.
+    """
+
+    return {
+        "ticket_id": str(ticket.ticket_id),
+        "subject": ticket.subject,
+        "priority": ticket.priority,
+        "status": ticket.status,
+        "lease_expires_at": ticket.lease_expires_at,
+        "url": reverse("tickets:detail", kwargs={"ticket_id": ticket.ticket_id}),
+    }
+
+
+class TicketClaimNextView(LoginRequiredMixin, View):
+
+    """
+    Work queue endpoint: claims the next ticket for the requesting staff user.
+
+    Responds with the claimed ticket as JSON, with 204 when the queue is
+    empty, or with 403 for users other than staff. See `claim_next_ticket()`.
+    """
+
+    def post(self, request: Any, *args: Any, **kwargs: Any) -> HttpResponse:
+
+        """
+        Claim the next ticket of the work queue.
+
+        Returns:
+            HttpResponse: The claimed ticket as JSON, including its lease expiry.
+        """
+
+        user_profile = request.user.profile
+
+        if user_profile.role != UserRole.STAFF:
+            return JsonResponse({"detail": "Only staff users can claim tickets."}, status=403)
+
+        ticket = claim_next_ticket(staff_profile=user_profile)
+        if ticket is None:
+            return HttpResponse(status=204)
+
+        return JsonResponse(_ticket_claim_payload(ticket))
+
+
+class TicketClaimUpdateView(LoginRequiredMixin, View):
+
+    """
+    Accepts (`action = "accept"`) or releases (`action = "release"`) a
+    ticket claimed from the work queue.
+
+    Responds with the ticket as JSON, or with 409 if the ticket is no
+    longer claimed by the requesting user (e.g. its lease expired and it
+    was claimed by someone else).
+    """
+
+    action = None
+
+    def post(self, request: Any, ticket_id: str, *args: Any, **kwargs: Any) -> JsonResponse:
+
+        """
+        Accept or release the claim of the given ticket.
+
+        Raises:
+            Http404: If the ticket is not visible to the user.
+
+        Returns:
+            JsonResponse: The ticket after the update.
+        """
+
+        user_profile = request.user.profile
+        ticket = get_visible_ticket(user_profile=user_profile, ticket_id=ticket_id)
+
+        if self.action == "accept":
+            updated = accept_ticket_claim(staff_profile=user_profile, ticket=ticket)
+        else:
+            updated = release_ticket_claim(staff_profile=user_profile, ticket=ticket)
+
+        if not updated:
+            return JsonResponse(
+                {"detail": "The ticket is no longer claimed by you."}, status=409
+            )
+
+        return JsonResponse(_ticket_claim_payload(ticket))
+
+
+class TicketExportView(LoginRequiredMixin, View):
+
+    """
+    Streams the tickets visible to the user as a CSV or JSON Lines download.
+
+    Takes the `search` and the `TicketFilter` parameters of the ticket list,
+    plus `format` (`csv` or `jsonl`) and `gzip=1` to compress the download.
+    The file is written while rows are read from the database, see
+    `iter_ticket_export()`, so exports of any size use constant memory.
+    """
+
+    login_url = reverse_lazy('auth:login')
+
+    def get(self, request: Any, *args: Any, **kwargs: Any) -> HttpResponse:
+
+        """
+        Stream the export of the visible tickets.
+
+        Returns:
+            HttpResponse: A `StreamingHttpResponse` with the file as an
+            attachment, or 400 for an unknown format.
+        """
+
+        export_format = request.GET.get('format', 'csv')
+        if export_format not in TICKET_EXPORT_FORMATS:
+            return HttpResponseBadRequest("Unknown export format.")
+
+        user_profile = request.user.profile
+        filterset = TicketFilter(
+            request.GET,
+            queryset=get_user_ticket_values(
+                user_profile=user_profile, fields=TICKET_EXPORT_FIELDS,
+                search=request.GET.get('search', '').strip(),
+            ),
+            user_profile=user_profile,
+        )
+
+        compress = request.GET.get('gzip') == '1'
+        content_type, extension = TICKET_EXPORT_FORMATS[export_format]
+        filename = f"tickets.{extension}"
+        if compress:
+            content_type, filename = "application/gzip", f"{filename}.gz"
+
+        response = StreamingHttpResponse(
+            iter_ticket_export(rows=filterset.qs, export_format=export_format, compress=compress),
+            content_type=content_type,
+        )
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+
+class StaffAutocompleteView(LoginRequiredMixin, View):
+
+    """
+    Returns staff members matching a search term as JSON, for admin users.
+
+    Filters the cached staff roster in memory, so it costs no queries
+    regardless of the size of the support team.
+
+    Attributes:
+        max_results (int): Maximum number of returned staff members.
+    """
+
+    max_results = 20
+
+    def get(self, request: Any, *args: Any, **kwargs: Any) -> JsonResponse:
+
+        """
+        Return the staff members whose email or username contains `q`.
+
+        Returns:
+            JsonResponse: `{"results": [{"id": ..., "text": ...}, ...]}`, or
+            a 403 response for non-admin users.
+        """
+
+        if request.user.profile.role != UserRole.ADMIN:
+            return JsonResponse(
+                {"detail": "You don't have permission to assign tickets."}, status=403
+            )
+
+        term = request.GET.get('q', '').strip().lower()
+        results = [
+            {"id": staff['id'], "text": staff['email']}
+            for staff in get_staff_roster()
+            if term in staff['email'].lower() or term in staff['username'].lower()
+        ]
+        return JsonResponse({"results": results[:self.max_results]})
+
+
 class TicketCloseView(LoginRequiredMixin, FormView):
 
     """
@@ -237,15 +648,30 @@ class TicketCloseView(LoginRequiredMixin, FormView):
         """
         Retrieve the ticket object based on the provided ticket_id.
 
+        Users who may not close tickets at all are redirected with an error
+        message before any ticket is fetched. For everyone else the ticket is
+        looked up within the tickets visible to them.
+
         Raises:
-            Http404: If the ticket is not found.
+            Http404: If the ticket is not found or not visible to the user.
 
         Returns:
             HttpResponse: The result of the parent dispatch method.
         """
 
+        if not request.user.is_authenticated:
+            return self.handle_no_permission()
+
+        user_profile = request.user.profile
+
+        if user_profile.role not in [UserRole.ADMIN, UserRole.STAFF]:
+            messages.error(request, message="You do not have permission to close this ticket.")
+            return redirect(self.success_url)
+
         # Fetch the ticket object based on ticket_id
-        self.ticket = get_object_or_404(Ticket, ticket_id=self.kwargs["ticket_id"])
+        self.ticket = get_visible_ticket(
+            user_profile=user_profile, ticket_id=self.kwargs["ticket_id"]
+        )
         return super().dispatch(request, *args, **kwargs)
 
     def form_valid(self, form: Any) -> Any:
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'ticketing_system.users'
+
+    def ready(self) -> None:
+        from ticketing_system.users import signals  # noqa
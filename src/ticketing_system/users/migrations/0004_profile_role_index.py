@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_remove_profile_tickets_closed_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='profile',
+            name='role',
+            field=models.CharField(choices=[('customer', 'Customer'), ('staff', 'Staff'), ('admin', 'Admin')], db_index=True, default='customer', help_text='Role of the user in the ticketing system.', max_length=20, verbose_name='Role'),
+        ),
+    ]
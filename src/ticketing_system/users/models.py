@@ -177,9 +177,8 @@ class Profile(BaseModel):
     """
     Profile model for a user in the ticketing system.
 
-    This model provides computed properties to dynamically count
-    the tickets created or assigned to the user without storing manual
-    counters.
+    Ticket counts for the profile are kept in `ticket.TicketCounter` rows
+    and attached by the selectors in `users.selectors`.
     """
 
     user = models.OneToOneField(
@@ -193,6 +192,7 @@ class Profile(BaseModel):
         max_length=20,
         choices=UserRole.choices,
         default=UserRole.CUSTOMER,
+        db_index=True,
         verbose_name=_("Role"),
         help_text=_("Role of the user in the ticketing system."),
     )
@@ -1,13 +1,45 @@
+from typing import Any, Dict, List
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models import Count, Q
 
+from ticketing_system.core.cache import cache_get_or_compute, versioned_cache_key
 from ticketing_system.users.models import Profile, UserRole
-from ticketing_system.ticket.models import Ticket, TicketStatus
-from ticketing_system.ticket.selectors import get_tickets_count
+from ticketing_system.ticket.models import TicketCounterScope
+from ticketing_system.ticket.selectors import get_ticket_counts, get_tickets_count
 
 
 User = get_user_model()
 
+# Cache namespace of the staff roster, bumped whenever a profile
+# or a user's identifying fields change (see `users.signals`).
+STAFF_ROSTER_CACHE_NAMESPACE = "users:staff_roster"
+
+
+def _attach_ticket_counts(*, profile: 'Profile', counts: Dict[str, int]) -> 'Profile':
+
+    """
+    Attaches the given ticket counts to the profile instance as attributes.
+    """
+
+    for name, count in counts.items():
+        setattr(profile, name, count)
+
+    return profile
+
+
+def _get_profile(*, user: 'User') -> 'Profile':
+
+    """
+    Returns the user's profile, reusing the one loaded together with the
+    user (see `ProfileModelBackend`) instead of querying it again.
+    """
+
+    if User.profile.is_cached(user):
+        return user.profile
+
+    return Profile.objects.select_related('user').get(user=user)
+
 
 def get_admin_user_profile(*, user: 'User') -> 'Profile':
 
@@ -25,21 +57,16 @@ def get_admin_user_profile(*, user: 'User') -> 'Profile':
             - closed_tickets_count
     """
 
-    admin_user_profile = Profile.objects.select_related('user').get(user=user)
+    admin_user_profile = _get_profile(user=user)
 
     # Attach aggregated counts to the profile instance as attributes
-    aggregated_counts = get_tickets_count()
-    admin_user_profile.pending_tickets_count = aggregated_counts.get('pending_tickets_count', 0)
-    admin_user_profile.in_progress_tickets_count = aggregated_counts.get('in_progress_tickets_count', 0)
-    admin_user_profile.closed_tickets_count = aggregated_counts.get('closed_tickets_count', 0)
-
-    return admin_user_profile
+    return _attach_ticket_counts(profile=admin_user_profile, counts=get_tickets_count())
 
 
 def get_staff_user_profile(*, user: 'User') -> 'Profile':
 
     """
-    Retrieves the staff user's profile and annotates it with ticket
+    Retrieves the staff user's profile and attaches ticket
     counts for assigned tickets.
 
     Args:
@@ -51,24 +78,18 @@ def get_staff_user_profile(*, user: 'User') -> 'Profile':
             - closed_tickets_count: Count of assigned tickets that are closed.
     """
 
-    staff_user_profile = Profile.objects.select_related('user').filter(user=user).annotate(
-        in_progress_tickets_count=Count(
-            'assigned_tickets',
-            filter=Q(assigned_tickets__status=TicketStatus.IN_PROGRESS)
-        ),
-        closed_tickets_count=Count(
-            'assigned_tickets',
-            filter=Q(assigned_tickets__status=TicketStatus.CLOSED)
-        ),
-    ).first()
+    staff_user_profile = _get_profile(user=user)
 
-    return staff_user_profile
+    return _attach_ticket_counts(
+        profile=staff_user_profile,
+        counts=get_ticket_counts(scope=TicketCounterScope.ASSIGNED, profile=staff_user_profile)
+    )
 
 
 def get_customer_user_profile(*, user: 'User') -> 'Profile':
 
     """
-    Retrieves the customer user's profile and annotates it with
+    Retrieves the customer user's profile and attaches
     ticket counts for created tickets.
 
     Args:
@@ -81,22 +102,12 @@ def get_customer_user_profile(*, user: 'User') -> 'Profile':
             - closed_tickets_count: Count of created tickets that are closed.
     """
 
-    customer_user_profile = Profile.objects.select_related('user').filter(user=user).annotate(
-        pending_tickets_count=Count(
-            'tickets',
-            filter=Q(tickets__status=TicketStatus.PENDING)
-        ),
-        in_progress_tickets_count=Count(
-            'tickets',
-            filter=Q(tickets__status=TicketStatus.IN_PROGRESS)
-        ),
-        closed_tickets_count=Count(
-            'tickets',
-            filter=Q(tickets__status=TicketStatus.CLOSED)
-        ),
-    ).first()
+    customer_user_profile = _get_profile(user=user)
 
-    return customer_user_profile
+    return _attach_ticket_counts(
+        profile=customer_user_profile,
+        counts=get_ticket_counts(scope=TicketCounterScope.CREATED, profile=customer_user_profile)
+    )
 
 
 def get_user_profile(*, user: 'User') -> 'Profile':
@@ -111,8 +122,7 @@ def get_user_profile(*, user: 'User') -> 'Profile':
         Profile: The user's Profile instance annotated with ticket counts based on role.
     """
 
-    user = User.objects.select_related('profile').get(pk=user.pk)
-    user_role = user.profile.role
+    user_role = _get_profile(user=user).role
 
     if user_role == UserRole.ADMIN:
         return get_admin_user_profile(user=user)
@@ -120,4 +130,36 @@ def get_user_profile(*, user: 'User') -> 'Profile':
     if user_role == UserRole.STAFF:
         return get_staff_user_profile(user=user)
 
-    return get_customer_user_profile(user=user)
\ No newline at end of file
+    return get_customer_user_profile(user=user)
+
+
+def get_staff_roster() -> List[Dict[str, Any]]:
+
+    """
+    Returns all active staff profiles as plain rows, served from the cache.
+
+    The roster is loaded with a single query joining the users and is cached
+    under a versioned key, so rendering assignment choices costs no queries
+    regardless of the size of the support team.
+
+    Returns:
+        List[Dict[str, Any]]: One dict per staff profile with `id`,
+        `username` and `email`, ordered by username.
+    """
+
+    def _load_staff_roster() -> List[Dict[str, Any]]:
+        return [
+            {'id': profile_id, 'username': username, 'email': email}
+            for profile_id, username, email in (
+                Profile.objects
+                .filter(role=UserRole.STAFF, user__is_active=True)
+                .order_by('user__username')
+                .values_list('id', 'user__username', 'user__email')
+            )
+        ]
+
+    return cache_get_or_compute(
+        key=versioned_cache_key(namespace=STAFF_ROSTER_CACHE_NAMESPACE, key="all"),
+        compute=_load_staff_roster,
+        timeout=settings.STAFF_ROSTER_CACHE_TIMEOUT,
+    )
@@ -0,0 +1,37 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from ticketing_system.core.cache import bump_cache_version
+from ticketing_system.users.models import Profile
+from ticketing_system.users.selectors import STAFF_ROSTER_CACHE_NAMESPACE
+
+
+User = get_user_model()
+
+# User fields shown in, or affecting, the staff roster.
+STAFF_ROSTER_USER_FIELDS = {'email', 'username', 'is_active'}
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_staff_roster_on_profile_change(sender, **kwargs) -> None:
+
+    """
+    Invalidates the cached staff roster when any profile is saved or deleted.
+    """
+
+    bump_cache_version(namespace=STAFF_ROSTER_CACHE_NAMESPACE)
+
+
+@receiver(post_save, sender=User)
+def invalidate_staff_roster_on_user_change(sender, update_fields=None, **kwargs) -> None:
+
+    """
+    Invalidates the cached staff roster when a user's email, username or
+    active flag may have changed. Partial saves of other fields (e.g.
+    `last_login` on login) are ignored.
+    """
+
+    if update_fields is None or STAFF_ROSTER_USER_FIELDS.intersection(update_fields):
+        bump_cache_version(namespace=STAFF_ROSTER_CACHE_NAMESPACE)